@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+"""Shared cache of Anatomy, roots and entities per project.
+
+Building an `Anatomy` queries the server, so constructing one for each
+loaded representation is slow when loading hundreds of them. The cache
+keeps a bounded number of Anatomy objects keyed by project name and the
+project entity's update time, so an updated project gets a new Anatomy.
+
+Project, folder and task entities fetched for the current context are
+only cached for `ENTITY_TTL` seconds, so edits on the server, e.g. of the
+frame range or fps, are picked up quickly while a burst of lookups still
+queries the server only once. Everything is cleared on project or task
+change, see `ayon_houdini.api.pipeline.on_task_changed`.
+
+"""
+import time
+import threading
+from collections import OrderedDict
+
+import ayon_api
+from ayon_core.pipeline import Anatomy
+
+
+# Maximum number of cached items per cache
+MAX_SIZE = 16
+
+# Seconds after which cached entities are fetched again from the server
+ENTITY_TTL = 10.0
+
+_lock = threading.RLock()
+_anatomies = OrderedDict()
+_entities = OrderedDict()
+
+
+def _get_cached(cache, key, factory, ttl=None):
+    with _lock:
+        if key in cache:
+            value, cached_time = cache[key]
+            if ttl is None or time.time() - cached_time < ttl:
+                cache.move_to_end(key)
+                return value
+            del cache[key]
+
+        value = factory()
+        if value is None:
+            # Do not cache missing entities
+            return value
+        cache[key] = (value, time.time())
+        while len(cache) > MAX_SIZE:
+            cache.popitem(last=False)
+        return value
+
+
+def get_project_entity(project_name):
+    """Return the project entity, cached for `ENTITY_TTL` seconds."""
+    return _get_cached(
+        _entities,
+        ("project", project_name),
+        lambda: ayon_api.get_project(project_name),
+        ttl=ENTITY_TTL
+    )
+
+
+def get_folder_entity(project_name, folder_path):
+    """Return the folder entity by path, cached for `ENTITY_TTL` seconds."""
+    return _get_cached(
+        _entities,
+        ("folder", project_name, folder_path),
+        lambda: ayon_api.get_folder_by_path(project_name, folder_path),
+        ttl=ENTITY_TTL
+    )
+
+
+def get_task_entity(project_name, folder_id, task_name):
+    """Return the task entity by folder id and name, cached shortly."""
+    return _get_cached(
+        _entities,
+        ("task", project_name, folder_id, task_name),
+        lambda: ayon_api.get_task_by_name(
+            project_name, folder_id, task_name),
+        ttl=ENTITY_TTL
+    )
+
+
+def get_anatomy(project_name, project_entity=None):
+    """Return the cached Anatomy of a project.
+
+    Arguments:
+        project_name (str): Project name.
+        project_entity (Optional[dict[str, Any]]): Project entity, e.g. from
+            a representation context. Its update time is used to detect
+            changes of the project. When not provided the project entity
+            is fetched, at most every `ENTITY_TTL` seconds.
+
+    Returns:
+        Anatomy: The project anatomy.
+
+    """
+    if project_entity is None:
+        project_entity = get_project_entity(project_name)
+
+    key = (project_name, project_entity.get("updatedAt"))
+    return _get_cached(
+        _anatomies,
+        key,
+        lambda: Anatomy(project_name, project_entity=project_entity)
+    )
+
+
+def get_roots(project_name, project_entity=None):
+    """Return the cached Anatomy roots of a project."""
+    return get_anatomy(project_name, project_entity).roots
+
+
+def clear():
+    """Clear all cached Anatomy objects and entities."""
+    with _lock:
+        _anatomies.clear()
+        _entities.clear()
@@ -0,0 +1,658 @@
+# -*- coding: utf-8 -*-
+"""Gather the files referenced by a scene and write them to archives.
+
+Gathering collects the file references of the scene and the HDA libraries
+in use, expands frame sequences and UDIM tiles and stats all files with
+one `os.scandir` call per folder in a thread pool. Files are deduplicated
+by their normalized path and by device and inode, so hardlinked and
+symlinked copies are archived only once:
+
+    >>> result = gather_files(exclude_nodes=[archive_node])
+    >>> print(result.get_report())
+    >>> write_archives(result.files, "/archive/show", "show")
+
+Archives are zip files of at most `chunk_size` bytes that are compressed
+in parallel. A manifest next to the archives records the files of every
+finished archive, so an interrupted archive resumes with the files that
+were not archived yet.
+
+"""
+import os
+import re
+import json
+import time
+import logging
+import zipfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import attr
+import hou
+
+from .file_references import FileReferenceIndex
+
+
+log = logging.getLogger(__name__)
+
+GB = 1024 ** 3
+
+FILE_TYPES = {
+    "abc": {".abc"},
+    "usd": {".usd", ".usda", ".usdc", ".usdz"},
+    "geo": {
+        ".bgeo", ".geo", ".sc", ".vdb", ".obj", ".fbx", ".ply", ".rs",
+        ".ass", ".bphys", ".sim", ".simdata", ".hclassic"
+    },
+    "img": {
+        ".exr", ".jpg", ".jpeg", ".png", ".tif", ".tiff", ".tx", ".rat",
+        ".hdr", ".tga", ".tex", ".pic", ".dpx", ".cin"
+    },
+    "hda": {".hda", ".otl", ".hdanc", ".hdalc", ".otlnc", ".otllc"},
+}
+
+# Already compressed formats are stored without compressing them again
+STORED_EXTENSIONS = {
+    ".sc", ".gz", ".zip", ".usdz", ".jpg", ".jpeg", ".png", ".exr",
+    ".tx", ".rat", ".mp4", ".mov", ".abc", ".vdb", ".hdanc", ".hdalc"
+}
+
+# Frame and UDIM tokens of unexpanded paths, `$FPS` or `$FEND` are not
+# frame tokens
+SEQUENCE_REGEX = re.compile(
+    r"\$\{?(?:F\d*|FF|T|SF)\}?(?![A-Za-z0-9_])"
+    r"|<UDIM>|<udim>|%\(UDIM\)d|\$\{?UDIM\}?(?![A-Za-z0-9_])"
+)
+SEQUENCE_TOKEN = "AYONSEQUENCETOKEN"
+
+
+@attr.s
+class ArchiveFile(object):
+    """Data class for a gathered file."""
+    path: str = attr.ib()
+    size: int = attr.ib()
+    mtime: float = attr.ib()
+    file_type: str = attr.ib()
+    parms = attr.ib(factory=list)   # parm paths referencing the file
+
+
+@attr.s
+class GatherResult(object):
+    """Data class for the files gathered from a scene."""
+    files = attr.ib(factory=list)       # List[ArchiveFile]
+    missing = attr.ib(factory=dict)     # path -> parm paths
+    duplicates: int = attr.ib(default=0)
+    seconds: float = attr.ib(default=0.0)
+
+    def get_total_size(self):
+        return sum(archive_file.size for archive_file in self.files)
+
+    def get_summary(self):
+        """Return file count and size per file type."""
+        summary = {}
+        for archive_file in self.files:
+            data = summary.setdefault(
+                archive_file.file_type, {"count": 0, "size": 0})
+            data["count"] += 1
+            data["size"] += archive_file.size
+        return summary
+
+    def get_report(self, largest=10):
+        """Return a readable summary of the gathered files."""
+        lines = ["{} files, {} ({} duplicates skipped) in {:.1f}s".format(
+            len(self.files), format_size(self.get_total_size()),
+            self.duplicates, self.seconds
+        )]
+        for file_type, data in sorted(self.get_summary().items()):
+            lines.append("  {}: {} files, {}".format(
+                file_type, data["count"], format_size(data["size"])))
+        if self.missing:
+            lines.append("{} missing files:".format(len(self.missing)))
+            for path in sorted(self.missing)[:largest]:
+                lines.append("  {}".format(path))
+            if len(self.missing) > largest:
+                lines.append("  ...")
+        if self.files:
+            lines.append("Largest files:")
+            for archive_file in sorted(
+                self.files, key=lambda f: f.size, reverse=True
+            )[:largest]:
+                lines.append("  {}  {}".format(
+                    format_size(archive_file.size), archive_file.path))
+        return "\n".join(lines)
+
+
+def format_size(size):
+    for unit in ("B", "KB", "MB", "GB", "TB"):
+        if size < 1024.0:
+            return "{:.2f} {}".format(size, unit)
+        size /= 1024.0
+    return "{:.2f} PB".format(size)
+
+
+def get_file_type(path):
+    """Return the file type of a path by its extension."""
+    ext = os.path.splitext(path)[1].lower()
+    for file_type, extensions in FILE_TYPES.items():
+        if ext in extensions:
+            return file_type
+    return "misc"
+
+
+def _get_key(path):
+    return os.path.normcase(os.path.normpath(path))
+
+
+def _get_sequence_pattern(unexpanded):
+    """Return a regex of the file names of a frame or UDIM sequence.
+
+    Returns:
+        Optional[Tuple[str, re.Pattern]]: The folder and the file name
+            pattern, None if the path is not a sequence.
+
+    """
+    if not unexpanded or not SEQUENCE_REGEX.search(unexpanded):
+        return None
+    path = hou.text.expandString(
+        SEQUENCE_REGEX.sub(SEQUENCE_TOKEN, unexpanded))
+    if SEQUENCE_TOKEN not in path:
+        return None
+    folder, filename = os.path.split(path)
+    if SEQUENCE_TOKEN in folder or "`" in filename:
+        return None
+    pattern = re.escape(filename).replace(SEQUENCE_TOKEN, r"-?\d+")
+    return folder, re.compile(pattern + "$")
+
+
+def _get_hda_libraries():
+    """Return the HDA libraries with definitions used in the scene."""
+    hfs = _get_key(hou.text.expandString("$HFS"))
+    libraries = []
+    for path in hou.hda.loadedFiles():
+        if path == "Embedded" or _get_key(path).startswith(hfs):
+            continue
+        if any(
+            definition.nodeType().instances()
+            for definition in hou.hda.definitionsInFile(path)
+        ):
+            libraries.append(path)
+    return libraries
+
+
+def _scan_folder(folder, names, patterns):
+    """Stat the files of a folder matching names or sequence patterns.
+
+    Returns:
+        List[Tuple[str, os.stat_result]]: The matching files.
+
+    """
+    found = []
+    try:
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                if entry.name not in names and not any(
+                    pattern.match(entry.name) for pattern in patterns
+                ):
+                    continue
+                try:
+                    if entry.is_file():
+                        found.append((entry.path, entry.stat()))
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    return found
+
+
+def _scan_tree(root):
+    """Stat all files below a folder."""
+    found = []
+    folders = [root]
+    while folders:
+        folder = folders.pop()
+        try:
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir():
+                            folders.append(entry.path)
+                        elif entry.is_file():
+                            found.append((entry.path, entry.stat()))
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    return found
+
+
+def gather_files(
+    file_types=None,
+    ignore_sequences=False,
+    ignored_extensions=None,
+    ignore_attributes=True,
+    exclude_nodes=None,
+    extra_files=None,
+    extra_folders=None,
+    threads=16
+):
+    """Gather the files referenced by the scene.
+
+    Arguments:
+        file_types (Optional[Iterable[str]]): File types to include, see
+            `FILE_TYPES` and "misc" for others. All types by default.
+        ignore_sequences (bool): Only gather the current frame of frame
+            and UDIM sequences.
+        ignored_extensions (Optional[Iterable[str]]): Extensions to skip,
+            e.g. [".ifd"].
+        ignore_attributes (bool): Skip paths with `@attrib` references.
+        exclude_nodes (Optional[Iterable[hou.Node]]): Skip file parms of
+            these nodes and their children.
+        extra_files (Optional[Iterable[str]]): Additional files.
+        extra_folders (Optional[Iterable[str]]): Additional folders to
+            gather all files from.
+        threads (int): Number of scanning threads.
+
+    Returns:
+        GatherResult: The gathered files.
+
+    """
+    start = time.time()
+    file_types = set(file_types) if file_types is not None else None
+    ignored_extensions = {
+        ext.lower() if ext.startswith(".") else "." + ext.lower()
+        for ext in ignored_extensions or []
+    }
+    excluded = tuple(
+        node.path() + "/" for node in exclude_nodes or [])
+
+    def _is_included(path):
+        if os.path.splitext(path)[1].lower() in ignored_extensions:
+            return False
+        return file_types is None or get_file_type(path) in file_types
+
+    # Folder -> file names and sequence patterns to look for
+    folders = {}
+    parms_by_path = {}
+    parms_by_pattern = []
+
+    def _add_path(path, parm_path=None):
+        if not path or not _is_included(path):
+            return
+        folder, name = os.path.split(os.path.normpath(path))
+        folders.setdefault(folder, (set(), []))[0].add(name)
+        if parm_path:
+            parms_by_path.setdefault(_get_key(path), []).append(parm_path)
+
+    for reference in FileReferenceIndex().query():
+        parm_path = reference.parm.path()
+        # The file reference is relative to $HIP, evaluate the parm to get
+        # the path on disk
+        try:
+            path = reference.parm.evalAsString()
+        except hou.Error:
+            path = hou.text.expandString(reference.expanded)
+        if (
+            not path
+            or path.startswith("op:")
+            or (parm_path + "/").startswith(excluded)
+            or (ignore_attributes and "@" in (reference.expanded or ""))
+        ):
+            continue
+        sequence = None
+        if not ignore_sequences:
+            sequence = _get_sequence_pattern(reference.unexpanded)
+        if sequence and _is_included(reference.unexpanded):
+            folder, pattern = sequence
+            folders.setdefault(
+                os.path.normpath(folder), (set(), []))[1].append(pattern)
+            parms_by_pattern.append((pattern, parm_path))
+        _add_path(path, parm_path)
+
+    if file_types is None or "hda" in file_types:
+        for path in _get_hda_libraries():
+            _add_path(path)
+    for path in extra_files or []:
+        _add_path(path)
+
+    with ThreadPoolExecutor(max_workers=max(1, threads)) as executor:
+        scans = [
+            executor.submit(_scan_folder, folder, names, patterns)
+            for folder, (names, patterns) in folders.items()
+        ]
+        scans.extend(
+            executor.submit(_scan_tree, folder)
+            for folder in extra_folders or []
+        )
+        stats = [item for scan in scans for item in scan.result()]
+
+    result = GatherResult()
+    matched_parms = set()
+    seen_paths = set()
+    seen_inodes = set()
+    for path, stat in stats:
+        key = _get_key(path)
+        inode = (stat.st_dev, stat.st_ino)
+        if key in seen_paths or (stat.st_ino and inode in seen_inodes):
+            result.duplicates += 1
+            continue
+        if not _is_included(path):
+            continue
+        seen_paths.add(key)
+        if stat.st_ino:
+            seen_inodes.add(inode)
+
+        parms = list(parms_by_path.get(key, []))
+        name = os.path.basename(path)
+        for pattern, parm_path in parms_by_pattern:
+            if pattern.match(name):
+                matched_parms.add(parm_path)
+                if parm_path not in parms:
+                    parms.append(parm_path)
+        result.files.append(ArchiveFile(
+            path=path,
+            size=stat.st_size,
+            mtime=stat.st_mtime,
+            file_type=get_file_type(path),
+            parms=parms
+        ))
+
+    # The current frame of a sequence may be missing while other frames
+    # were found
+    for key, parms in parms_by_path.items():
+        if key not in seen_paths and not matched_parms.issuperset(parms):
+            result.missing[key] = parms
+
+    result.seconds = time.time() - start
+    return result
+
+
+def write_report(result, path, note=None):
+    """Write the gathered files and the summary to a JSON report.
+
+    Arguments:
+        result (GatherResult): The gathered files.
+        path (str): The report file path.
+        note (Optional[str]): A note to include in the report.
+
+    """
+    report = {
+        "hip": hou.hipFile.path(),
+        "time": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "total_size": result.get_total_size(),
+        "summary": result.get_summary(),
+        "files": [attr.asdict(archive_file) for archive_file in result.files],
+        "missing": result.missing,
+    }
+    if note:
+        report["note"] = note
+    folder = os.path.dirname(path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(report, f, indent=1)
+
+
+def get_chunks(files, chunk_size):
+    """Split files into chunks of at most `chunk_size` bytes.
+
+    Files larger than the chunk size get a chunk of their own.
+    """
+    chunks = []
+    chunk = []
+    size = 0
+    for archive_file in files:
+        if chunk and size + archive_file.size > chunk_size:
+            chunks.append(chunk)
+            chunk = []
+            size = 0
+        chunk.append(archive_file)
+        size += archive_file.size
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+def _get_arcname(path):
+    """Return the path inside the archive, the absolute path without drive.
+    """
+    return os.path.splitdrive(path)[1].replace("\\", "/").lstrip("/")
+
+
+class ArchiveCancelled(Exception):
+    """Raised when writing the archives is cancelled."""
+
+
+def _write_archive(path, files, cancel=None):
+    tmp_path = path + ".tmp"
+    try:
+        _write_zip(tmp_path, files, cancel)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    os.replace(tmp_path, path)
+
+
+def _write_zip(path, files, cancel=None):
+    with zipfile.ZipFile(
+        path, "w", compression=zipfile.ZIP_DEFLATED, allowZip64=True
+    ) as archive:
+        for archive_file in files:
+            if cancel is not None and cancel.is_set():
+                raise ArchiveCancelled("Archiving was cancelled.")
+            ext = os.path.splitext(archive_file.path)[1].lower()
+            compress_type = (
+                zipfile.ZIP_STORED if ext in STORED_EXTENSIONS
+                else zipfile.ZIP_DEFLATED
+            )
+            archive.write(
+                archive_file.path,
+                _get_arcname(archive_file.path),
+                compress_type=compress_type
+            )
+
+
+def read_manifest(path):
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (IOError, OSError, ValueError):
+        return {"chunks": {}}
+
+
+def _write_manifest(path, manifest):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f, indent=1)
+    os.replace(tmp_path, path)
+
+
+def _get_last_index(manifest, name):
+    """Return the highest archive index listed in the manifest."""
+    pattern = re.compile(r"^{}_(\d+)\.zip$".format(re.escape(name)))
+    indices = [0]
+    for archive_name in manifest["chunks"]:
+        match = pattern.match(archive_name)
+        if match:
+            indices.append(int(match.group(1)))
+    return max(indices)
+
+
+def write_archives(
+    files,
+    destination,
+    name,
+    chunk_size=4 * GB,
+    threads=4,
+    progress=None,
+    cancel=None
+):
+    """Write files into chunked zip archives in parallel.
+
+    Files already archived according to the manifest of a previous run,
+    with the same size and modification time, are skipped.
+
+    Arguments:
+        files (List[ArchiveFile]): The files to archive.
+        destination (str): Folder to write the archives and manifest to.
+        name (str): Name prefix of the archives.
+        chunk_size (int): Maximum size of an archive in bytes.
+        threads (int): Number of archives compressed in parallel.
+        progress (Optional[Callable[[int, int], None]]): Called with the
+            finished and total archive count after each archive.
+        cancel (Optional[threading.Event]): Stops writing the archives when
+            set. It is checked before each file is added to an archive.
+
+    Returns:
+        List[str]: The archives written in this run.
+
+    Raises:
+        ArchiveCancelled: When `cancel` was set before all archives were
+            written. Finished archives are kept in the manifest.
+
+    """
+    os.makedirs(destination, exist_ok=True)
+    manifest_path = os.path.join(
+        destination, "{}_manifest.json".format(name))
+    manifest = read_manifest(manifest_path)
+
+    archived = {
+        _get_key(item["path"]): (item["size"], item["mtime"])
+        for chunk in manifest["chunks"].values()
+        for item in chunk["files"]
+    }
+    remaining = [
+        archive_file for archive_file in files
+        if archived.get(_get_key(archive_file.path))
+        != (archive_file.size, archive_file.mtime)
+    ]
+    if len(remaining) != len(files):
+        log.info("Resuming archive, %d of %d files already archived.",
+                 len(files) - len(remaining), len(files))
+
+    # Archives of previous runs may have finished out of order, number the
+    # new archives after the highest index so none of them is overwritten
+    index = _get_last_index(manifest, name)
+    jobs = {}
+    for chunk in get_chunks(remaining, chunk_size):
+        while True:
+            index += 1
+            archive_name = "{}_{:04d}.zip".format(name, index)
+            if (
+                archive_name not in manifest["chunks"]
+                and not os.path.exists(
+                    os.path.join(destination, archive_name))
+            ):
+                break
+        jobs[archive_name] = chunk
+
+    written = []
+    with ThreadPoolExecutor(max_workers=max(1, threads)) as executor:
+        futures = {
+            executor.submit(
+                _write_archive,
+                os.path.join(destination, archive_name),
+                chunk,
+                cancel
+            ): archive_name
+            for archive_name, chunk in jobs.items()
+        }
+        try:
+            for future in as_completed(futures):
+                archive_name = futures[future]
+                future.result()
+                manifest["chunks"][archive_name] = {
+                    "files": [
+                        {
+                            "path": archive_file.path,
+                            "arcname": _get_arcname(archive_file.path),
+                            "size": archive_file.size,
+                            "mtime": archive_file.mtime
+                        }
+                        for archive_file in jobs[archive_name]
+                    ]
+                }
+                _write_manifest(manifest_path, manifest)
+                written.append(archive_name)
+                if progress is not None:
+                    progress(len(written), len(jobs))
+        except BaseException:
+            # Do not start the remaining archives, e.g. when interrupted
+            for future in futures:
+                future.cancel()
+            raise
+
+    return written
+
+
+class ArchiveWriter(object):
+    """Write archives with `write_archives` in a background thread.
+
+    The callbacks are called from the background thread, use
+    `hdefereval.executeDeferred` to update the UI from them.
+
+    Arguments:
+        files (List[ArchiveFile]): The files to archive.
+        destination (str): Folder to write the archives and manifest to.
+        name (str): Name prefix of the archives.
+        chunk_size (int): Maximum size of an archive in bytes.
+        threads (int): Number of archives compressed in parallel.
+        progress (Optional[Callable[[int, int], None]]): Called with the
+            finished and total archive count after each archive.
+        callback (Optional[Callable[[ArchiveWriter], None]]): Called when
+            writing finished, failed or was cancelled.
+
+    """
+
+    def __init__(
+        self,
+        files,
+        destination,
+        name,
+        chunk_size=4 * GB,
+        threads=4,
+        progress=None,
+        callback=None
+    ):
+        self.files = files
+        self.destination = destination
+        self.name = name
+        self.chunk_size = chunk_size
+        self.threads = threads
+        self.progress = progress
+        self.callback = callback
+
+        self.written = []
+        self.error = None
+        self.cancelled = False
+        self._cancel = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def cancel(self):
+        """Stop writing, archives being written are discarded."""
+        self._cancel.set()
+
+    def is_running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def _run(self):
+        try:
+            self.written = write_archives(
+                self.files,
+                self.destination,
+                self.name,
+                chunk_size=self.chunk_size,
+                threads=self.threads,
+                progress=self.progress,
+                cancel=self._cancel
+            )
+        except ArchiveCancelled:
+            self.cancelled = True
+        except Exception as exc:
+            log.error("Failed to write archives.", exc_info=True)
+            self.error = exc
+        if self.callback is not None:
+            self.callback(self)
@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""Estimate cook time and output size of caches from sampled frames.
+
+A few frames of the output SOP of a cache instance are cooked locally to
+measure the cook time and the size of the geometry per frame:
+
+    >>> samples = sample_output_node(sop_node, frames=[1001, 1050, 1100])
+    >>> estimate = plan_chunk_size(samples, frame_count=100, farm_slots=20)
+    >>> estimate["chunk_size"]
+
+Simulations cook all frames before a sampled frame, so their sampled cook
+times are not per frame. Use `is_simulation` to skip them.
+
+"""
+import math
+import time
+import logging
+
+import attr
+import hou
+
+from .validation_cache import get_upstream_nodes
+
+
+log = logging.getLogger(__name__)
+
+# Node types, without namespace and version, that simulate over time
+SIMULATION_NODE_TYPES = {
+    "dopnet", "dopimport", "dopimportfield", "dopimportrecords", "popnet",
+    "dopio",
+}
+
+
+@attr.s
+class FrameSample(object):
+    """Data class for the measurement of a single sampled frame."""
+    frame: float = attr.ib()
+    seconds: float = attr.ib()      # cook time
+    size: int = attr.ib()           # geometry size in bytes as `.bgeo`
+
+
+def get_sample_frames(frame_start, frame_end, step=1, count=3):
+    """Return up to `count` frames evenly spread over the frame range."""
+    frames = list(range(int(frame_start), int(frame_end) + 1, int(step) or 1))
+    if len(frames) <= count:
+        return frames
+    if count <= 1:
+        return frames[:1]
+    last = len(frames) - 1
+    indices = sorted({
+        int(round(index * last / float(count - 1)))
+        for index in range(count)
+    })
+    return [frames[index] for index in indices]
+
+
+def is_simulation(node):
+    """Return whether a node depends on a simulation.
+
+    Looks for DOP networks, DOP imports and solvers, e.g. `solver` or
+    `vellumsolver`, upstream of the node.
+    """
+    for upstream_node in get_upstream_nodes(node):
+        node_type = upstream_node.type()
+        if node_type.category().name() == "Dop":
+            return True
+        type_name = node_type.nameComponents()[2]
+        if type_name in SIMULATION_NODE_TYPES or "solver" in type_name:
+            return True
+    return False
+
+
+def sample_output_node(node, frames):
+    """Cook the node at the frames and measure cook time and output size.
+
+    The node is force cooked so cached results do not hide its cook time.
+    The size is that of the geometry saved as uncompressed `.bgeo`.
+
+    Arguments:
+        node (hou.SopNode): The output node of the cache.
+        frames (List[float]): Frames to sample.
+
+    Returns:
+        List[FrameSample]: The measurement per frame.
+
+    """
+    samples = []
+    for frame in frames:
+        start = time.perf_counter()
+        node.cook(force=True, frame_range=(frame, frame))
+        seconds = time.perf_counter() - start
+
+        size = 0
+        geometry = node.geometryAtFrame(frame)
+        if geometry is not None:
+            try:
+                size = len(geometry.data())
+            except hou.OperationFailed:
+                log.debug("Unable to get geometry size of %s at frame %s",
+                          node.path(), frame)
+        samples.append(FrameSample(frame, seconds, size))
+    return samples
+
+
+def plan_chunk_size(samples,
+                    frame_count,
+                    farm_slots,
+                    target_task_seconds=600.0,
+                    min_task_seconds=60.0):
+    """Return the chunk size that spreads the frames over the farm slots.
+
+    Tasks are at most `target_task_seconds` long and use up to all farm
+    slots, but are not shorter than `min_task_seconds` to limit the task
+    startup overhead.
+
+    Arguments:
+        samples (List[FrameSample]): Sampled frames.
+        frame_count (int): Number of frames to cache.
+        farm_slots (int): Farm slots available for the job.
+        target_task_seconds (float): Maximum wanted task duration.
+        min_task_seconds (float): Minimum wanted task duration.
+
+    Returns:
+        dict: The estimate with `chunk_size`, `tasks`, `task_seconds`,
+            `frame_seconds`, `frame_size` and `total_size`.
+
+    """
+    frame_count = max(1, int(frame_count))
+    frame_seconds = sum(s.seconds for s in samples) / max(1, len(samples))
+    frame_size = sum(s.size for s in samples) / max(1, len(samples))
+
+    if frame_seconds > 0:
+        by_duration = int(target_task_seconds / frame_seconds)
+        by_overhead = int(math.ceil(min_task_seconds / frame_seconds))
+    else:
+        by_duration = by_overhead = frame_count
+    by_slots = int(math.ceil(frame_count / float(max(1, farm_slots))))
+
+    chunk_size = max(min(by_duration, by_slots), by_overhead, 1)
+    chunk_size = min(chunk_size, frame_count)
+    tasks = int(math.ceil(frame_count / float(chunk_size)))
+    return {
+        "chunk_size": chunk_size,
+        "tasks": tasks,
+        "task_seconds": chunk_size * frame_seconds,
+        "frame_seconds": frame_seconds,
+        "frame_size": int(frame_size),
+        "total_size": int(frame_size * frame_count),
+        "frames": frame_count,
+        "sampled_frames": [s.frame for s in samples]
+    }
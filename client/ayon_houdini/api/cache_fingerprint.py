@@ -0,0 +1,250 @@
+# -*- coding: utf-8 -*-
+"""Fingerprint cached frames to reuse them when nothing changed upstream.
+
+The fingerprint of a frame combines the state of the upstream SOP network
+of a cache node with the frame number and the modification times of the
+files read by the network at that frame:
+
+    - raw parm values, so expressions are compared by their expression
+    - node types, inputs and bypass flags
+    - version and modification time of the HDA definitions
+    - modification times of the files referenced by file parms
+
+The fingerprints and cook times of written frames are stored in a sidecar
+file next to the cached frames. Frames whose file exists and whose stored
+fingerprint matches the current one are reused instead of cooked again:
+
+    >>> fingerprint = NetworkFingerprint(cache_node, output_parm)
+    >>> result = get_reusable_frames(fingerprint, output_parm, frames)
+    >>> render_frames(rop_node, fingerprint, output_parm, result.stale)
+
+"""
+import os
+import json
+import time
+import hashlib
+import logging
+
+import attr
+import hou
+
+from .validation_cache import (
+    get_definition_state,
+    get_file_parms,
+    get_mtime,
+    get_raw_parm_values,
+    get_upstream_nodes,
+)
+
+
+log = logging.getLogger(__name__)
+
+SIDECAR_NAME = ".ayon_fingerprints.json"
+
+
+@attr.s
+class FrameReuse(object):
+    """Data class for the frames of a cache that can be reused."""
+    reused = attr.ib(factory=list)      # frames to reuse
+    stale = attr.ib(factory=list)       # frames to cook
+    seconds: float = attr.ib(default=0.0)  # cook time of the reused frames
+
+    def get_report(self):
+        return (
+            "Reused {} of {} frames, skipped {:.2f} compute hours."
+            " Cooking {} frames.".format(
+                len(self.reused), len(self.reused) + len(self.stale),
+                self.seconds / 3600.0, len(self.stale)
+            )
+        )
+
+
+class NetworkFingerprint(object):
+    """Fingerprint of the upstream network of a cache node per frame.
+
+    The frame independent state of the network is hashed once, per frame
+    only the frame number and the modification times of the input files
+    are added.
+
+    Arguments:
+        node (hou.Node): The cache node.
+        output_parm (hou.Parm): The output file parm of the cache node, it
+            is excluded from the input files.
+        ignored_parms (Optional[Iterable[str]]): Parms of the cache node
+            that do not change its output, e.g. the publish comment.
+
+    """
+
+    def __init__(self, node, output_parm=None, ignored_parms=None):
+        self.node = node
+        self.file_parms = []
+
+        excluded = {node.path()}
+        if output_parm is not None:
+            excluded.add(output_parm.node().path())
+
+        ignored_parms = set(ignored_parms or [])
+        data = [
+            node.type().nameWithCategory(),
+            get_definition_state(node),
+            [
+                value for value in get_raw_parm_values(node)
+                if value[0] not in ignored_parms
+            ],
+        ]
+        upstream = []
+        for input_node in node.inputs():
+            if input_node is not None:
+                upstream.extend(get_upstream_nodes(input_node))
+        for upstream_node in upstream:
+            if upstream_node.path() in excluded:
+                continue
+            data.append((
+                upstream_node.path(),
+                upstream_node.type().nameWithCategory(),
+                get_definition_state(upstream_node),
+                upstream_node.isBypassed()
+                if hasattr(upstream_node, "isBypassed") else None,
+                [n.path() if n else None for n in upstream_node.inputs()],
+                get_raw_parm_values(upstream_node)
+            ))
+            self.file_parms.extend(get_file_parms(upstream_node))
+
+        self._hash = hashlib.sha1(repr(data).encode("utf-8"))
+
+    def get(self, frame):
+        """Return the fingerprint of a frame."""
+        frame_hash = self._hash.copy()
+        files = []
+        for parm in self.file_parms:
+            try:
+                path = parm.evalAtFrame(frame)
+            except hou.Error:
+                continue
+            if path:
+                files.append((path, get_mtime(path)))
+        frame_hash.update(repr((frame, files)).encode("utf-8"))
+        return frame_hash.hexdigest()
+
+
+def _get_sidecar_path(path):
+    return os.path.join(os.path.dirname(path), SIDECAR_NAME)
+
+
+def read_sidecar(path):
+    """Return the stored frame data of the folder of a cached file."""
+    try:
+        with open(_get_sidecar_path(path), "r") as f:
+            return json.load(f)
+    except (IOError, OSError, ValueError):
+        return {}
+
+
+def write_sidecar(path, frames_data):
+    """Merge frame data into the sidecar of the folder of a cached file."""
+    sidecar_path = _get_sidecar_path(path)
+    data = read_sidecar(path)
+    data.update(frames_data)
+    tmp_path = "{}.{}.tmp".format(sidecar_path, os.getpid())
+    with open(tmp_path, "w") as f:
+        json.dump(data, f, indent=1)
+    os.replace(tmp_path, sidecar_path)
+
+
+def get_reusable_frames(fingerprint, output_parm, frames):
+    """Return which frames of a cache can be reused.
+
+    Arguments:
+        fingerprint (NetworkFingerprint): Fingerprint of the cache node.
+        output_parm (hou.Parm): The output file parm.
+        frames (List[float]): The frames to cache.
+
+    Returns:
+        FrameReuse: The reused and stale frames.
+
+    """
+    result = FrameReuse()
+    sidecars = {}
+    for frame in frames:
+        path = output_parm.evalAtFrame(frame)
+        folder = os.path.dirname(path)
+        if folder not in sidecars:
+            sidecars[folder] = read_sidecar(path)
+        stored = sidecars[folder].get(os.path.basename(path))
+        if (
+            stored
+            and stored["fingerprint"] == fingerprint.get(frame)
+            and os.path.isfile(path)
+            and os.path.getsize(path) == stored["size"]
+        ):
+            result.reused.append(frame)
+            result.seconds += stored["seconds"]
+        else:
+            result.stale.append(frame)
+    return result
+
+
+def record_frames(fingerprint, output_parm, frames, seconds):
+    """Store the fingerprints of written frames next to the files.
+
+    Arguments:
+        fingerprint (NetworkFingerprint): Fingerprint of the cache node.
+        output_parm (hou.Parm): The output file parm.
+        frames (List[float]): The written frames.
+        seconds (float): Cook time of all the frames.
+
+    """
+    if not frames:
+        return
+    frame_seconds = seconds / len(frames)
+    by_folder = {}
+    for frame in frames:
+        path = output_parm.evalAtFrame(frame)
+        if not os.path.isfile(path):
+            continue
+        by_folder.setdefault(os.path.dirname(path), (path, {}))[1][
+            os.path.basename(path)] = {
+                "fingerprint": fingerprint.get(frame),
+                "seconds": frame_seconds,
+                "size": os.path.getsize(path),
+                "time": time.time()
+            }
+    for path, frames_data in by_folder.values():
+        write_sidecar(path, frames_data)
+
+
+def get_frame_runs(frames, step=1):
+    """Group frames into contiguous (start, end) runs."""
+    runs = []
+    for frame in frames:
+        if runs and abs(frame - runs[-1][1] - step) < 1e-6:
+            runs[-1][1] = frame
+        else:
+            runs.append([frame, frame])
+    return [tuple(run) for run in runs]
+
+
+def render_frames(rop_node, fingerprint, output_parm, frames, step=1):
+    """Render frames of a ROP in contiguous runs and record fingerprints.
+
+    Arguments:
+        rop_node (hou.RopNode): The ROP that writes the cache.
+        fingerprint (NetworkFingerprint): Fingerprint of the cache node.
+        output_parm (hou.Parm): The output file parm.
+        frames (List[float]): Frames to render.
+        step (float): Frame step.
+
+    Returns:
+        float: The total render duration in seconds.
+
+    """
+    total = 0.0
+    for start, end in get_frame_runs(frames, step):
+        begin = time.perf_counter()
+        rop_node.render(frame_range=(start, end, step),
+                        output_progress=True)
+        seconds = time.perf_counter() - begin
+        total += seconds
+        run = [frame for frame in frames if start <= frame <= end]
+        record_frames(fingerprint, output_parm, run, seconds)
+    return total
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+"""Checksum manifests of published representation files.
+
+Every file of a representation is hashed with a fast non-cryptographic
+hash in a thread pool. The hash releases the GIL on large buffers, so
+files are hashed in parallel:
+
+    >>> manifest = build_manifest(get_representation_paths(repre))
+    >>> manifest["files"]["hero.1001.bgeo.sc"]
+    {'size': 1048576, 'hash': '8f3c...'}
+
+`xxhash` is used when available, otherwise CRC32 from `zlib`. The manifest
+stores the algorithm so manifests made with different algorithms are never
+compared.
+
+"""
+import os
+import zlib
+import logging
+import statistics
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+
+log = logging.getLogger(__name__)
+
+BUFFER_SIZE = 8 * 1024 * 1024
+ALGORITHM = "xxh3_64" if xxhash is not None else "crc32"
+
+# Frames smaller than this ratio of the median frame size are flagged as
+# possibly truncated
+TRUNCATED_RATIO = 0.1
+
+
+def hash_file(path):
+    """Return the size and hash of a file.
+
+    The file is read into a single reused buffer to avoid allocating a new
+    bytes object for every chunk.
+
+    Returns:
+        Tuple[int, str]: The size in bytes and the hex digest.
+
+    """
+    buffer = bytearray(BUFFER_SIZE)
+    view = memoryview(buffer)
+    size = 0
+    if xxhash is not None:
+        hasher = xxhash.xxh3_64()
+    else:
+        crc = 0
+    with open(path, "rb", buffering=0) as f:
+        while True:
+            count = f.readinto(buffer)
+            if not count:
+                break
+            size += count
+            if xxhash is not None:
+                hasher.update(view[:count])
+            else:
+                crc = zlib.crc32(view[:count], crc)
+    if xxhash is not None:
+        return size, hasher.hexdigest()
+    return size, "{:08x}".format(crc)
+
+
+def get_representation_paths(representation):
+    """Return the full paths of the files of a representation."""
+    files = representation["files"]
+    if isinstance(files, str):
+        files = [files]
+    staging_dir = representation.get("stagingDir", "")
+    return [os.path.join(staging_dir, filename) for filename in files]
+
+
+def build_manifest(paths, threads=8):
+    """Hash all files in a thread pool.
+
+    Arguments:
+        paths (List[str]): The files to hash.
+        threads (int): Number of hashing threads.
+
+    Returns:
+        dict: Manifest with `algorithm` and `files` by file name, each with
+            `size` and `hash`.
+
+    """
+    with ThreadPoolExecutor(max_workers=max(1, threads)) as executor:
+        results = list(executor.map(hash_file, paths))
+    return {
+        "algorithm": ALGORITHM,
+        "files": {
+            os.path.basename(path): {"size": size, "hash": digest}
+            for path, (size, digest) in zip(paths, results)
+        }
+    }
+
+
+def get_suspect_files(manifest):
+    """Return zero-byte files and possibly truncated frames.
+
+    Returns:
+        Tuple[List[str], List[str]]: Empty and possibly truncated files.
+
+    """
+    files = manifest["files"]
+    empty = sorted(name for name, data in files.items() if not data["size"])
+    truncated = []
+    sizes = [data["size"] for data in files.values() if data["size"]]
+    if len(sizes) > 2:
+        minimum = statistics.median(sizes) * TRUNCATED_RATIO
+        truncated = sorted(
+            name for name, data in files.items()
+            if data["size"] and data["size"] < minimum
+        )
+    return empty, truncated
+
+
+def get_unchanged_files(manifest, previous_manifest):
+    """Return the files identical to those of a previous manifest."""
+    if (
+        not previous_manifest
+        or previous_manifest.get("algorithm") != manifest["algorithm"]
+    ):
+        return []
+    previous_files = previous_manifest.get("files", {})
+    return sorted(
+        name for name, data in manifest["files"].items()
+        if previous_files.get(name) == data
+    )
@@ -1,3 +1,6 @@
+import os
+import logging
+import threading
 from typing import List
 
 import attr
@@ -9,6 +12,9 @@ from ayon_core.pipeline.colorspace import (
 )
 
 
+log = logging.getLogger(__name__)
+
+
 @attr.s
 class LayerMetadata(object):
     """Data class for Render Layer metadata."""
@@ -37,6 +43,106 @@ class ARenderProduct(object):
         self.layer_data = LayerMetadata(products=products)
 
 
+class OCIOConfigCache(object):
+    """Process-wide cache of parsed OCIO configs.
+
+    Parsing an OCIO config, e.g. ACES, is slow and the same config is
+    queried many times per publish. Each config is parsed once and keyed by
+    its path and modification time so an edited config is parsed again.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._configs = {}
+        self._display_view_colorspaces = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _get_key(config_path):
+        config_path = os.path.normpath(config_path)
+        try:
+            mtime = os.path.getmtime(config_path)
+        except OSError:
+            mtime = None
+        return config_path, mtime
+
+    def get_config_data(self, config_path):
+        """Return the parsed config data.
+
+        Returns:
+            dict[str, Any]: Data with `roles`, `colorspaces`,
+                `displays_views` and `looks` as returned by
+                `get_ocio_config_colorspaces`.
+
+        """
+        key = self._get_key(config_path)
+        with self._lock:
+            data = self._configs.get(key)
+            if data is not None:
+                self.hits += 1
+                return data
+
+            self.misses += 1
+            log.debug("Parsing OCIO config: %s", config_path)
+            data = get_ocio_config_colorspaces(config_path)
+            self._configs[key] = data
+            return data
+
+    def get_roles(self, config_path):
+        return self.get_config_data(config_path)["roles"]
+
+    def get_role_colorspace(self, config_path, role):
+        """Return the colorspace name of a role, e.g. 'scene_linear'."""
+        return self.get_roles(config_path).get(role, {}).get("colorspace")
+
+    def get_colorspace_names(self, config_path):
+        return list(self.get_config_data(config_path)["colorspaces"])
+
+    def get_displays_views(self, config_path):
+        return self.get_config_data(config_path)["displays_views"]
+
+    def get_display_view_colorspace(self, config_path, display, view):
+        """Return the colorspace name of a (display, view) pair."""
+        key = self._get_key(config_path) + (display, view)
+        with self._lock:
+            if key in self._display_view_colorspaces:
+                self.hits += 1
+                return self._display_view_colorspaces[key]
+
+            self.misses += 1
+            colorspace = get_display_view_colorspace_name(
+                config_path=config_path,
+                display=display,
+                view=view
+            )
+            self._display_view_colorspaces[key] = colorspace
+            return colorspace
+
+    def get_stats(self):
+        """Return cache statistics."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "configs": len(self._configs)
+        }
+
+    def clear(self):
+        with self._lock:
+            self._configs.clear()
+            self._display_view_colorspaces.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_ocio_config_cache = OCIOConfigCache()
+
+
+def get_ocio_config_cache():
+    """Return the process-wide OCIO config cache."""
+    return _ocio_config_cache
+
+
 def get_scene_linear_colorspace():
     """Return colorspace name for Houdini's OCIO config scene linear role.
 
@@ -48,8 +154,8 @@ def get_scene_linear_colorspace():
             the OCIO config Houdini is currently set to.
     """
     ocio_config_path = hou.Color.ocio_configPath()
-    colorspaces = get_ocio_config_colorspaces(ocio_config_path)
-    return colorspaces["roles"].get("scene_linear", {}).get("colorspace")
+    return _ocio_config_cache.get_role_colorspace(
+        ocio_config_path, "scene_linear")
 
 
 def get_default_display_view_colorspace():
@@ -58,7 +164,7 @@ def get_default_display_view_colorspace():
     It's used for 'ociocolorspace' parm in OpenGL Node."""
 
     prefs = get_color_management_preferences()
-    return get_display_view_colorspace_name(
+    return _ocio_config_cache.get_display_view_colorspace(
         config_path=prefs["config"],
         display=prefs["display"],
         view=prefs["view"]
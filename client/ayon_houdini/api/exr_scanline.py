@@ -0,0 +1,311 @@
+# -*- coding: utf-8 -*-
+"""Convert tiled EXR renders to scanline EXRs for review tools.
+
+Tiled EXRs, including tiled multipart EXRs, crash some review tools like
+Nuke and RV. Frames are converted to copies in a staging folder with
+`oiiotool` processes that run in parallel, keeping all parts, the metadata
+and the compression of the source frame. The tiled source frames are kept,
+e.g. to append to or denoise them later:
+
+    >>> oiiotool = find_oiiotool()
+    >>> result = convert_to_scanline(paths, oiiotool, staging_dir)
+    >>> print(result.get_report())
+    >>> publish_paths = [result.paths[path] for path in paths]
+
+The layout of a frame is read from its EXR header, so frames that are
+already scanline are skipped without starting a process. When any frame
+is converted, the skipped frames are linked into the staging folder too, so
+the whole sequence is in one folder.
+
+"""
+import os
+import time
+import shutil
+import struct
+import logging
+import threading
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+import attr
+
+
+log = logging.getLogger(__name__)
+
+MAGIC = 20000630
+TILED_FLAG = 0x200
+NON_IMAGE_FLAG = 0x800
+MULTIPART_FLAG = 0x1000
+
+COMPRESSION_NAMES = [
+    "none", "rle", "zips", "zip", "piz", "pxr24", "b44", "b44a", "dwaa",
+    "dwab"
+]
+
+# Header attributes needed to decide on and run the conversion
+HEADER_ATTRIBUTES = {"type", "tiles", "compression", "dwaCompressionLevel"}
+
+
+@attr.s
+class ExrLayout(object):
+    """Data class for the layout of an EXR file."""
+    tiled: bool = attr.ib(default=False)
+    multipart: bool = attr.ib(default=False)
+    deep: bool = attr.ib(default=False)
+    compression = attr.ib(default=None)     # e.g. "zips" or "dwaa:45"
+
+
+@attr.s
+class ScanlineResult(object):
+    """Data class for the result of converting frames to scanline."""
+    converted = attr.ib(factory=list)
+    # source path -> path to publish, the scanline copy when converted
+    paths = attr.ib(factory=dict)
+    skipped = attr.ib(factory=list)     # already scanline or deep frames
+    failed = attr.ib(factory=dict)      # path -> error message
+    size: int = attr.ib(default=0)      # bytes of the converted frames
+    seconds: float = attr.ib(default=0.0)
+
+    def get_report(self):
+        seconds = max(self.seconds, 1e-6)
+        return (
+            "Converted {} of {} frames to scanline ({} already scanline, "
+            "{} failed) in {:.1f}s: {:.1f} frames/s, {:.1f} MB/s.".format(
+                len(self.converted),
+                len(self.converted) + len(self.skipped) + len(self.failed),
+                len(self.skipped), len(self.failed), self.seconds,
+                len(self.converted) / seconds,
+                self.size / seconds / 1024 ** 2
+            )
+        )
+
+
+def _read_string(f):
+    data = bytearray()
+    while True:
+        char = f.read(1)
+        if not char:
+            raise ValueError("Unexpected end of EXR header")
+        if char == b"\0":
+            return data.decode("ascii", "replace")
+        data += char
+        if len(data) > 255:
+            raise ValueError("Invalid EXR header attribute name")
+
+
+def _read_headers(f, multipart):
+    """Return the needed attributes of the headers of all parts."""
+    headers = []
+    while True:
+        header = {}
+        count = 0
+        while True:
+            name = _read_string(f)
+            if not name:
+                break
+            count += 1
+            _read_string(f)     # attribute type
+            size, = struct.unpack("<i", f.read(4))
+            value = f.read(size)
+            if name in HEADER_ATTRIBUTES:
+                header[name] = value
+        # An empty header ends the headers of a multipart file
+        if not count:
+            break
+        headers.append(header)
+        if not multipart:
+            break
+    return headers
+
+
+def get_exr_layout(path):
+    """Return the layout of an EXR file from its header.
+
+    Returns:
+        Optional[ExrLayout]: The layout, None if the file is not an EXR.
+
+    """
+    with open(path, "rb") as f:
+        data = f.read(8)
+        if len(data) != 8:
+            return None
+        magic, version = struct.unpack("<ii", data)
+        if magic != MAGIC:
+            return None
+        multipart = bool(version & MULTIPART_FLAG)
+        headers = _read_headers(f, multipart)
+
+    layout = ExrLayout(
+        tiled=bool(version & TILED_FLAG),
+        multipart=multipart,
+        deep=bool(version & NON_IMAGE_FLAG)
+    )
+    for header in headers:
+        part_type = header.get("type", b"").rstrip(b"\0")
+        if "tiles" in header or part_type in (b"tiledimage", b"deeptile"):
+            layout.tiled = True
+        if part_type.startswith(b"deep"):
+            layout.deep = True
+
+    if headers and "compression" in headers[0]:
+        index = headers[0]["compression"][0]
+        if index < len(COMPRESSION_NAMES):
+            layout.compression = COMPRESSION_NAMES[index]
+        level = headers[0].get("dwaCompressionLevel")
+        if layout.compression in ("dwaa", "dwab") and level:
+            layout.compression += ":{:g}".format(
+                struct.unpack("<f", level)[0])
+    return layout
+
+
+def find_oiiotool():
+    """Return the arguments to run `oiiotool`, None if not available.
+
+    Looks for `oiiotool` on the PATH, the OpenImageIO tools shipped with
+    AYON and `hoiiotool` of the Houdini installation.
+    """
+    path = shutil.which("oiiotool")
+    if path:
+        return [path]
+
+    try:
+        from ayon_core.lib import get_oiio_tool_args
+        return get_oiio_tool_args("oiiotool")
+    except Exception:
+        log.debug("Unable to find AYON oiiotool.", exc_info=True)
+
+    path = shutil.which("hoiiotool")
+    if path:
+        return [path]
+    if os.getenv("HFS"):
+        for filename in ("hoiiotool", "hoiiotool.exe"):
+            path = os.path.join(os.environ["HFS"], "bin", filename)
+            if os.path.isfile(path):
+                return [path]
+    return None
+
+
+def _link(path, destination):
+    """Hardlink a file, copy it when linking is not possible."""
+    if os.path.exists(destination):
+        os.remove(destination)
+    try:
+        os.link(path, destination)
+    except OSError:
+        shutil.copy2(path, destination)
+
+
+def _convert(path, destination, layout, oiiotool, threads):
+    tmp_path = "{}.{}.{}.tmp.exr".format(
+        os.path.splitext(destination)[0], os.getpid(), threading.get_ident())
+    args = list(oiiotool) + [
+        "--threads", str(threads),
+        "--nosoftwareattrib",
+        "-a", path,
+        "--scanline",
+    ]
+    if layout.compression:
+        args += ["--compression", layout.compression]
+    args += ["-o", tmp_path]
+
+    kwargs = {}
+    if os.name == "nt":
+        kwargs["creationflags"] = subprocess.CREATE_NO_WINDOW
+    process = subprocess.run(
+        args,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        universal_newlines=True,
+        **kwargs
+    )
+    if process.returncode != 0 or not os.path.isfile(tmp_path):
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise RuntimeError(
+            process.stdout.strip()
+            or "Exit code {}".format(process.returncode)
+        )
+    os.replace(tmp_path, destination)
+    return os.path.getsize(destination)
+
+
+def convert_to_scanline(paths, oiiotool, staging_dir, workers=None):
+    """Write scanline copies of tiled EXR frames to a staging folder.
+
+    The source frames are not changed. When no frame is tiled nothing is
+    written and `result.paths` maps the frames to themselves.
+
+    Arguments:
+        paths (Iterable[str]): The EXR frames, their file names must be
+            unique.
+        oiiotool (List[str]): Arguments to run `oiiotool`.
+        staging_dir (str): Folder to write the scanline frames to.
+        workers (Optional[int]): Number of concurrent `oiiotool`
+            processes, defaults to half of the cores.
+
+    Returns:
+        ScanlineResult: The converted, skipped and failed frames.
+
+    """
+    start = time.time()
+    cpu_count = os.cpu_count() or 1
+    workers = workers or max(1, cpu_count // 2)
+    threads = max(1, cpu_count // workers)
+
+    result = ScanlineResult()
+    jobs = {}
+    for path in paths:
+        try:
+            layout = get_exr_layout(path)
+        except (IOError, OSError, ValueError, struct.error) as exc:
+            result.failed[path] = str(exc)
+            continue
+        # Deep frames are not reviewed and keep their layout
+        if layout is None or not layout.tiled or layout.deep:
+            result.skipped.append(path)
+        else:
+            jobs[path] = layout
+
+    if not jobs:
+        result.paths = {path: path for path in result.skipped}
+        result.seconds = time.time() - start
+        return result
+
+    os.makedirs(staging_dir, exist_ok=True)
+
+    def _get_destination(path):
+        return os.path.join(staging_dir, os.path.basename(path))
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            path: executor.submit(
+                _convert,
+                path,
+                _get_destination(path),
+                layout,
+                oiiotool,
+                threads
+            )
+            for path, layout in jobs.items()
+        }
+        links = {
+            path: executor.submit(_link, path, _get_destination(path))
+            for path in result.skipped
+        }
+        for path, future in futures.items():
+            try:
+                result.size += future.result()
+                result.converted.append(path)
+                result.paths[path] = _get_destination(path)
+            except Exception as exc:
+                result.failed[path] = str(exc)
+        for path, future in links.items():
+            try:
+                future.result()
+                result.paths[path] = _get_destination(path)
+            except Exception as exc:
+                result.skipped.remove(path)
+                result.failed[path] = str(exc)
+
+    result.seconds = time.time() - start
+    return result
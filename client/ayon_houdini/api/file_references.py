@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+"""Scene file-reference index shared by the path validators.
+
+Iterating `hou.fileReferences()` and calling `unexpandedString()` on each
+parm is slow on scenes with tens of thousands of file parms. The index is
+built once per publish and stored on the publish context so validators and
+their repairs can query it instead of rescanning the scene:
+
+    >>> index = get_file_reference_index(instance.context)
+    >>> for ref in index.query(node_types={"file"}, variables=["$HIP"]):
+    ...     print(ref.parm.path(), ref.unexpanded, ref.expanded)
+
+"""
+import re
+from typing import Dict, Iterable, List, Optional, Set
+
+import attr
+import hou
+
+
+CONTEXT_KEY = "houdiniFileReferenceIndex"
+
+# Match `$VAR` and `${VAR}`
+VARIABLE_REGEX = re.compile(r"\$\{?([A-Za-z_][A-Za-z0-9_]*)\}?")
+
+
+@attr.s
+class FileReference(object):
+    """Data class for a single file parm in the scene."""
+    parm = attr.ib()                        # hou.Parm
+    node_type: str = attr.ib()              # node type name, e.g. "file"
+    unexpanded: Optional[str] = attr.ib()   # None when parm has keyframes
+    # Value as reported by `hou.fileReferences()`, evaluated at the current
+    # frame and made relative to `$HIP` again, e.g. "$HIP/geo/box.bgeo".
+    # It is not fully expanded, use `parm.eval()` for the evaluated path.
+    expanded: str = attr.ib()
+    variables: Set[str] = attr.ib(factory=set)  # e.g. {"$HIP", "$F4"}
+
+
+def _get_unexpanded(parm):
+    if parm.keyframes():
+        # Calling `.unexpandedString()` fails if param has keyframes,
+        # these are e.g. present in `filecache` nodes.
+        return None
+    try:
+        return parm.unexpandedString()
+    except hou.OperationFailed:
+        return None
+
+
+def _get_variables(value):
+    if not value:
+        return set()
+    return {"$" + var for var in VARIABLE_REGEX.findall(value)}
+
+
+def _get_reference_value(parm):
+    """Return the value of a parm the way `hou.fileReferences()` does.
+
+    The value is evaluated at the current frame and made relative to
+    `$HIP` again.
+    """
+    value = parm.evalAsString()
+    hip = hou.text.expandString("$HIP").replace("\\", "/")
+    if hip and value.replace("\\", "/").startswith(hip + "/"):
+        value = "$HIP" + value[len(hip):]
+    return value
+
+
+class FileReferenceIndex(object):
+    """Index of all file parms in the scene by node type and variable."""
+
+    def __init__(self):
+        self._references: Dict[str, FileReference] = {}
+        self._by_node_type: Dict[str, List[str]] = {}
+        self.build()
+
+    def build(self):
+        """(Re)build the index from `hou.fileReferences()`."""
+        self._references.clear()
+        self._by_node_type.clear()
+        for parm, expanded in hou.fileReferences():
+            # it might return None for some reason
+            if not parm:
+                continue
+            self._add(parm, expanded)
+
+    def _add(self, parm, expanded):
+        unexpanded = _get_unexpanded(parm)
+        reference = FileReference(
+            parm=parm,
+            node_type=parm.node().type().name(),
+            unexpanded=unexpanded,
+            expanded=expanded,
+            variables=_get_variables(unexpanded)
+        )
+        path = parm.path()
+        if path not in self._references:
+            self._by_node_type.setdefault(
+                reference.node_type, []).append(path)
+        self._references[path] = reference
+        return reference
+
+    def update(self, parm):
+        """Refresh the entry of a parm, e.g. after it was repaired.
+
+        Arguments:
+            parm (hou.Parm): The file parm that changed.
+
+        Returns:
+            FileReference: The updated entry.
+
+        """
+        return self._add(parm, _get_reference_value(parm))
+
+    def get(self, parm):
+        """Return the entry for a parm or parm path if it is indexed.
+
+        Arguments:
+            parm (Union[hou.Parm, str]): The parm or its full path.
+
+        Returns:
+            Optional[FileReference]: The entry, if any.
+
+        """
+        if isinstance(parm, hou.Parm):
+            parm = parm.path()
+        return self._references.get(parm)
+
+    def query(self,
+              node_types: Optional[Iterable[str]] = None,
+              variables: Optional[Iterable[str]] = None
+              ) -> List[FileReference]:
+        """Return file references matching node types and variables.
+
+        Variables are matched against the unexpanded string the same way
+        the validators historically did, so `$HIP` also matches `$HIPNAME`.
+        References with an unknown unexpanded string (e.g. keyframed parms)
+        never match a variable query.
+
+        Arguments:
+            node_types (Optional[Iterable[str]]): Node type names to include.
+                When not provided all node types are included.
+            variables (Optional[Iterable[str]]): Include only references
+                whose unexpanded string contains any of these variables.
+
+        Returns:
+            List[FileReference]: The matching file references.
+
+        """
+        if node_types is None:
+            references = list(self._references.values())
+        else:
+            references = [
+                self._references[path]
+                for node_type in node_types
+                for path in self._by_node_type.get(node_type, [])
+            ]
+
+        if variables is not None:
+            variables = list(variables)
+            references = [
+                ref for ref in references
+                if ref.unexpanded
+                and any(var in ref.unexpanded for var in variables)
+            ]
+
+        return references
+
+
+def get_file_reference_index(context, rebuild=False):
+    """Return the file reference index for the publish context.
+
+    The index is built on first use and then shared for the whole publish.
+
+    Arguments:
+        context (pyblish.api.Context): The publish context.
+        rebuild (bool): Force rebuilding the index from the scene.
+
+    Returns:
+        FileReferenceIndex: The shared file reference index.
+
+    """
+    index = context.data.get(CONTEXT_KEY)
+    if index is None:
+        index = FileReferenceIndex()
+        context.data[CONTEXT_KEY] = index
+    elif rebuild:
+        index.build()
+    return index
@@ -8,9 +8,14 @@ from ayon_deadline.scripts import publish
 
 from ayon_core.lib import path_tools
 
+from ayon_houdini.api.flipbook_stream import FlipbookStreamEncoder
+
 
 log = logging.getLogger(__name__)
 
+# Keep every n-th frame as still when streaming to a movie
+STILLS_INTERVAL = 10
+
 
 class FlipbookDialog(QtWidgets.QDialog):
     def __init__(self, parent=None):
@@ -32,6 +37,20 @@ class FlipbookDialog(QtWidgets.QDialog):
         self.beautyPassOnly = QtWidgets.QCheckBox("Beauty Pass", self)
         self.useMotionblur = QtWidgets.QCheckBox("Motion Blur", self)
 
+        # streaming encode toggles
+        self.streamToMovie = QtWidgets.QCheckBox(
+            "Encode Movie While Flipbooking", self)
+        self.streamToMovie.setToolTip(
+            "Pipe the flipbook frames into a review movie as they are "
+            "written instead of writing the full image sequence to disk."
+        )
+        self.keepStills = QtWidgets.QCheckBox("Keep Sparse Stills", self)
+        self.keepStills.setToolTip(
+            "Keep every {}th frame as a still image, e.g. for "
+            "thumbnails.".format(STILLS_INTERVAL)
+        )
+        self.keepStills.setEnabled(False)
+
         # description widget
         self.descriptionLabel = QtWidgets.QLabel("Description")
         self.description = QtWidgets.QLineEdit()
@@ -116,6 +135,8 @@ class FlipbookDialog(QtWidgets.QDialog):
         groupLayout.addWidget(self.outputToMplay)
         groupLayout.addWidget(self.beautyPassOnly)
         groupLayout.addWidget(self.useMotionblur)
+        groupLayout.addWidget(self.streamToMovie)
+        groupLayout.addWidget(self.keepStills)
         groupLayout.addWidget(self.copyPathButton)
         self.optionsGroup.setLayout(groupLayout)
 
@@ -124,7 +145,7 @@ class FlipbookDialog(QtWidgets.QDialog):
         self.startButton = QtWidgets.QPushButton("Start Flipbook")
         self.publishButton = QtWidgets.QPushButton("Submit to Publish")
         self.publishButton.setEnabled(
-            os.path.exists(hou.expandString(output_path))
+            os.path.exists(hou.expandString(self.get_publish_path()))
         )
 
         # lower right button box
@@ -148,6 +169,8 @@ class FlipbookDialog(QtWidgets.QDialog):
         self.publishButton.clicked.connect(self.submit_to_publish)
         self.copyPathButton.clicked.connect(self.copy_path_to_clipboard)
         self.description.textChanged.connect(self.update_output_path)
+        self.streamToMovie.toggled.connect(self.update_output_path)
+        self.streamToMovie.toggled.connect(self.keepStills.setEnabled)
 
         # finally, set layout
         self.setLayout(layout)
@@ -156,7 +179,7 @@ class FlipbookDialog(QtWidgets.QDialog):
         self.close()
 
     def update_output_path(self):
-        output_path = self.get_output_path()
+        output_path = self.get_publish_path()
         self.outputLabel.setText(f"Flipbooking to: {output_path}")
         self.publishButton.setEnabled(
             os.path.exists(hou.expandString(output_path))
@@ -193,6 +216,22 @@ class FlipbookDialog(QtWidgets.QDialog):
 
         return path
 
+    def get_movie_path(self, expand=False):
+        description = self.description.text().replace(" ", "_")
+        path = "$HIP/flipbook/$HIPNAME/flipbook{}.mp4".format(
+            f"_{description}" if description else ""
+        )
+        if expand:
+            path = hou.expandString(path)
+
+        return path
+
+    def get_publish_path(self, expand=False):
+        """Return the movie path when streaming else the image sequence."""
+        if self.streamToMovie.isChecked():
+            return self.get_movie_path(expand=expand)
+        return self.get_output_path(expand=expand)
+
     def get_default_resolution(self):
         cam = self.scene_viewer.curViewport().camera()
         if not cam:  # Use the main render_cam if no viewport cam
@@ -229,6 +268,21 @@ class FlipbookDialog(QtWidgets.QDialog):
         if not os.path.exists(base_dir):
             os.makedirs(base_dir)
 
+        encoder = None
+        if self.streamToMovie.isChecked():
+            stills_path = None
+            if self.keepStills.isChecked():
+                # Expand only the folder so the frame token is kept
+                stills_path = os.path.join(
+                    base_dir, os.path.basename(outputPath))
+            encoder = FlipbookStreamEncoder(
+                self.get_movie_path(expand=True),
+                fps=hou.fps(),
+                stills_path=stills_path,
+                stills_interval=STILLS_INTERVAL
+            )
+            inputSettings["output"] = encoder.frame_pattern
+
         # retrieve full settings object
         settings = self.get_flipbook_settings(inputSettings)
 
@@ -240,21 +294,34 @@ class FlipbookDialog(QtWidgets.QDialog):
                 open_interrupt_dialog=True,
             ) as operation:
                 operation.updateLongProgress(0.25, "Starting Flipbook")
+                if encoder:
+                    encoder.start(inputSettings["frameRange"])
                 hou.SceneViewer.flipbook(self.scene_viewer, settings=settings)
+                if encoder:
+                    operation.updateLongProgress(0.9, "Finishing Encode")
+                    stats = encoder.finish()
+                    log.info(
+                        "Encode throughput: %.1f fps, %.1f MB/s",
+                        stats["fps"],
+                        stats["bytes"] / 1024.0 ** 2 / stats["seconds"]
+                        if stats["seconds"] else 0.0
+                    )
                 operation.updateLongProgress(1, "Flipbook successful")
                 # self.close_window()
 
         except Exception as e:
+            if encoder:
+                encoder.abort()
             log.error("Oops, something went wrong!")
             log.error(e)
             return
 
         self.publishButton.setEnabled(
-            os.path.exists(hou.expandString(outputPath))
+            os.path.exists(hou.expandString(self.get_publish_path()))
         )
 
     def submit_to_publish(self):
-        output_path = self.get_output_path(expand=True)
+        output_path = self.get_publish_path(expand=True)
         product_name = os.path.basename(output_path).split(".")[0]
         # Add task name suffix to product name
         product_name = f"{product_name}_{os.getenv('AYON_TASK_NAME')}"
@@ -284,7 +351,14 @@ class FlipbookDialog(QtWidgets.QDialog):
         comment, version = values
 
         publish_data = {"out_colorspace": "rec709"}
-        
+
+        # Publish the streamed movie as is, it's already the review
+        # so there is no image sequence to encode
+        if self.streamToMovie.isChecked():
+            representations = {"mp4": output_path}
+        else:
+            representations = {"jpg": output_path}
+
         if comment:
             publish_data["comment"] = comment
 
@@ -297,7 +371,7 @@ class FlipbookDialog(QtWidgets.QDialog):
             os.getenv("AYON_TASK_NAME"),
             "review",
             product_name,
-            {"jpg": output_path},
+            representations,
             publish_data=publish_data,
             overwrite_version=True if values[1] else False,
         )
@@ -317,7 +391,7 @@ class FlipbookDialog(QtWidgets.QDialog):
     # copyPathButton callback
     # copy the output path to the clipboard
     def copy_path_to_clipboard(self):
-        path = self.get_output_path(expand=True)
+        path = self.get_publish_path(expand=True)
         log.info("Copying path to clipboard: %s", path)
         QtGui.QGuiApplication.clipboard().setText(path)
 
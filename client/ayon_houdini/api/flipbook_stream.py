@@ -0,0 +1,270 @@
+"""Encode flipbook frames into a review movie while flipbooking.
+
+`hou.SceneViewer.flipbook` can only write frames to files. To avoid writing
+a full image sequence next to the workfile and reading it all back during
+publish, the flipbook writes each frame to a local temporary folder while a
+background thread streams every finished frame through a pipe into a local
+`ffmpeg` process and deletes it right after. Only a few frames are ever kept
+on disk and at most `max_buffered_frames` frames are held in memory.
+
+Example:
+    >>> encoder = FlipbookStreamEncoder("/path/to/review.mp4", fps=24)
+    >>> settings.output(encoder.frame_pattern)
+    >>> encoder.start((1001, 1100))
+    >>> scene_viewer.flipbook(settings=settings)
+    >>> stats = encoder.finish()
+
+"""
+import os
+import time
+import queue
+import shutil
+import logging
+import tempfile
+import threading
+import subprocess
+
+from ayon_core.lib import get_ffmpeg_tool_args
+
+
+log = logging.getLogger(__name__)
+
+
+class FlipbookStreamEncoder(object):
+    """Pipe flipbook frames into `ffmpeg` as they are written.
+
+    Arguments:
+        movie_path (str): Output movie path.
+        fps (float): Frame rate of the movie.
+        stills_path (Optional[str]): Path with `$F4` frame token to keep a
+            sparse still sequence at, e.g. for thumbnails. No stills are kept
+            when not provided.
+        stills_interval (int): Keep every n-th frame as still.
+        max_buffered_frames (int): Maximum number of frames held in memory
+            waiting to be encoded.
+
+    """
+
+    poll_interval = 0.05
+
+    def __init__(self,
+                 movie_path,
+                 fps,
+                 stills_path=None,
+                 stills_interval=10,
+                 max_buffered_frames=8):
+        self.movie_path = movie_path
+        self.fps = fps
+        self.stills_path = stills_path
+        self.stills_interval = max(1, stills_interval)
+
+        self._staging_dir = tempfile.mkdtemp(prefix="ayon_flipbook_")
+        self._queue = queue.Queue(maxsize=max(1, max_buffered_frames))
+        self._flipbook_done = threading.Event()
+        self._aborted = threading.Event()
+        self._threads = []
+        self._process = None
+        self._log_file = None
+        self._start_time = None
+        self._error = None
+
+        self.frames_encoded = 0
+        self.frames_missing = []
+        self.bytes_encoded = 0
+        self.stills = []
+
+    @property
+    def frame_pattern(self):
+        """Return the path the flipbook should write its frames to."""
+        return os.path.join(
+            self._staging_dir, "frame.$F4.jpg").replace("\\", "/")
+
+    def _get_frame_path(self, frame):
+        return os.path.join(
+            self._staging_dir, "frame.{:04d}.jpg".format(frame))
+
+    def _get_still_path(self, frame):
+        return self.stills_path.replace("$F4", "{:04d}".format(frame))
+
+    def start(self, frame_range):
+        """Start `ffmpeg` and the streaming threads.
+
+        Arguments:
+            frame_range (Tuple[int, int]): Inclusive frame range that will
+                be flipbooked.
+
+        """
+        movie_dir = os.path.dirname(self.movie_path)
+        if movie_dir and not os.path.exists(movie_dir):
+            os.makedirs(movie_dir)
+
+        args = get_ffmpeg_tool_args(
+            "ffmpeg",
+            "-y",
+            "-loglevel", "error",
+            "-f", "image2pipe",
+            "-framerate", str(self.fps),
+            "-c:v", "mjpeg",
+            "-i", "-",
+            # yuv420p requires even dimensions
+            "-vf", "pad=ceil(iw/2)*2:ceil(ih/2)*2",
+            "-c:v", "libx264",
+            "-pix_fmt", "yuv420p",
+            "-crf", "18",
+            self.movie_path
+        )
+        log.debug("Starting encoder: %s", " ".join(args))
+        # Write the output to a file, a pipe that is only read once ffmpeg
+        # exits would block it as soon as the pipe buffer is full
+        self._log_file = open(
+            os.path.join(self._staging_dir, "ffmpeg.log"), "w+b")
+        self._process = subprocess.Popen(
+            args,
+            stdin=subprocess.PIPE,
+            stdout=self._log_file,
+            stderr=subprocess.STDOUT
+        )
+        self._start_time = time.time()
+
+        self._threads = [
+            threading.Thread(
+                target=self._collect_frames, args=frame_range, daemon=True),
+            threading.Thread(target=self._encode_frames, daemon=True)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def _wait_for_frame(self, frame, last_frame):
+        """Wait until frame is fully written and return whether it exists.
+
+        A frame is considered complete once the next frame exists or the
+        flipbook has finished.
+        """
+        path = self._get_frame_path(frame)
+        next_path = self._get_frame_path(frame + 1)
+        while not self._aborted.is_set():
+            if self._flipbook_done.is_set():
+                return os.path.exists(path)
+            if frame < last_frame and os.path.exists(next_path):
+                return os.path.exists(path)
+            time.sleep(self.poll_interval)
+        return False
+
+    def _collect_frames(self, first_frame, last_frame):
+        try:
+            for frame in range(first_frame, last_frame + 1):
+                if not self._wait_for_frame(frame, last_frame):
+                    if self._aborted.is_set():
+                        break
+                    self.frames_missing.append(frame)
+                    continue
+
+                path = self._get_frame_path(frame)
+                if (
+                    self.stills_path
+                    and (frame - first_frame) % self.stills_interval == 0
+                ):
+                    still_path = self._get_still_path(frame)
+                    shutil.copyfile(path, still_path)
+                    self.stills.append(still_path)
+
+                with open(path, "rb") as stream:
+                    data = stream.read()
+                os.remove(path)
+
+                # Blocks while the encoder is behind, bounding memory usage
+                self._put(data)
+        except Exception as exc:
+            self._error = exc
+            self._aborted.set()
+        finally:
+            self._put(None)
+
+    def _put(self, data):
+        while not self._aborted.is_set():
+            try:
+                self._queue.put(data, timeout=self.poll_interval)
+                return
+            except queue.Full:
+                continue
+
+    def _encode_frames(self):
+        try:
+            while not self._aborted.is_set():
+                try:
+                    data = self._queue.get(timeout=self.poll_interval)
+                except queue.Empty:
+                    continue
+                if data is None:
+                    break
+                self._process.stdin.write(data)
+                self.frames_encoded += 1
+                self.bytes_encoded += len(data)
+        except Exception as exc:
+            self._error = exc
+            self._aborted.set()
+        finally:
+            self._process.stdin.close()
+
+    def finish(self):
+        """Wait for encoding to finish after the flipbook has completed.
+
+        Returns:
+            dict: Encode statistics with `frames`, `missing_frames`, `bytes`,
+                `seconds`, `fps` and `stills`.
+
+        Raises:
+            RuntimeError: When encoding failed.
+
+        """
+        self._flipbook_done.set()
+        for thread in self._threads:
+            thread.join()
+        self._process.wait()
+        elapsed = time.time() - self._start_time
+        self._log_file.seek(0)
+        output = self._log_file.read()
+        self._cleanup()
+
+        if self._error is not None:
+            raise RuntimeError(
+                "Streaming flipbook frames failed: {}".format(self._error))
+        if self._process.returncode != 0:
+            raise RuntimeError("ffmpeg failed to encode {}: {}".format(
+                self.movie_path, output.decode("utf-8", "replace")))
+
+        stats = {
+            "frames": self.frames_encoded,
+            "missing_frames": self.frames_missing,
+            "bytes": self.bytes_encoded,
+            "seconds": elapsed,
+            "fps": self.frames_encoded / elapsed if elapsed else 0.0,
+            "stills": self.stills
+        }
+        log.info(
+            "Encoded %d frames (%.1f MB) to %s in %.2fs (%.1f fps)",
+            stats["frames"], stats["bytes"] / 1024.0 ** 2, self.movie_path,
+            stats["seconds"], stats["fps"]
+        )
+        if self.frames_missing:
+            log.warning("Flipbook did not write frames: %s",
+                        self.frames_missing)
+        return stats
+
+    def abort(self):
+        """Stop encoding and remove the partial movie."""
+        self._aborted.set()
+        self._flipbook_done.set()
+        for thread in self._threads:
+            thread.join()
+        if self._process and self._process.poll() is None:
+            self._process.kill()
+            self._process.wait()
+        self._cleanup()
+        if os.path.exists(self.movie_path):
+            os.remove(self.movie_path)
+
+    def _cleanup(self):
+        if self._log_file is not None:
+            self._log_file.close()
+        shutil.rmtree(self._staging_dir, ignore_errors=True)
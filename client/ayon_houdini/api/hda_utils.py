@@ -27,6 +27,7 @@ from ayon_core.tools.utils import SimpleFoldersWidget
 from ayon_core.style import load_stylesheet
 
 from ayon_houdini.api import lib
+from ayon_houdini.api.thumbnail_cache import get_thumbnail_cache
 from .usd import get_ayon_entity_uri_from_representation_context
 
 from qtpy import QtCore, QtWidgets, QtGui
@@ -137,22 +138,37 @@ def update_info(node, context):
 
 
 def _get_thumbnail(project_name: str, version_id: str, thumbnail_dir: str):
-    folder = hou.text.expandString(thumbnail_dir)
-    path = os.path.join(folder, "{}_thumbnail.jpg".format(version_id))
-    expanded_path = hou.text.expandString(path)
-    if os.path.isfile(expanded_path):
-        return path
-
-    # Try and create a thumbnail cache file
-    data = ayon_api.get_thumbnail(project_name,
-                                  entity_type="version",
-                                  entity_id=version_id)
-    if data:
-        thumbnail_dir_expanded = hou.text.expandString(thumbnail_dir)
-        os.makedirs(thumbnail_dir_expanded, exist_ok=True)
-        with open(expanded_path, "wb") as f:
-            f.write(data.content)
-        return path
+    """Return the thumbnail path in the unexpanded `thumbnail_dir`.
+
+    The path is saved in the scene's network background images, keeping
+    variables like `$JOB` in it keeps it valid on other mounts and OS.
+    """
+    path = get_thumbnail_cache(thumbnail_dir).get(project_name, version_id)
+    if not path:
+        return None
+    return "{}/{}".format(
+        thumbnail_dir.rstrip("/\\"), os.path.basename(path))
+
+
+def prefetch_thumbnails(nodes_versions):
+    """Download the thumbnails of many load nodes at once.
+
+    Arguments:
+        nodes_versions (List[Tuple[hou.Node, str, str]]): The load node,
+            project name and version id to prefetch the thumbnail for.
+
+    """
+    by_cache = {}
+    for node, project_name, version_id in nodes_versions:
+        if not node.evalParm("show_thumbnail"):
+            continue
+        thumbnail_dir = node.evalParm("thumbnail_cache_dir")
+        by_cache.setdefault(
+            (thumbnail_dir, project_name), set()).add(version_id)
+
+    for (thumbnail_dir, project_name), version_ids in by_cache.items():
+        get_thumbnail_cache(thumbnail_dir).prefetch(
+            project_name, version_ids)
 
 
 def set_representation(node, representation_id: str):
@@ -198,9 +214,8 @@ def set_representation(node, representation_id: str):
 
     if node.evalParm("show_thumbnail"):
         # Update thumbnail
-        # TODO: Cache thumbnail path as well
         version_id = repre_entity["versionId"]
-        thumbnail_dir = node.evalParm("thumbnail_cache_dir")
+        thumbnail_dir = node.parm("thumbnail_cache_dir").unexpandedString()
         thumbnail_path = _get_thumbnail(
             project_name, version_id, thumbnail_dir
         )
@@ -400,46 +415,33 @@ def on_flag_changed(node, **kwargs):
 
     # Update node thumbnails brightness with the
     # bypass state of the node.
-    parent = node.parent()
-    images = lib.get_background_images(parent)
+    model = lib.get_background_images_model(node.parent())
+    brightness = 0.3 if node.isBypassed() else 1.0
+    images = [
+        image for image in model.get_node_images(node.path())
+        if image.brightness() != brightness
+    ]
     if not images:
         return
 
-    brightness = 0.3 if node.isBypassed() else 1.0
-    has_changes = False
-    node_path = node.path()
     for image in images:
-        if image.relativeToPath() == node_path:
-            image.setBrightness(brightness)
-            has_changes = True
-
-    if has_changes:
-        lib.set_background_images(parent, images)
+        image.setBrightness(brightness)
+    model.mark_dirty()
 
 
 def keep_background_images_linked(node, old_name):
     """Reconnect background images to node from old name.
 
      Used as callback on node name changes to keep thumbnails linked."""
-    from ayon_houdini.api.lib import (
-        get_background_images,
-        set_background_images
-    )
-
-    parent = node.parent()
-    images = get_background_images(parent)
+    model = lib.get_background_images_model(node.parent())
+    old_path = f"{node.parent().path()}/{old_name}"
+    images = model.get_node_images(old_path)
     if not images:
         return
 
-    changes = False
-    old_path = f"{node.parent().path()}/{old_name}"
     for image in images:
-        if image.relativeToPath() == old_path:
-            image.setRelativeToPath(node.path())
-            changes = True
-
-    if changes:
-        set_background_images(parent, images)
+        image.setRelativeToPath(node.path())
+    model.mark_dirty()
 
 
 class SelectFolderPathDialog(QtWidgets.QDialog):
@@ -8,12 +8,10 @@ import json
 from contextlib import contextmanager
 
 import six
-import ayon_api
 
 from ayon_core.lib import StringTemplate
 from ayon_core.settings import get_current_project_settings
 from ayon_core.pipeline import (
-    Anatomy,
     registered_host,
     get_current_context,
     get_current_host_name,
@@ -29,6 +27,8 @@ from ayon_core.tools.utils.host_tools import get_tool_by_name
 
 import hou
 
+from . import anatomy_cache, output_parameters
+
 
 self = sys.modules[__name__]
 self._parent = None
@@ -60,8 +60,6 @@ def get_export_parameter(node):
         hou.Parm
 
     """
-    node_type = node.type().description()
-
     # Ensures the proper Take is selected for each ROP to retrieve the correct
     # ifd
     try:
@@ -72,39 +70,15 @@ def get_export_parameter(node):
         # hou object doesn't always have the 'takes' attribute
         pass
 
-    if node_type == "Mantra" and node.parm("soho_outputmode").eval():
-        return node.parm("soho_diskfile")
-    elif node_type == "USD" or node_type == "USD Render ROP" or node_type == "USD Render":
-        return node.parm("lopoutput")
-    elif node_type == "Alfred":
-        return node.parm("alf_diskfile")
-    elif (node_type == "RenderMan" or node_type == "RenderMan RIS"):
-        pre_ris22 = node.parm("rib_outputmode") and \
-            node.parm("rib_outputmode").eval()
-        ris22 = node.parm("diskfile") and node.parm("diskfile").eval()
-        if pre_ris22 or ris22:
-            return node.parm("soho_diskfile")
-    elif node_type == "Redshift" and node.parm("RS_archive_enable").eval():
-        return node.parm("RS_archive_file")
-    elif node_type == "Wedge" and node.parm("driver").eval():
-        return get_export_parameter(node.node(node.parm("driver").eval()))
-    elif node_type == "Arnold":
-        return node.parm("ar_ass_file")
-    elif node_type == "Alembic" and node.parm("use_sop_path").eval():
-        return node.parm("sop_path")
-    elif node_type == "Shotgun Mantra" and node.parm("soho_outputmode").eval():
-        return node.parm("sgtk_soho_diskfile")
-    elif node_type == "Shotgun Alembic" and node.parm("use_sop_path").eval():
-        return node.parm("sop_path")
-    elif node.type().nameWithCategory() == "Driver/vray_renderer":
-        return node.parm("render_export_filepath")
-
-    raise TypeError("Node type '%s' not supported" % node_type)
+    return output_parameters.get_export_parameter(node)
 
 
 def get_output_parameter(node):
     """Return the render output parameter of the given node
 
+    Supported node types are defined in `output_parameters`, where custom
+    node types can be registered too.
+
     Example:
         root = hou.node("/obj")
         my_alembic_node = root.createNode("alembic")
@@ -118,74 +92,7 @@ def get_output_parameter(node):
         hou.Parm
 
     """
-    node_type = node.type().description()
-    category = node.type().category().name()
-
-    # Figure out which type of node is being rendered
-    if node_type in {"Geometry", "Filmbox FBX", "File Cache", "Labs File Cache"} or \
-            (node_type == "ROP Output Driver" and category == "Sop"):
-        return node.parm("sopoutput")
-    elif node_type == "USD" or node_type == "HuskStandalone":
-        return node.parm("lopoutput")
-    elif node_type == "USD Render ROP" or node_type == "USD Render":
-        return node.parm("outputimage")
-    elif node_type == "Composite":
-        return node.parm("copoutput")
-    elif node_type == "Channel":
-        return node.parm("chopoutput")
-    elif node_type == "Dynamics" or \
-            (node_type == "ROP Output Driver" and category == "Dop"):
-        return node.parm("dopoutput")
-    elif node_type == "Alfred":
-        return node.parm("alf_diskfile")
-    elif node_type == "RenderMan" or node_type == "RenderMan RIS":
-        return node.parm("ri_display")
-    elif node_type == "Redshift":
-        return node.parm("RS_returnmePrefix")
-    elif node_type == "Mantra":
-        return node.parm("vm_picture")
-    elif node_type == "Wedge":
-        driver_node = node.node(node.parm("driver").eval())
-        if driver_node:
-            return get_output_parameter(driver_node)
-    elif node_type == "Arnold":
-        return node.parm("ar_picture")
-    elif node_type == "Arnold Denoiser":
-        return node.parm("output")
-    elif node_type == "HQueue Simulation":
-        inner_node = node.node(node.parm("hq_driver").eval())
-        if inner_node:
-            return get_output_parameter(inner_node)
-    elif node_type == "ROP Alembic Output":
-        return node.parm("filename")
-    elif node_type == "Redshift":
-        return node.parm("RS_returnmePrefix")
-    elif node_type == "Alembic":
-        return node.parm("filename")
-    elif node_type == "Shotgun Mantra":
-        return node.parm("sgtk_vm_picture")
-    elif node_type == "Shotgun Alembic":
-        return node.parm("filename")
-    elif node_type == "Bake Texture":
-        return node.parm("vm_uvoutputpicture1")
-    elif node_type == "OpenGL":
-        return node.parm("picture")
-    elif node_type == "Octane":
-        return node.parm("HO_img_fileName")
-    elif node_type == "Fetch":
-        inner_node = node.node(node.parm("source").eval())
-        if inner_node:
-            try:
-                return get_output_parameter(inner_node)
-            except TypeError:
-                raise TypeError("Fetch source '%s' not supported" % inner_node)
-
-    elif node.type().nameWithCategory() == "Driver/vray_renderer":
-        return node.parm("SettingsOutput_img_file_path")
-    elif node_type == "File Cache":
-        return node.parm("sopoutput")
-
-    raise TypeError("Node type '%s' not supported" % node_type)
+    return output_parameters.get_output_parameter(node)
 
 
 def set_scene_fps(fps):
@@ -485,6 +392,16 @@ def parm_values(overrides):
                 parm.set(value)
 
 
+@contextmanager
+def update_mode_context(mode):
+    original = hou.updateModeSetting()
+    try:
+        hou.setUpdateMode(mode)
+        yield
+    finally:
+        hou.setUpdateMode(original)
+
+
 def reset_framerange(fps=True, frame_range=True):
     """Set frame range and FPS to current folder."""
 
@@ -850,16 +767,16 @@ def get_current_context_template_data_with_entity_attrs():
     task_name = context["task_name"]
     host_name = get_current_host_name()
 
-    project_entity = ayon_api.get_project(project_name)
-    anatomy = Anatomy(project_name, project_entity=project_entity)
-    folder_entity = ayon_api.get_folder_by_path(project_name, folder_path)
-    task_entity = ayon_api.get_task_by_name(
+    project_entity = anatomy_cache.get_project_entity(project_name)
+    anatomy = anatomy_cache.get_anatomy(project_name, project_entity)
+    folder_entity = anatomy_cache.get_folder_entity(project_name, folder_path)
+    task_entity = anatomy_cache.get_task_entity(
         project_name, folder_entity["id"], task_name
     )
 
-    # get context specific vars
-    folder_attributes = folder_entity["attrib"]
-    task_attributes = task_entity["attrib"]
+    # get context specific vars, copied to not alter the cached entities
+    folder_attributes = dict(folder_entity["attrib"])
+    task_attributes = dict(task_entity["attrib"])
 
     # compute `frameStartHandle` and `frameEndHandle`
     for attributes in [folder_attributes, task_attributes]:
@@ -1191,14 +1108,7 @@ def sceneview_snapshot(
     log.debug("A snapshot of sceneview has been saved to: {}".format(filepath))
 
 
-def get_background_images(node, raw=False):
-    """"Return background images defined inside node.
-
-    Similar to `nodegraphutils.saveBackgroundImages` but this method also
-    allows to retrieve the data as JSON encodable data instead of
-    `hou.NetworkImage` instances when using `raw=True`
-    """
-
+def _parse_background_images(data, raw=False):
     def _parse(image_data):
         image = hou.NetworkImage(image_data["path"],
                                  hou.BoundingRect(*image_data["rect"]))
@@ -1208,7 +1118,6 @@ def get_background_images(node, raw=False):
             image.setBrightness(image_data["brightness"])
         return image
 
-    data = node.userData("backgroundimages")
     if not data:
         return []
 
@@ -1222,12 +1131,20 @@ def get_background_images(node, raw=False):
     return images
 
 
-def set_background_images(node, images):
-    """Set hou.NetworkImage background images under given hou.Node
-
-    Similar to: `nodegraphutils.loadBackgroundImages`
+def get_background_images(node, raw=False):
+    """"Return background images defined inside node.
 
+    Similar to `nodegraphutils.saveBackgroundImages` but this method also
+    allows to retrieve the data as JSON encodable data instead of
+    `hou.NetworkImage` instances when using `raw=True`
     """
+    # Write pending changes of the background images model first
+    flush_background_images(node)
+    return _parse_background_images(node.userData("backgroundimages"), raw)
+
+
+def _write_background_images(node, images):
+    """Write background images to the node and return the written data."""
 
     def _serialize(image):
         """Return hou.NetworkImage as serialized dict"""
@@ -1260,8 +1177,134 @@ def set_background_images(node, images):
                        for image in images)
             data = json.dumps([_serialize(image) for image in images])
             node.setUserData("backgroundimages", data)
+            return data
         else:
             node.destroyUserData("backgroundimages", must_exist=False)
+            return None
+
+
+def set_background_images(node, images):
+    """Set hou.NetworkImage background images under given hou.Node
+
+    Similar to: `nodegraphutils.loadBackgroundImages`
+
+    """
+    # Any model of the node is outdated by the new images
+    _background_models.pop(node.sessionId(), None)
+    _write_background_images(node, images)
+
+
+class BackgroundImages(object):
+    """In-memory background images of a network with dirty tracking.
+
+    The `backgroundimages` user data of the network is parsed once and
+    changes are written back once per event loop tick in interactive
+    sessions, instead of parsing and writing the JSON for every node
+    thumbnail that changes. Get the model with
+    `get_background_images_model` and call `mark_dirty` after changes.
+
+    Arguments:
+        network (hou.Node): The network holding the background images.
+
+    """
+
+    def __init__(self, network):
+        self.network = network
+        self.data = network.userData("backgroundimages")
+        self.images = _parse_background_images(self.data)
+        self.dirty = False
+
+    def get_node_images(self, node_path):
+        """Return the images attached to a node path."""
+        return [
+            image for image in self.images
+            if image.relativeToPath() == node_path
+        ]
+
+    def mark_dirty(self):
+        """Schedule writing the images to the network."""
+        self.dirty = True
+        if hou.isUIAvailable():
+            _schedule_background_images_flush()
+        else:
+            self.flush()
+
+    def flush(self):
+        """Write the images to the network if they changed."""
+        if not self.dirty:
+            return
+        self.dirty = False
+        self.data = _write_background_images(self.network, self.images)
+
+
+_background_models = {}
+_background_flush_scheduled = False
+
+
+def get_background_images_model(network):
+    """Return the background images model of a network.
+
+    The model is parsed again when the background images of the network
+    were changed outside of the model.
+
+    Arguments:
+        network (hou.Node): The network holding the background images.
+
+    Returns:
+        BackgroundImages: The model of the network.
+
+    """
+    key = network.sessionId()
+    model = _background_models.get(key)
+    if model is None or (
+        not model.dirty
+        and model.data != network.userData("backgroundimages")
+    ):
+        model = BackgroundImages(network)
+        _background_models[key] = model
+    return model
+
+
+def _schedule_background_images_flush():
+    global _background_flush_scheduled
+    if _background_flush_scheduled:
+        return
+    import hdefereval
+    _background_flush_scheduled = True
+    hdefereval.executeDeferred(flush_background_images)
+
+
+def flush_background_images(network=None):
+    """Write pending background image changes of networks.
+
+    Arguments:
+        network (Optional[hou.Node]): Only flush this network, by default
+            all pending networks are flushed.
+
+    """
+    global _background_flush_scheduled
+    if network is not None:
+        model = _background_models.get(network.sessionId())
+        if model is not None:
+            model.flush()
+        return
+
+    _background_flush_scheduled = False
+    models = [model for model in _background_models.values() if model.dirty]
+    if not models:
+        return
+    with hou.undos.group("Edit Background Images"):
+        for model in models:
+            try:
+                model.flush()
+            except hou.ObjectWasDeleted:
+                pass
+    # Drop models of deleted networks
+    for key, model in list(_background_models.items()):
+        try:
+            model.network.path()
+        except hou.ObjectWasDeleted:
+            _background_models.pop(key)
 
 
 def set_node_thumbnail(node, image_path, rect=None):
@@ -1286,8 +1329,8 @@ def set_node_thumbnail(node, image_path, rect=None):
 
     """
 
-    parent = node.parent()
-    images = get_background_images(parent)
+    model = get_background_images_model(node.parent())
+    images = model.images
 
     node_path = node.path()
     # Find first existing image attached to node
@@ -1302,7 +1345,7 @@ def set_node_thumbnail(node, image_path, rect=None):
         # Remove image if it exists
         if image:
             images.remove(image)
-            set_background_images(parent, images)
+            model.mark_dirty()
         return
 
     if rect is None:
@@ -1324,7 +1367,7 @@ def set_node_thumbnail(node, image_path, rect=None):
         image.setRect(rect)
         image.setPath(image_path)
 
-    set_background_images(parent, images)
+    model.mark_dirty()
 
     return image
 
@@ -1334,13 +1377,15 @@ def remove_all_thumbnails(node):
 
     Removes all network background images that are linked to the given node.
     """
-    parent = node.parent()
-    images = get_background_images(parent)
+    model = get_background_images_model(node.parent())
     node_path = node.path()
     images = [
-        image for image in images if image.relativeToPath() != node_path
+        image for image in model.images
+        if image.relativeToPath() != node_path
     ]
-    set_background_images(parent, images)
+    if len(images) != len(model.images):
+        model.images = images
+        model.mark_dirty()
 
 
 def get_node_thumbnail(node, first_only=True):
@@ -1354,18 +1399,12 @@ def get_node_thumbnail(node, first_only=True):
             Connected network images
 
     """
-    parent = node.parent()
-    images = get_background_images(parent)
-    node_path = node.path()
-
-    def is_attached_to_node(image):
-        return image.relativeToPath() == node_path
-
-    attached_images = filter(is_attached_to_node, images)
+    model = get_background_images_model(node.parent())
+    attached_images = model.get_node_images(node.path())
 
     # Find first existing image attached to node
     if first_only:
-        return next(attached_images, None)
+        return next(iter(attached_images), None)
     else:
         return attached_images
 
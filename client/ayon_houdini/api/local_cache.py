@@ -0,0 +1,943 @@
+# -*- coding: utf-8 -*-
+"""Local disk mirror of published files, e.g. on a local SSD.
+
+Published files are copied once from the (network) publish path into a
+size-bounded local cache folder and used from there on later loads:
+
+    >>> cache = get_local_cache()
+    >>> local_path, hit = cache.fetch(published_path)
+
+A JSON manifest in the cache root maps each local copy back to its source
+path and stores its size, modification time and checksum. A copy is reused
+as long as size and modification time of the source are unchanged, every
+new copy is verified against the checksum of the source data. When the
+cache exceeds its maximum size the least recently used copies are removed.
+
+The cache root may be shared by several sessions. Manifest updates are
+serialized with a lock file and each session lists the copies it uses in a
+lease file in the `leases` folder, so other sessions never evict them. A
+session refreshes its lease in a background thread, leases that were not
+refreshed for `LEASE_TTL` seconds are of sessions that ended without
+removing them and are ignored.
+
+File parms of loaded caches can read through the cache, see
+`set_parm_path`. The local path is resolved once on load, update and scene
+open: the parm is set to the local copy when all its files are cached, else
+to the published path while the missing files are copied by background
+threads, switching to the local copy once they are done. The files of a
+parm set to its local copy are pinned, so no session evicts them. The
+published path is stored in the node's user data, so scenes opened in batch
+mode, e.g. on the farm, read the published files again. When local files of
+a parm are missing anyway, e.g. deleted by hand, the parm is set back to the
+published path on scene open or when the lease refresh notices it.
+
+The cache root and size are set in the `houdini/general/local_cache`
+project settings, the root can be overridden with the
+`AYON_HOUDINI_LOCAL_CACHE` environment variable.
+
+"""
+import os
+import re
+import json
+import time
+import atexit
+import shutil
+import hashlib
+import socket
+import logging
+import tempfile
+import threading
+import contextlib
+
+import hou
+
+from ayon_core.settings import get_current_project_settings
+
+
+log = logging.getLogger(__name__)
+
+MANIFEST_NAME = "manifest.json"
+CHUNK_SIZE = 4 * 1024 * 1024
+
+LEASES_FOLDER = "leases"
+
+# Minimum seconds between manifest writes of background fills
+MANIFEST_WRITE_INTERVAL = 2.0
+
+# Seconds after which the manifest lock of a crashed process is removed
+LOCK_TIMEOUT = 30.0
+
+# Seconds between lease refreshes and after which a lease is stale
+LEASE_INTERVAL = 60.0
+LEASE_TTL = 600.0
+
+# Local files used by this process, never evicted by any process
+_in_use = set()
+
+# Frame tokens of file parms, e.g. `$F`, `$F4` or `${F4}`
+FRAME_TOKEN_REGEX = re.compile(r"\$\{?F(\d*)\}?")
+
+# Node user data with the published path of a file parm read through the
+# cache, formatted with the parm name
+USER_DATA_KEY = "ayon_local_cache_{}"
+
+# Parm path -> published path of the parms set to their local copy
+_local_parms = {}
+
+
+def get_checksum(path):
+    """Return the sha256 checksum of a file."""
+    checksum = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            checksum.update(chunk)
+    return checksum.hexdigest()
+
+
+class LocalFileCache(object):
+    """Size-bounded local copy of source files with LRU eviction.
+
+    The cache may be shared by multiple processes, the manifest is re-read
+    when changed on disk and updated under a lock file. Files used by a
+    process are listed in its lease file and never evicted.
+
+    Arguments:
+        root (str): Cache folder.
+        max_size (int): Maximum size of all cached files in bytes.
+
+    """
+
+    def __init__(self, root, max_size):
+        self.root = os.path.normpath(root)
+        self.max_size = max_size
+        self.manifest_path = os.path.join(self.root, MANIFEST_NAME)
+        self.lock_path = self.manifest_path + ".lock"
+        self.lease_path = os.path.join(
+            self.root,
+            LEASES_FOLDER,
+            "{}_{}.json".format(socket.gethostname(), os.getpid())
+        )
+
+        self.hits = 0
+        self.misses = 0
+        self.bytes_copied = 0
+        self.bytes_served = 0
+        self.seconds_saved = 0.0
+
+        self._lock = threading.RLock()
+        self._manifest = {}
+        self._manifest_mtime = None
+        # Entries not yet written to the manifest file
+        self._unsaved = {}
+        self._last_write = 0.0
+        # Source paths with a validated local copy in this process
+        self._valid = {}
+        self._lease_thread = None
+        # Called from the lease thread with pinned files that are missing
+        self.missing_callback = None
+
+    def get_local_path(self, source):
+        """Return the path of the local copy of a source file."""
+        source = os.path.normpath(source)
+        folder = hashlib.sha1(
+            os.path.dirname(source).encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.root, folder, os.path.basename(source))
+
+    def get_source_path(self, path):
+        """Return the source path of a local copy, or the path itself."""
+        with self._lock:
+            entry = self._read_manifest().get(os.path.normpath(path))
+        return entry["source"] if entry else path
+
+    def is_cached(self, source):
+        """Return whether the source was validated or copied already."""
+        return os.path.normpath(source) in self._valid
+
+    def get_cached_path(self, source, count=True):
+        """Return the valid local copy of a source file without copying.
+
+        Arguments:
+            source (str): Path of the source file.
+            count (bool): Count the lookup as hit or miss in the cache
+                statistics.
+
+        Returns:
+            Optional[str]: The local path, None if not cached.
+
+        """
+        source = os.path.normpath(source)
+        with self._lock:
+            local_path = self._valid.get(source)
+            if local_path is None:
+                local_path = self._validate(source)
+            elif not os.path.exists(local_path):
+                # Evicted by another process
+                del self._valid[source]
+                local_path = None
+
+            if not count:
+                return local_path
+            if local_path is None:
+                self.misses += 1
+                return None
+            self._count_hit(local_path)
+            return local_path
+
+    def fetch(self, source, pin=True):
+        """Return the local copy of a source file, copying it when needed.
+
+        Arguments:
+            source (str): Path of the source file.
+            pin (bool): Never evict the file from this process.
+
+        Returns:
+            Tuple[str, bool]: The local path and whether it was a cache hit.
+
+        """
+        source = os.path.normpath(source)
+        with self._lock:
+            local_path = self._valid.get(source) or self._validate(source)
+            if local_path and os.path.exists(local_path):
+                # Background fills are not counted as lookups
+                if pin:
+                    self.pin([local_path])
+                    self._count_hit(local_path)
+                log.debug("Local cache hit: %s", source)
+                return local_path, True
+
+        # Copy outside of the lock, it can take a while
+        local_path = self.get_local_path(source)
+        source_stat = os.stat(source)
+        start = time.perf_counter()
+        checksum = self._copy(source, local_path)
+        read_seconds = time.perf_counter() - start
+        local_stat = os.stat(local_path)
+
+        with self._lock:
+            manifest = self._read_manifest()
+            entry = {
+                "source": source,
+                "size": source_stat.st_size,
+                "mtime": source_stat.st_mtime,
+                "local_mtime": local_stat.st_mtime,
+                "checksum": checksum,
+                "last_access": time.time(),
+                "read_seconds": read_seconds
+            }
+            manifest[local_path] = entry
+            self._unsaved[local_path] = entry
+            self._valid[source] = local_path
+            if pin:
+                self.pin([local_path])
+                self.misses += 1
+            self._write_manifest(force=pin)
+            self.bytes_copied += source_stat.st_size
+        log.debug("Local cache miss: %s, copied in %.2fs",
+                  source, read_seconds)
+        return local_path, False
+
+    def pin(self, local_paths):
+        """Never evict local files, also not from other processes.
+
+        The files are listed in the lease file of this process.
+        """
+        with self._lock:
+            new_paths = set(local_paths) - _in_use
+            if not new_paths:
+                return
+            _in_use.update(new_paths)
+            self._write_lease()
+            if self._lease_thread is None:
+                self._lease_thread = threading.Thread(
+                    target=self._refresh_lease, daemon=True)
+                self._lease_thread.start()
+                atexit.register(self._remove_lease)
+
+    def _write_lease(self):
+        root = self.root + os.sep
+        paths = sorted(path for path in _in_use if path.startswith(root))
+        os.makedirs(os.path.dirname(self.lease_path), exist_ok=True)
+        tmp_path = self.lease_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(paths, f)
+        os.replace(tmp_path, self.lease_path)
+
+    def _remove_lease(self):
+        with contextlib.suppress(OSError):
+            os.remove(self.lease_path)
+
+    def _refresh_lease(self):
+        while True:
+            time.sleep(LEASE_INTERVAL)
+            root = self.root + os.sep
+            try:
+                with self._lock:
+                    missing = [
+                        path for path in _in_use
+                        if path.startswith(root) and not os.path.exists(path)
+                    ]
+                    _in_use.difference_update(missing)
+                    if missing or not os.path.exists(self.lease_path):
+                        # Also when removed as stale, e.g. while the
+                        # machine slept
+                        self._write_lease()
+                    else:
+                        os.utime(self.lease_path)
+            except (IOError, OSError):
+                log.debug("Unable to refresh lease %s", self.lease_path,
+                          exc_info=True)
+                continue
+
+            if missing and self.missing_callback is not None:
+                log.warning("%d pinned files are missing from local cache "
+                            "%s", len(missing), self.root)
+                try:
+                    self.missing_callback(missing)
+                except Exception:
+                    log.warning("Local cache callback failed.", exc_info=True)
+
+    def _read_leases(self):
+        """Return the local files used by other processes."""
+        folder = os.path.dirname(self.lease_path)
+        try:
+            names = os.listdir(folder)
+        except OSError:
+            return set()
+
+        paths = set()
+        now = time.time()
+        for name in names:
+            path = os.path.join(folder, name)
+            if path == self.lease_path or not name.endswith(".json"):
+                continue
+            try:
+                if now - os.stat(path).st_mtime > LEASE_TTL:
+                    # The process ended without removing its lease
+                    os.remove(path)
+                    continue
+                with open(path, "r") as f:
+                    paths.update(json.load(f))
+            except (IOError, OSError, ValueError):
+                log.debug("Unable to read lease %s", path, exc_info=True)
+        return paths
+
+    def flush(self):
+        """Write pending manifest changes."""
+        with self._lock:
+            self._write_manifest(force=True)
+
+    def get_stats(self):
+        """Return the cache statistics of this process."""
+        with self._lock:
+            manifest = self._read_manifest()
+            lookups = self.hits + self.misses
+            return {
+                "root": self.root,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / float(lookups) if lookups else 0.0,
+                "bytes_copied": self.bytes_copied,
+                "bytes_served": self.bytes_served,
+                "seconds_saved": self.seconds_saved,
+                "files": len(manifest),
+                "size": sum(entry["size"] for entry in manifest.values()),
+                "max_size": self.max_size
+            }
+
+    def _count_hit(self, local_path):
+        entry = self._read_manifest().get(local_path, {})
+        self.hits += 1
+        self.bytes_served += entry.get("size", 0)
+        self.seconds_saved += entry.get("read_seconds", 0.0)
+
+    def _validate(self, source):
+        """Return the local copy of the source if it is up to date."""
+        local_path = self.get_local_path(source)
+        entry = self._read_manifest().get(local_path)
+        if not entry or entry["source"] != source:
+            return None
+        try:
+            source_stat = os.stat(source)
+            local_stat = os.stat(local_path)
+        except OSError:
+            return None
+        if (
+            entry["size"] != source_stat.st_size
+            or entry["mtime"] != source_stat.st_mtime
+            or local_stat.st_size != entry["size"]
+            or local_stat.st_mtime != entry["local_mtime"]
+        ):
+            return None
+
+        entry["last_access"] = time.time()
+        self._unsaved[local_path] = entry
+        self._write_manifest()
+        self._valid[source] = local_path
+        return local_path
+
+    def _copy(self, source, local_path):
+        """Copy the source to the local path and verify the copy.
+
+        The file is copied to a temporary file first so other processes
+        never read a partial copy.
+
+        Returns:
+            str: The checksum of the file.
+
+        """
+        folder = os.path.dirname(local_path)
+        os.makedirs(folder, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=folder, suffix=".tmp")
+        try:
+            checksum = hashlib.sha256()
+            with open(source, "rb") as src, os.fdopen(fd, "wb") as dst:
+                for chunk in iter(lambda: src.read(CHUNK_SIZE), b""):
+                    checksum.update(chunk)
+                    dst.write(chunk)
+            checksum = checksum.hexdigest()
+            if get_checksum(tmp_path) != checksum:
+                raise IOError(
+                    "Checksum mismatch of local copy of {}".format(source))
+            shutil.copystat(source, tmp_path)
+            os.replace(tmp_path, local_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return checksum
+
+    def _evict(self, manifest):
+        """Remove least recently used files until the cache fits.
+
+        Must be called with the manifest lock held.
+        """
+        size = sum(entry["size"] for entry in manifest.values())
+        if size <= self.max_size:
+            return
+
+        in_use = _in_use | self._read_leases()
+        entries = sorted(manifest.items(),
+                         key=lambda item: item[1]["last_access"])
+        for local_path, entry in entries:
+            if size <= self.max_size:
+                break
+            if local_path in in_use:
+                continue
+            try:
+                if os.path.exists(local_path):
+                    os.remove(local_path)
+            except OSError:
+                # E.g. the file is opened by another process on Windows
+                log.debug("Unable to evict %s", local_path, exc_info=True)
+                continue
+            del manifest[local_path]
+            self._unsaved[local_path] = None
+            self._valid.pop(entry["source"], None)
+            size -= entry["size"]
+            log.debug("Evicted from local cache: %s", entry["source"])
+
+        if size > self.max_size:
+            log.warning(
+                "Local cache %s exceeds its maximum size (%.1f / %.1f GB) "
+                "with files in use.", self.root,
+                size / 1024.0 ** 3, self.max_size / 1024.0 ** 3
+            )
+
+    def _get_manifest_mtime(self):
+        try:
+            return os.stat(self.manifest_path).st_mtime_ns
+        except OSError:
+            return None
+
+    def _read_manifest(self):
+        """Return the manifest, re-read when changed by another process."""
+        mtime = self._get_manifest_mtime()
+        if mtime == self._manifest_mtime:
+            return self._manifest
+
+        try:
+            with open(self.manifest_path, "r") as f:
+                manifest = json.load(f)
+        except (IOError, OSError, ValueError):
+            manifest = {}
+        # Keep the changes of this process that are not written yet
+        for local_path, entry in self._unsaved.items():
+            if entry is None:
+                manifest.pop(local_path, None)
+            else:
+                manifest[local_path] = entry
+        self._manifest = manifest
+        self._manifest_mtime = mtime
+        return manifest
+
+    @contextlib.contextmanager
+    def _lock_manifest(self):
+        """Lock the manifest for other processes with a lock file."""
+        os.makedirs(self.root, exist_ok=True)
+        while True:
+            try:
+                fd = os.open(
+                    self.lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                break
+            except OSError:
+                try:
+                    age = time.time() - os.stat(self.lock_path).st_mtime
+                except OSError:
+                    # Released meanwhile
+                    continue
+                if age > LOCK_TIMEOUT:
+                    log.debug("Removing stale lock %s", self.lock_path)
+                    with contextlib.suppress(OSError):
+                        os.remove(self.lock_path)
+                    continue
+                time.sleep(0.05)
+        os.close(fd)
+        try:
+            yield
+        finally:
+            with contextlib.suppress(OSError):
+                os.remove(self.lock_path)
+
+    def _write_manifest(self, force=False):
+        """Merge the changes of this process into the manifest file.
+
+        Evicts files when the cache exceeds its maximum size.
+        """
+        if not self._unsaved:
+            return
+        now = time.time()
+        if not force and now - self._last_write < MANIFEST_WRITE_INTERVAL:
+            return
+
+        with self._lock_manifest():
+            # Always re-read under the lock to keep the entries written by
+            # other processes
+            self._manifest_mtime = None
+            manifest = self._read_manifest()
+            self._evict(manifest)
+            tmp_path = "{}.{}.tmp".format(self.manifest_path, os.getpid())
+            with open(tmp_path, "w") as f:
+                json.dump(manifest, f, indent=1)
+            os.replace(tmp_path, self.manifest_path)
+            self._manifest_mtime = self._get_manifest_mtime()
+        self._unsaved.clear()
+        self._last_write = now
+
+
+class CacheFiller(object):
+    """Copy files into the cache in background threads.
+
+    Files are copied in the order they are queued. Queueing files again
+    moves them to the front.
+
+    Arguments:
+        cache (LocalFileCache): The cache to fill.
+        threads (int): Number of copy threads.
+
+    """
+
+    def __init__(self, cache, threads=4):
+        self.cache = cache
+        self.threads = max(1, threads)
+        self._queue = []
+        self._running = set()
+        self._failed = set()
+        # Pending sources and callback per queue call with a callback
+        self._callbacks = []
+        self._condition = threading.Condition()
+        self._workers = 0
+
+    def get_queued_count(self):
+        with self._condition:
+            return len(self._queue) + len(self._running)
+
+    def queue(self, sources, callback=None):
+        """Queue files in front of the already queued files.
+
+        Arguments:
+            sources (List[str]): Files to copy into the cache.
+            callback (Optional[Callable]): Called from a copy thread once
+                all the files are copied or failed to copy.
+
+        """
+        with self._condition:
+            sources = [
+                source for source in sources
+                if source not in self._failed
+                and not self.cache.is_cached(source)
+            ]
+            if callback is not None and sources:
+                self._callbacks.append((set(sources), callback))
+            sources = [
+                source for source in sources if source not in self._running
+            ]
+            if not sources:
+                return
+            queued = set(sources)
+            self._queue = sources + [
+                source for source in self._queue if source not in queued
+            ]
+            # Threads end when idle and are started again when needed
+            for _ in range(self.threads - self._workers):
+                self._workers += 1
+                threading.Thread(target=self._run, daemon=True).start()
+            self._condition.notify_all()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                if not self._queue:
+                    self._condition.wait(timeout=10.0)
+                if not self._queue:
+                    self._workers -= 1
+                    break
+                source = self._queue.pop(0)
+                self._running.add(source)
+            try:
+                if os.path.exists(source):
+                    self.cache.fetch(source, pin=False)
+            except Exception:
+                log.debug("Unable to cache %s", source, exc_info=True)
+                with self._condition:
+                    self._failed.add(source)
+            finally:
+                with self._condition:
+                    self._running.discard(source)
+                    callbacks = self._pop_callbacks(source)
+                for callback in callbacks:
+                    try:
+                        callback()
+                    except Exception:
+                        log.warning("Local cache callback failed.",
+                                    exc_info=True)
+        self.cache.flush()
+
+    def _pop_callbacks(self, source):
+        """Return the callbacks of which all files are done."""
+        done = []
+        for item in list(self._callbacks):
+            pending, callback = item
+            pending.discard(source)
+            if not pending:
+                self._callbacks.remove(item)
+                done.append(callback)
+        return done
+
+
+_cache = None
+_filler = None
+_settings = {}
+
+
+def _get_settings():
+    try:
+        project_settings = get_current_project_settings()
+        return project_settings["houdini"]["general"]["local_cache"]
+    except Exception:
+        log.debug("Unable to get local cache settings.", exc_info=True)
+        return {}
+
+
+def get_local_cache():
+    """Return the local cache of the current project settings."""
+    global _cache, _settings
+    if _cache is not None:
+        return _cache
+
+    _settings = _get_settings()
+    root = (
+        os.getenv("AYON_HOUDINI_LOCAL_CACHE")
+        or _settings.get("root")
+        or os.path.join(tempfile.gettempdir(), "ayon_houdini_cache")
+    )
+    root = os.path.expandvars(os.path.expanduser(root))
+    max_size = int(_settings.get("max_size_gb", 20) * 1024 ** 3)
+    _cache = LocalFileCache(root, max_size)
+    if hou.isUIAvailable():
+        import hdefereval
+
+        _cache.missing_callback = lambda paths: hdefereval.executeDeferred(
+            restore_missing_paths)
+    return _cache
+
+
+def get_cache_filler():
+    """Return the background filler of the local cache."""
+    global _filler
+    if _filler is None:
+        cache = get_local_cache()
+        _filler = CacheFiller(cache, threads=_settings.get("fill_threads", 4))
+    return _filler
+
+
+def is_enabled():
+    """Return whether loaders can use the local cache in this session.
+
+    Batch sessions, e.g. farm jobs, always read the published files since
+    their local cache would start out empty.
+    """
+    return hou.isUIAvailable()
+
+
+def _use_local_cache(loader_name):
+    try:
+        project_settings = get_current_project_settings()
+        loader_settings = project_settings["houdini"]["load"][loader_name]
+    except Exception:
+        log.debug("Unable to get %s settings.", loader_name, exc_info=True)
+        return False
+    return bool(loader_settings.get("use_local_cache"))
+
+
+def get_library_path(source_path):
+    """Return the path to install an HDA library from.
+
+    Returns the local copy of the published library, copying it when
+    needed. Falls back to the published path in batch sessions or when the
+    library can't be copied.
+    """
+    if not is_enabled():
+        return source_path
+
+    cache = get_local_cache()
+    try:
+        local_path, hit = cache.fetch(source_path)
+    except (IOError, OSError) as exc:
+        log.warning(
+            "Unable to copy %s to local cache, installing from the "
+            "published path: %s", source_path, exc)
+        return source_path
+
+    stats = cache.get_stats()
+    log.info(
+        "Local cache %s for %s (%d hits, %d misses, %.1fs saved)",
+        "hit" if hit else "miss", source_path,
+        stats["hits"], stats["misses"], stats["seconds_saved"]
+    )
+    return local_path.replace("\\", "/")
+
+
+def update_hda_libraries(containers):
+    """Install the libraries of loaded HDA containers for this session.
+
+    Houdini saves the paths of the installed libraries in the scene, for
+    cached libraries that is the local cache of the machine that saved the
+    scene. On scene open the library of each HDA container is resolved
+    again from its published `source_path`: the local copy when the cache
+    is used in this session, else the published file.
+
+    Arguments:
+        containers (Iterable[dict]): The containers of the scene.
+
+    """
+    use_local_cache = None
+    for container in containers:
+        source_path = container.get("source_path")
+        if container.get("loader") != "HdaLoader" or not source_path:
+            continue
+
+        if use_local_cache is None:
+            use_local_cache = _use_local_cache("HdaLoader")
+        path = source_path
+        if use_local_cache:
+            path = get_library_path(source_path)
+
+        node = container["node"]
+        definition = node.type().definition()
+        current = definition.libraryFilePath() if definition else None
+        if current and os.path.normpath(current) == os.path.normpath(path):
+            continue
+
+        log.debug("Installing HDA library %s for %s", path, node.path())
+        hou.hda.installFile(path)
+        for definition in node.type().allInstalledDefinitions():
+            if (
+                os.path.normpath(definition.libraryFilePath())
+                == os.path.normpath(path)
+            ):
+                definition.setIsPreferred(True)
+                break
+
+        # Do not save the missing library of another machine again
+        if current and not os.path.exists(current):
+            hou.hda.uninstallFile(current)
+
+
+def _get_files(path):
+    """Return the existing files of a path with frame tokens in its name."""
+    folder, filename = os.path.split(os.path.normpath(path))
+    parts = FRAME_TOKEN_REGEX.split(filename)
+    if len(parts) == 1:
+        return [os.path.normpath(path)] if os.path.isfile(path) else []
+
+    # Split yields the text between the tokens and the token paddings
+    pattern = "".join(
+        re.escape(part) if index % 2 == 0 else r"-?\d+"
+        for index, part in enumerate(parts)
+    )
+    regex = re.compile("^{}$".format(pattern))
+    try:
+        names = os.listdir(folder)
+    except OSError:
+        return []
+    return sorted(
+        os.path.join(folder, name) for name in names if regex.match(name)
+    )
+
+
+def get_cached_files_path(path, count=True):
+    """Return the local path of a path once all its files are cached.
+
+    Arguments:
+        path (str): File path, optionally with frame tokens like `$F4` in
+            the file name.
+        count (bool): Count each file as hit or miss in the statistics.
+
+    Returns:
+        Tuple[Optional[str], List[str]]: The local path with the same frame
+            tokens, None if not all files are cached, and the files that are
+            not cached. The local files are pinned when all are cached.
+
+    """
+    if FRAME_TOKEN_REGEX.search(os.path.dirname(path)):
+        # Local copies are stored by the folder of their source
+        return None, []
+
+    cache = get_local_cache()
+    files = _get_files(path)
+    missing = [
+        source for source in files
+        if cache.get_cached_path(source, count=count) is None
+    ]
+    if not files or missing:
+        return None, missing
+    cache.pin([cache.get_local_path(source) for source in files])
+    return cache.get_local_path(path).replace("\\", "/"), []
+
+
+def _set_local_path(parm_path, path):
+    """Switch a parm to the local copy of its path once it is cached."""
+    parm = hou.parm(parm_path)
+    if parm is None:
+        return
+    key = USER_DATA_KEY.format(parm.name())
+    if parm.node().userData(key) != path:
+        # The parm was updated meanwhile
+        return
+
+    local_path, _missing = get_cached_files_path(path, count=False)
+    if local_path and parm.unexpandedString() != local_path:
+        with hou.undos.disabler():
+            parm.set(local_path)
+        _local_parms[parm_path] = path
+
+
+def resolve_parm_path(parm, path):
+    """Return the path to set on a file parm reading through the cache.
+
+    Returns the local copy when all files of the path are cached. Else the
+    missing files are queued to be copied, the parm is switched to the local
+    copy when they are done and the published path is returned meanwhile.
+    Batch sessions always use the published path.
+
+    Arguments:
+        parm (hou.Parm): The file parm.
+        path (str): The published path, optionally with frame tokens.
+
+    Returns:
+        str: The path to set on the parm.
+
+    """
+    if not is_enabled():
+        return path
+
+    local_path, missing = get_cached_files_path(path)
+    if local_path:
+        _local_parms[parm.path()] = path
+        return local_path
+    _local_parms.pop(parm.path(), None)
+
+    if missing:
+        import hdefereval
+
+        parm_path = parm.path()
+        get_cache_filler().queue(
+            missing,
+            callback=lambda: hdefereval.executeDeferred(
+                _set_local_path, parm_path, path)
+        )
+    return path
+
+
+def set_parm_path(parm, path, use_local_cache=False):
+    """Set a file parm to a path, optionally read through the local cache.
+
+    Arguments:
+        parm (hou.Parm): The file parm.
+        path (str): The published path, optionally with frame tokens.
+        use_local_cache (bool): Read the files through the local cache.
+
+    """
+    parm.deleteAllKeyframes()
+    node = parm.node()
+    key = USER_DATA_KEY.format(parm.name())
+    if not use_local_cache:
+        if node.userData(key) is not None:
+            node.destroyUserData(key)
+        _local_parms.pop(parm.path(), None)
+        parm.set(path)
+        return
+
+    node.setUserData(key, path)
+    parm.set(resolve_parm_path(parm, path))
+
+
+def update_parm_paths(containers):
+    """Resolve the file parms reading through the cache on scene open.
+
+    Arguments:
+        containers (Iterable[dict]): The containers of the scene.
+
+    """
+    prefix = USER_DATA_KEY.format("")
+    for container in containers:
+        container_node = container["node"]
+        for node in [container_node] + list(container_node.allSubChildren()):
+            for key, path in node.userDataDict().items():
+                if not key.startswith(prefix):
+                    continue
+                parm = node.parm(key[len(prefix):])
+                if parm is not None:
+                    parm.set(resolve_parm_path(parm, path))
+
+
+def restore_missing_paths():
+    """Set parms with missing local files back to their published path.
+
+    The missing files are queued to be copied again, see
+    `resolve_parm_path`.
+    """
+    for parm_path, path in list(_local_parms.items()):
+        parm = hou.parm(parm_path)
+        key = USER_DATA_KEY.format(parm.name()) if parm else None
+        if parm is None or parm.node().userData(key) != path:
+            # Deleted or updated meanwhile
+            _local_parms.pop(parm_path, None)
+            continue
+        local_path = get_local_cache().get_local_path(path)
+        local_files = _get_files(local_path)
+        if local_files and len(local_files) == len(_get_files(path)):
+            continue
+        log.warning("Local copy of %s is missing, reading the published "
+                    "files of %s", path, parm_path)
+        with hou.undos.disabler():
+            parm.set(resolve_parm_path(parm, path))
+
+
+def reset():
+    """Reload the cache settings, e.g. on context change."""
+    global _cache, _filler
+    if _cache is not None:
+        _cache.flush()
+    _cache = None
+    _filler = None
@@ -0,0 +1,70 @@
+from qtpy import QtWidgets, QtCore
+
+from ayon_houdini.api import local_cache
+
+
+def format_size(size):
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024.0:
+            return "{:.1f} {}".format(size, unit)
+        size /= 1024.0
+    return "{:.1f} TB".format(size)
+
+
+class LocalCacheStatsDialog(QtWidgets.QDialog):
+    """Show the statistics of the local cache of this session."""
+
+    def __init__(self, parent=None):
+        QtWidgets.QDialog.__init__(self, parent)
+
+        self.setWindowTitle("Local Cache")
+
+        self.labels = {}
+        layout = QtWidgets.QFormLayout()
+        for key, label in (
+            ("root", "Cache Root"),
+            ("hit_rate", "Hit Rate"),
+            ("hits", "Hits"),
+            ("misses", "Misses"),
+            ("bytes_served", "Served Locally"),
+            ("bytes_copied", "Copied"),
+            ("seconds_saved", "Read Time Saved"),
+            ("queued", "Queued Files"),
+            ("files", "Cached Files"),
+            ("size", "Cache Size"),
+        ):
+            self.labels[key] = QtWidgets.QLabel()
+            self.labels[key].setTextInteractionFlags(
+                QtCore.Qt.TextSelectableByMouse)
+            layout.addRow(label, self.labels[key])
+        self.setLayout(layout)
+
+        # Refresh while the cache is filled in the background
+        self.timer = QtCore.QTimer(self)
+        self.timer.timeout.connect(self.refresh)
+        self.timer.start(1000)
+        self.refresh()
+
+    def refresh(self):
+        stats = local_cache.get_local_cache().get_stats()
+        stats["queued"] = local_cache.get_cache_filler().get_queued_count()
+        self.labels["root"].setText(stats["root"])
+        self.labels["hit_rate"].setText(
+            "{:.1f}%".format(stats["hit_rate"] * 100))
+        self.labels["hits"].setText(str(stats["hits"]))
+        self.labels["misses"].setText(str(stats["misses"]))
+        self.labels["bytes_served"].setText(
+            format_size(stats["bytes_served"]))
+        self.labels["bytes_copied"].setText(
+            format_size(stats["bytes_copied"]))
+        self.labels["seconds_saved"].setText(
+            "{:.1f}s".format(stats["seconds_saved"]))
+        self.labels["queued"].setText(str(stats["queued"]))
+        self.labels["files"].setText(str(stats["files"]))
+        self.labels["size"].setText("{} / {}".format(
+            format_size(stats["size"]), format_size(stats["max_size"])))
+
+
+def show_dialog(parent):
+    dialog = LocalCacheStatsDialog(parent)
+    dialog.show()
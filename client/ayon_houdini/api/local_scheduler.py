@@ -0,0 +1,268 @@
+# -*- coding: utf-8 -*-
+"""Slot planning and throughput of the local PDG scheduler.
+
+The slots of a `localscheduler` are derived from the usable cores, the
+available memory and an estimate of the memory used by a single work item,
+so heavy work items do not oversubscribe memory and light ones use all
+cores of large machines:
+
+    >>> plan = plan_slots(get_settings())
+    >>> plan.slots, plan.threads, plan.limited_by
+    (12, 5, 'memory')
+
+The settings are taken from the `general/local_scheduler` project settings
+so they can be overridden per project.
+
+`WorkItemThroughput` records the cook times of the work items of a TOP
+network through PDG events to report the throughput of a cook.
+
+"""
+import os
+import time
+import logging
+
+import attr
+
+from ayon_core.settings import get_current_project_settings
+
+
+log = logging.getLogger(__name__)
+
+GB = 1024 ** 3
+
+DEFAULT_SETTINGS = {
+    "enabled": True,
+    "memory_per_item_gb": 4.0,
+    "reserved_memory_gb": 4.0,
+    "reserved_cores": 1,
+    "max_slots": 0,
+    "threads_per_item": 0,
+}
+
+
+@attr.s
+class SlotPlan(object):
+    """Data class for the planned slots of the local scheduler."""
+    cores: int = attr.ib()          # usable cores
+    memory: int = attr.ib()         # available memory in bytes
+    slots: int = attr.ib()          # concurrent work items
+    threads: int = attr.ib()        # threads per work item
+    limited_by: str = attr.ib()     # "cores", "memory" or "settings"
+
+    def get_report(self):
+        return (
+            "{} slots with {} threads each, limited by {} "
+            "({} cores, {:.1f} GB available memory).".format(
+                self.slots, self.threads, self.limited_by,
+                self.cores, self.memory / float(GB)
+            )
+        )
+
+
+def get_settings():
+    """Return the local scheduler settings of the current project."""
+    settings = dict(DEFAULT_SETTINGS)
+    try:
+        project_settings = get_current_project_settings()
+        settings.update(
+            project_settings["houdini"]["general"]["local_scheduler"])
+    except Exception:
+        log.debug("Unable to get local scheduler settings.", exc_info=True)
+    return settings
+
+
+def get_cpu_count():
+    """Return the number of cores this process is allowed to run on."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _get_windows_available_memory():
+    import ctypes
+
+    class MemoryStatusEx(ctypes.Structure):
+        _fields_ = [
+            ("dwLength", ctypes.c_ulong),
+            ("dwMemoryLoad", ctypes.c_ulong),
+            ("ullTotalPhys", ctypes.c_ulonglong),
+            ("ullAvailPhys", ctypes.c_ulonglong),
+            ("ullTotalPageFile", ctypes.c_ulonglong),
+            ("ullAvailPageFile", ctypes.c_ulonglong),
+            ("ullTotalVirtual", ctypes.c_ulonglong),
+            ("ullAvailVirtual", ctypes.c_ulonglong),
+            ("ullAvailExtendedVirtual", ctypes.c_ulonglong),
+        ]
+
+    status = MemoryStatusEx()
+    status.dwLength = ctypes.sizeof(MemoryStatusEx)
+    ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(status))
+    return status.ullAvailPhys
+
+
+def get_available_memory():
+    """Return the memory available for new processes in bytes.
+
+    On Linux this is `MemAvailable` of `/proc/meminfo`, on Windows the
+    available physical memory. Elsewhere the total physical memory is used.
+    """
+    try:
+        if os.name == "nt":
+            return _get_windows_available_memory()
+        with open("/proc/meminfo", "r") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except (IOError, OSError, ValueError, AttributeError):
+        log.debug("Unable to read available memory.", exc_info=True)
+
+    try:
+        return os.sysconf("SC_PHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (AttributeError, ValueError, OSError):
+        return 0
+
+
+def plan_slots(settings, cores=None, memory=None):
+    """Return the slots and threads per work item of the local scheduler.
+
+    The slots are the smaller of the usable cores and the number of work
+    items that fit in the available memory. The cores are then divided
+    among the slots for the threads per work item.
+
+    Arguments:
+        settings (dict): The local scheduler settings.
+        cores (Optional[int]): Cores to plan for, defaults to the detected
+            cores.
+        memory (Optional[int]): Available memory in bytes, defaults to the
+            detected available memory.
+
+    Returns:
+        SlotPlan: The planned slots.
+
+    """
+    if cores is None:
+        cores = get_cpu_count()
+    if memory is None:
+        memory = get_available_memory()
+
+    usable_cores = max(1, cores - settings["reserved_cores"])
+    slots = usable_cores
+    limited_by = "cores"
+
+    per_item = settings["memory_per_item_gb"] * GB
+    usable_memory = memory - settings["reserved_memory_gb"] * GB
+    if memory and per_item > 0:
+        memory_slots = max(1, int(usable_memory // per_item))
+        if memory_slots < slots:
+            slots = memory_slots
+            limited_by = "memory"
+
+    if settings["max_slots"] and settings["max_slots"] < slots:
+        slots = settings["max_slots"]
+        limited_by = "settings"
+
+    threads = settings["threads_per_item"] or max(1, usable_cores // slots)
+    return SlotPlan(
+        cores=cores,
+        memory=memory,
+        slots=slots,
+        threads=threads,
+        limited_by=limited_by
+    )
+
+
+class WorkItemThroughput(object):
+    """Record the cook times of the work items of a PDG graph context.
+
+    The recording is reset when a cook of the graph starts, so the report
+    covers the last cook only.
+
+    Arguments:
+        context (pdg.GraphContext): The graph context of a TOP network.
+
+    """
+
+    def __init__(self, context):
+        import pdg
+
+        self._pdg = pdg
+        self.started = {}
+        self.durations = []
+        self.failed = 0
+        self.first_start = None
+        self.last_end = None
+        self.handler = context.addEventHandler(
+            self._on_state_change, pdg.EventType.WorkItemStateChange, True)
+        self.cook_handler = context.addEventHandler(
+            self._on_cook_start, pdg.EventType.CookStart, True)
+
+    def _on_cook_start(self, handler, event):
+        self.reset()
+
+    def _on_state_change(self, handler, event):
+        state = self._pdg.workItemState
+        now = time.time()
+        if event.currentState == state.Cooking:
+            self.started[event.workItemId] = now
+            if self.first_start is None:
+                self.first_start = now
+            return
+
+        start = self.started.pop(event.workItemId, None)
+        if start is None:
+            return
+        if event.currentState == state.CookedSuccess:
+            self.durations.append(now - start)
+        elif event.currentState == state.CookedFail:
+            self.failed += 1
+        self.last_end = now
+
+    def reset(self):
+        self.started.clear()
+        self.durations = []
+        self.failed = 0
+        self.first_start = None
+        self.last_end = None
+
+    def get_report(self):
+        """Return a readable report of the recorded cook."""
+        if not self.durations:
+            return "No cooked work items recorded."
+
+        count = len(self.durations)
+        total = sum(self.durations)
+        wall = max(self.last_end - self.first_start, 1e-6)
+        return (
+            "Cooked {} work items ({} failed) in {:.1f}s: "
+            "{:.1f} items/min, {:.2f}s average, {:.2f}s longest, "
+            "{:.1f} items cooking on average.".format(
+                count, self.failed, wall, count / wall * 60.0,
+                total / count, max(self.durations), total / wall
+            )
+        )
+
+
+_trackers = {}
+
+
+def get_throughput(top_node):
+    """Return the throughput recorded for the last cook of a TOP network.
+
+    Recording starts on the first call for a graph context.
+
+    Arguments:
+        top_node (hou.TopNode): A node in the TOP network.
+
+    Returns:
+        Optional[WorkItemThroughput]: None when the network has no graph
+            context yet.
+
+    """
+    context = top_node.getPDGGraphContext()
+    if context is None:
+        return None
+    tracker = _trackers.get(context.name)
+    if tracker is None:
+        tracker = WorkItemThroughput(context)
+        _trackers[context.name] = tracker
+    return tracker
@@ -0,0 +1,292 @@
+# -*- coding: utf-8 -*-
+"""Registry of the output and export parameters of ROP node types.
+
+`lib.get_output_parameter` and `lib.get_export_parameter` dispatch through
+the registries in this module. Node types are registered by their
+`nameWithCategory()`, e.g. `Driver/arnold`, optionally without version
+(`Driver/ax::ax_publisher` matches all versions). The built-in types are
+registered by node type description as before, e.g. "Arnold", optionally
+limited to a node type category.
+
+The handler resolved for a node type is cached, so repeated lookups for
+nodes of the same type are a single dictionary lookup.
+
+Custom ROP types can be registered from code:
+
+    >>> register_output_parameter("Driver/studio::my_rop", "outputfile")
+
+or through the `houdini/general/output_parameters` project settings.
+
+"""
+import logging
+
+from ayon_core.settings import get_current_project_settings
+
+
+log = logging.getLogger(__name__)
+
+
+class OutputParameterRegistry(object):
+    """Map node types to a handler that returns their output parm.
+
+    A handler is either a parm name or a callable that takes the node and
+    returns the `hou.Parm` or None if the node has no output parm in its
+    current state.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self._by_type = {}
+        self._by_description = {}
+        self._cache = {}
+
+    def register(self, handler, node_type=None, description=None,
+                 category=None):
+        """Register a handler by node type name or description.
+
+        Arguments:
+            handler (Union[str, Callable[[hou.Node], Optional[hou.Parm]]]):
+                Parm name or callable returning the parm.
+            node_type (Optional[str]): Node type `nameWithCategory()`, with
+                or without version.
+            description (Optional[str]): Node type description, used when
+                no `node_type` is provided.
+            category (Optional[str]): Limit a description to a node type
+                category, e.g. "Sop".
+
+        """
+        if node_type:
+            self._by_type[node_type] = handler
+        elif description:
+            self._by_description[(category, description)] = handler
+        else:
+            raise ValueError("Either node type or description is required.")
+        self._cache.clear()
+
+    def unregister(self, node_type):
+        """Remove the handler registered for a node type name."""
+        self._by_type.pop(node_type, None)
+        self._cache.clear()
+
+    def clear_cache(self):
+        self._cache.clear()
+
+    def _find_handler(self, node_type):
+        name = node_type.nameWithCategory()
+        handler = self._by_type.get(name)
+        if handler is not None:
+            return handler
+
+        # Match without version, e.g. `Driver/ax::ax_publisher`
+        _scope, namespace, type_name, version = node_type.nameComponents()
+        if version:
+            unversioned = "{}/{}".format(
+                node_type.category().name(),
+                "::".join(part for part in (namespace, type_name) if part)
+            )
+            handler = self._by_type.get(unversioned)
+            if handler is not None:
+                return handler
+
+        description = node_type.description()
+        category = node_type.category().name()
+        handler = self._by_description.get((category, description))
+        if handler is None:
+            handler = self._by_description.get((None, description))
+        return handler
+
+    def get_handler(self, node):
+        """Return the cached handler for the node's type."""
+        node_type = node.type()
+        key = node_type.nameWithCategory()
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+
+        handler = self._find_handler(node_type)
+        self._cache[key] = handler
+        return handler
+
+    def get(self, node):
+        """Return the parm of the node.
+
+        Raises:
+            TypeError: When the node type is not supported.
+
+        """
+        handler = self.get_handler(node)
+        parm = None
+        if isinstance(handler, str):
+            parm = node.parm(handler)
+        elif handler is not None:
+            parm = handler(node)
+
+        if parm is None:
+            raise TypeError(
+                "Node type '%s' not supported" % node.type().description())
+        return parm
+
+
+output_registry = OutputParameterRegistry("output")
+export_registry = OutputParameterRegistry("export")
+_settings_loaded = False
+_settings_node_types = set()
+
+
+def register_output_parameter(node_type, output_parm, export_parm=None):
+    """Register the output (and export) parm of a custom ROP node type.
+
+    Arguments:
+        node_type (str): Node type `nameWithCategory()`, with or without
+            version, e.g. "Driver/studio::my_rop".
+        output_parm (Optional[str]): Name of the output file parm.
+        export_parm (Optional[str]): Name of the export file parm, e.g. for
+            scene description files rendered on the farm.
+
+    """
+    if output_parm:
+        output_registry.register(output_parm, node_type=node_type)
+    if export_parm:
+        export_registry.register(export_parm, node_type=node_type)
+
+
+def _load_settings():
+    global _settings_loaded
+    if _settings_loaded:
+        return
+    _settings_loaded = True
+
+    try:
+        project_settings = get_current_project_settings()
+    except Exception:
+        log.debug("Unable to get project settings.", exc_info=True)
+        return
+
+    items = (
+        project_settings.get("houdini", {})
+        .get("general", {})
+        .get("output_parameters", [])
+    )
+    for item in items:
+        if not item.get("node_type"):
+            continue
+        _settings_node_types.add(item["node_type"])
+        register_output_parameter(
+            item["node_type"],
+            item.get("output_parm"),
+            item.get("export_parm")
+        )
+
+
+def reset():
+    """Reload the registrations from settings, e.g. on context change."""
+    global _settings_loaded
+    _settings_loaded = False
+    for node_type in _settings_node_types:
+        output_registry.unregister(node_type)
+        export_registry.unregister(node_type)
+    _settings_node_types.clear()
+    output_registry.clear_cache()
+    export_registry.clear_cache()
+
+
+def get_output_parameter(node):
+    _load_settings()
+    return output_registry.get(node)
+
+
+def get_export_parameter(node):
+    _load_settings()
+    return export_registry.get(node)
+
+
+def _get_parm_if(toggle, parm_name):
+    """Return handler returning `parm_name` if `toggle` parm is enabled."""
+    def handler(node):
+        if node.parm(toggle).eval():
+            return node.parm(parm_name)
+    return handler
+
+
+def _get_from_inner_node(registry, parm_name, fetch=False):
+    """Return handler resolving the parm of a node referenced by parm."""
+    def handler(node):
+        path = node.parm(parm_name).eval()
+        if not path:
+            return None
+        inner_node = node.node(path)
+        if inner_node is None:
+            return None
+        if not fetch:
+            return registry.get(inner_node)
+        try:
+            return registry.get(inner_node)
+        except TypeError:
+            raise TypeError("Fetch source '%s' not supported" % inner_node)
+    return handler
+
+
+def _get_renderman_export(node):
+    pre_ris22 = node.parm("rib_outputmode") and \
+        node.parm("rib_outputmode").eval()
+    ris22 = node.parm("diskfile") and node.parm("diskfile").eval()
+    if pre_ris22 or ris22:
+        return node.parm("soho_diskfile")
+
+
+def _register_defaults():
+    for descriptions, handler in (
+        (("Geometry", "Filmbox FBX", "File Cache", "Labs File Cache"),
+         "sopoutput"),
+        (("USD", "HuskStandalone"), "lopoutput"),
+        (("USD Render ROP", "USD Render"), "outputimage"),
+        (("Composite",), "copoutput"),
+        (("Channel",), "chopoutput"),
+        (("Dynamics",), "dopoutput"),
+        (("Alfred",), "alf_diskfile"),
+        (("RenderMan", "RenderMan RIS"), "ri_display"),
+        (("Redshift",), "RS_returnmePrefix"),
+        (("Mantra",), "vm_picture"),
+        (("Wedge",), _get_from_inner_node(output_registry, "driver")),
+        (("Arnold",), "ar_picture"),
+        (("Arnold Denoiser",), "output"),
+        (("HQueue Simulation",),
+         _get_from_inner_node(output_registry, "hq_driver")),
+        (("ROP Alembic Output", "Alembic", "Shotgun Alembic"), "filename"),
+        (("Shotgun Mantra",), "sgtk_vm_picture"),
+        (("Bake Texture",), "vm_uvoutputpicture1"),
+        (("OpenGL",), "picture"),
+        (("Octane",), "HO_img_fileName"),
+        (("Fetch",),
+         _get_from_inner_node(output_registry, "source", fetch=True)),
+    ):
+        for description in descriptions:
+            output_registry.register(handler, description=description)
+    output_registry.register(
+        "sopoutput", description="ROP Output Driver", category="Sop")
+    output_registry.register(
+        "dopoutput", description="ROP Output Driver", category="Dop")
+    output_registry.register(
+        "SettingsOutput_img_file_path", node_type="Driver/vray_renderer")
+
+    for descriptions, handler in (
+        (("Mantra",), _get_parm_if("soho_outputmode", "soho_diskfile")),
+        (("USD", "USD Render ROP", "USD Render"), "lopoutput"),
+        (("Alfred",), "alf_diskfile"),
+        (("RenderMan", "RenderMan RIS"), _get_renderman_export),
+        (("Redshift",), _get_parm_if("RS_archive_enable", "RS_archive_file")),
+        (("Wedge",), _get_from_inner_node(export_registry, "driver")),
+        (("Arnold",), "ar_ass_file"),
+        (("Alembic", "Shotgun Alembic"),
+         _get_parm_if("use_sop_path", "sop_path")),
+        (("Shotgun Mantra",),
+         _get_parm_if("soho_outputmode", "sgtk_soho_diskfile")),
+    ):
+        for description in descriptions:
+            export_registry.register(handler, description=description)
+    export_registry.register(
+        "render_export_filepath", node_type="Driver/vray_renderer")
+
+
+_register_defaults()
@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+"""Performance monitor capture of ROP renders during extraction.
+
+When enabled, `HoudiniExtractorPlugin.render_rop` records each render in a
+`hou.perfMon` profile. The `.hperf` profile and a JSON summary with the
+nodes that took the longest to cook, and the extract time and memory per
+rendered frame range, are added as extra representations to the instance
+so they are published with the product:
+
+    - `hperf`: The Houdini performance monitor profile.
+    - `perfstats`: The JSON summary.
+
+Enable it in the `houdini/publish/ExtractPerformanceCapture` project
+settings or by setting the `AYON_HOUDINI_PERFMON` environment variable to
+`1`.
+
+"""
+import os
+import json
+import time
+import logging
+import tempfile
+import contextlib
+
+import hou
+
+from ayon_core.lib import env_value_to_bool
+
+from .publish_profiler import get_peak_rss
+
+
+log = logging.getLogger(__name__)
+
+ENV_KEY = "AYON_HOUDINI_PERFMON"
+SETTINGS_KEY = "ExtractPerformanceCapture"
+
+
+def get_settings(context):
+    """Return the performance capture settings of the publish."""
+    settings = dict(
+        context.data.get("project_settings", {})
+        .get("houdini", {})
+        .get("publish", {})
+        .get(SETTINGS_KEY, {})
+    )
+    if env_value_to_bool(ENV_KEY, default=False):
+        settings["enabled"] = True
+    return settings
+
+
+def is_enabled(instance):
+    """Return whether renders of the instance should be captured."""
+    settings = get_settings(instance.context)
+    if not settings.get("enabled"):
+        return False
+
+    families = settings.get("families")
+    if not families:
+        return True
+    instance_families = set(instance.data.get("families", []))
+    instance_families.add(instance.data.get("productType"))
+    return bool(instance_families.intersection(families))
+
+
+def _iter_dicts(data):
+    if isinstance(data, dict):
+        yield data
+        for value in data.values():
+            yield from _iter_dicts(value)
+    elif isinstance(data, list):
+        for value in data:
+            yield from _iter_dicts(value)
+
+
+def get_node_cook_times(profile):
+    """Return the total cook time in seconds per node path of a profile.
+
+    The layout of `hou.PerfMonProfile.stats()` differs between Houdini
+    versions, so any entry with a node path and a cook time is collected.
+
+    Returns:
+        Dict[str, float]: Cook time by node path.
+
+    """
+    try:
+        stats = json.loads(profile.stats())
+    except (hou.Error, ValueError, TypeError):
+        log.debug("Unable to read performance monitor stats.", exc_info=True)
+        return {}
+
+    times = {}
+    for entry in _iter_dicts(stats):
+        path = entry.get("path") or entry.get("name")
+        if not isinstance(path, str) or not path.startswith("/"):
+            continue
+        value = None
+        for key in ("selfcooktime", "cooktime", "selftime", "time"):
+            value = entry.get(key)
+            if isinstance(value, (int, float)):
+                break
+        if not isinstance(value, (int, float)):
+            continue
+        # Times are reported in milliseconds
+        times[path] = times.get(path, 0.0) + value / 1000.0
+    return times
+
+
+class RenderCapture(object):
+    """Capture ROP renders of an instance in a performance monitor profile.
+
+    Arguments:
+        rop_node (hou.RopNode): The rendered ROP node.
+        top_nodes (int): Number of slowest nodes to include in the summary.
+
+    """
+
+    def __init__(self, rop_node, top_nodes=20):
+        self.rop_node = rop_node
+        self.top_nodes = top_nodes
+        self.ranges = []
+        self.staging_dir = tempfile.mkdtemp(prefix="ayon_perfmon_")
+        self._profile = None
+
+    def start(self):
+        title = "AYON Extract {}".format(self.rop_node.path())
+        self._profile = hou.perfMon.startProfile(title)
+
+    @contextlib.contextmanager
+    def frame_range(self, frame_range=None):
+        """Record extract time and peak memory increase of a render."""
+        rss = get_peak_rss()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            if frame_range is None:
+                frame_range = (
+                    self.rop_node.evalParm("f1"),
+                    self.rop_node.evalParm("f2")
+                ) if self.rop_node.parm("f1") else None
+            self.ranges.append({
+                "frame_range": list(frame_range[:2]) if frame_range else None,
+                "seconds": time.perf_counter() - start,
+                "peak_rss_delta": (
+                    get_peak_rss() - rss if rss is not None else None
+                )
+            })
+
+    def stop(self):
+        """Stop profiling and write the profile and summary files.
+
+        Returns:
+            Tuple[str, str]: File names of the profile and summary in
+                `staging_dir`.
+
+        """
+        profile, self._profile = self._profile, None
+        profile.stop()
+
+        profile_name = "perfmon.hperf"
+        profile.save(os.path.join(self.staging_dir, profile_name))
+
+        cook_times = get_node_cook_times(profile)
+        slowest = sorted(
+            cook_times.items(), key=lambda item: item[1], reverse=True
+        )[:self.top_nodes]
+        summary = {
+            "rop_node": self.rop_node.path(),
+            "houdini_version": hou.applicationVersionString(),
+            "seconds": sum(r["seconds"] for r in self.ranges),
+            "ranges": self.ranges,
+            "slowest_nodes": [
+                {"path": path, "cook_seconds": seconds}
+                for path, seconds in slowest
+            ]
+        }
+        summary_name = "perfstats.json"
+        with open(os.path.join(self.staging_dir, summary_name), "w") as f:
+            json.dump(summary, f, indent=4)
+
+        lines = ["{:>10.3f}s  {}".format(seconds, path)
+                 for path, seconds in slowest]
+        log.info("Extracted %s in %.2fs, slowest nodes:\n%s",
+                 self.rop_node.path(), summary["seconds"], "\n".join(lines))
+        return profile_name, summary_name
+
+    def cancel(self):
+        if self._profile is not None:
+            self._profile.cancel()
+            self._profile = None
+
+    def add_representations(self, instance, profile_name, summary_name):
+        """Add the profile and summary as representations to the instance.
+        """
+        instance.context.data.setdefault(
+            "cleanupFullPaths", []).append(self.staging_dir)
+        representations = instance.data.setdefault("representations", [])
+        for name, file_name in (
+            ("hperf", profile_name),
+            ("perfstats", summary_name),
+        ):
+            representations.append({
+                "name": name,
+                "ext": os.path.splitext(file_name)[1].lstrip("."),
+                "files": file_name,
+                "stagingDir": self.staging_dir
+            })
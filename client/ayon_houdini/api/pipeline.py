@@ -2,7 +2,9 @@
 """Pipeline tools for OpenPype Houdini integration."""
 import os
 import json
+import time
 import logging
+import contextlib
 
 import hou  # noqa
 
@@ -20,7 +22,14 @@ from ayon_core.pipeline import (
 )
 from ayon_core.pipeline.load import any_outdated_containers
 from ayon_houdini import HOUDINI_HOST_DIR
-from ayon_houdini.api import lib, shelves, creator_node_shelves
+from ayon_houdini.api import (
+    lib,
+    shelves,
+    creator_node_shelves,
+    anatomy_cache,
+    output_parameters,
+    local_cache,
+)
 
 from ayon_core.lib import (
     register_event_callback,
@@ -47,6 +56,9 @@ WORKFILE_BUILD_PATH = os.path.join(PLUGINS_DIR, "workfile_build")
 # Track whether the workfile tool is about to save
 _about_to_save = False
 
+# Currently active batch of loaded containers, see `batch_load`
+_load_batch = None
+
 
 class HoudiniHost(HostBase, IWorkfileHost, ILoadHost, IPublishHost):
     name = "houdini"
@@ -225,9 +237,6 @@ def containerise(name,
 
     """
 
-    # Get AVALON_CONTAINERS subnet
-    subnet = get_or_create_avalon_container()
-
     # Create proper container name
     container_name = "{}_{}".format(name, suffix or "CON")
     container = hou.node("/obj/{}".format(name))
@@ -242,6 +251,15 @@ def containerise(name,
         "representation": context["representation"]["id"],
     }
 
+    if _load_batch is not None:
+        # Imprint, move and layout are done for all containers at once
+        # when the batch finishes
+        _load_batch.add(container, data)
+        return container
+
+    # Get AVALON_CONTAINERS subnet
+    subnet = get_or_create_avalon_container()
+
     lib.imprint(container, data)
 
     # "Parent" the container under the container network
@@ -252,6 +270,117 @@ def containerise(name,
     return container
 
 
+class LoadBatch(object):
+    """Containers loaded in a batch that are finalized all at once.
+
+    Creating containers one at a time calls `moveToGoodPosition` for each
+    container which is O(n) in the existing nodes. A batch collects the
+    containers and imprints them, moves them into the containers network and
+    lays them out in one pass when the batch finishes.
+
+    """
+
+    # Grid layout of the new containers in the network
+    columns = 8
+    spacing = (3.0, 1.0)
+
+    def __init__(self):
+        self.start_time = time.time()
+        self.items = []
+        self.timings = {}
+
+    def add(self, container, data):
+        self.items.append((container, data))
+
+    def finish(self):
+        """Imprint, move and lay out all containers of the batch."""
+        self.timings["create"] = time.time() - self.start_time
+        if not self.items:
+            return []
+
+        subnet = get_or_create_avalon_container()
+        existing = subnet.children()
+
+        start = time.time()
+        containers = hou.moveNodesTo(
+            [container for container, _ in self.items], subnet
+        )
+        self.timings["move"] = time.time() - start
+
+        start = time.time()
+        for container, (_, data) in zip(containers, self.items):
+            lib.imprint(container, data)
+        self.timings["imprint"] = time.time() - start
+
+        start = time.time()
+        self.layout(containers, existing)
+        self.timings["layout"] = time.time() - start
+
+        log.info(
+            "Loaded %d containers in batch: %s", len(containers),
+            ", ".join("{} {:.2f}s".format(phase, duration)
+                      for phase, duration in self.timings.items())
+        )
+        return containers
+
+    def layout(self, containers, existing):
+        """Place containers in a grid below the existing nodes."""
+        if existing:
+            positions = [node.position() for node in existing]
+            origin = hou.Vector2(
+                min(pos[0] for pos in positions),
+                min(pos[1] for pos in positions) - self.spacing[1] * 2
+            )
+        else:
+            origin = hou.Vector2(0, 0)
+
+        for index, container in enumerate(containers):
+            row, column = divmod(index, self.columns)
+            container.setPosition(origin + hou.Vector2(
+                column * self.spacing[0], -row * self.spacing[1]
+            ))
+
+
+@contextlib.contextmanager
+def batch_load(label="AYON Load"):
+    """Load multiple containers in a single undo group without cooking.
+
+    All containers created by loaders within the context are imprinted,
+    moved and laid out at once when the context exits. Until then the
+    containers returned by the loaders are not imprinted yet and are not
+    listed by `ls()`. Outside of this context `containerise` finalizes
+    each container right away. Multiple products selected in the Loader are
+    loaded in a batch with the `BatchLoader` action.
+
+    Example:
+        >>> with batch_load():
+        ...     for context in contexts:
+        ...         load_with_repre_context(loader, context)
+
+    Yields:
+        LoadBatch: The batch of loaded containers.
+
+    """
+    global _load_batch
+    if _load_batch is not None:
+        # Nested batch, the outer batch finishes the containers
+        yield _load_batch
+        return
+
+    batch = LoadBatch()
+    _load_batch = batch
+    try:
+        with hou.undos.group(label), \
+                lib.update_mode_context(hou.updateMode.Manual):
+            try:
+                yield batch
+            finally:
+                _load_batch = None
+                batch.finish()
+    finally:
+        _load_batch = None
+
+
 def parse_container(container):
     """Return the container node's full container data.
 
@@ -331,6 +460,11 @@ def on_save():
 
 
 def on_task_changed():
+    # Project or task entities may differ in the new context
+    anatomy_cache.clear()
+    output_parameters.reset()
+    local_cache.reset()
+
     global _about_to_save
     if not IS_HEADLESS and _about_to_save:
         # Let's prompt the user to update the context settings or not
@@ -362,6 +496,13 @@ def _show_outdated_content_popup():
 
 def on_open():
 
+    # The saved paths of cached HDA libraries and files point to the local
+    # cache of the machine that saved the scene, also resolve them in batch
+    # mode
+    containers = list(ls())
+    local_cache.update_hda_libraries(containers)
+    local_cache.update_parm_paths(containers)
+
     if not hou.isUIAvailable():
         log.debug("Batch mode detected, ignoring `on_open` callbacks..")
         return
@@ -1,12 +1,17 @@
 # -*- coding: utf-8 -*-
 """Houdini specific Avalon/Pyblish plugin definitions."""
+import re
 import sys
+import copy
+import time
+import contextlib
 from abc import (
     ABCMeta
 )
 import six
 import hou
 
+import ayon_api
 import clique
 import pyblish.api
 from ayon_core.pipeline import (
@@ -16,12 +21,23 @@ from ayon_core.pipeline import (
     AYON_INSTANCE_ID,
     AVALON_INSTANCE_ID,
     load,
-    publish
+    publish,
+    get_representation_path,
 )
+from ayon_core.pipeline.load import get_representation_path_with_anatomy
 from ayon_core.lib import BoolDef
 
-from .lib import imprint, read, lsattr, add_self_publish_button, render_rop
+from .lib import (
+    imprint,
+    read,
+    lsattr,
+    add_self_publish_button,
+    render_rop,
+    update_mode_context,
+)
 from .usd import get_ayon_entity_uri_from_representation_context
+from . import anatomy_cache, perfmon, telemetry
+from .publish_profiler import ProfiledPluginMixin
 
 
 SETTINGS_CATEGORY = "houdini"
@@ -97,7 +113,9 @@ class HoudiniCreatorBase(object):
         parent_node = hou.node(parent)
         instance_node = parent_node.createNode(
             node_type, node_name=node_name)
-        instance_node.moveToGoodPosition()
+        # Bulk creation lays out all instance nodes at once afterwards
+        if not (pre_create_data or {}).get("bulk_node"):
+            instance_node.moveToGoodPosition()
         return instance_node
 
 
@@ -108,13 +126,18 @@ class HoudiniCreator(Creator, HoudiniCreatorBase):
     settings_name = None
     add_publish_button = False
 
+    # Allow to create an instance per selected node in one go
+    bulk_create_supported = False
+
     settings_category = SETTINGS_CATEGORY
 
     def create(self, product_name, instance_data, pre_create_data):
         try:
             self.selected_nodes = []
 
-            if pre_create_data.get("use_selection"):
+            if pre_create_data.get("bulk_node"):
+                self.selected_nodes = [pre_create_data["bulk_node"]]
+            elif pre_create_data.get("use_selection"):
                 self.selected_nodes = hou.selectedNodes()
 
             # Get the node type and remove it from the data, not needed
@@ -156,6 +179,130 @@ class HoudiniCreator(Creator, HoudiniCreatorBase):
                 CreatorError("Creator error: {}".format(er)),
                 sys.exc_info()[2])
 
+    def get_bulk_nodes(self, pre_create_data):
+        """Return the selected nodes to create an instance for each.
+
+        Creators with `bulk_create_supported` call `create_bulk` with these
+        nodes at the start of their `create`.
+
+        Returns:
+            List[hou.Node]: The nodes, empty when not creating in bulk.
+
+        """
+        if (
+            not self.bulk_create_supported
+            or not pre_create_data.get("bulk_create")
+            or not pre_create_data.get("use_selection")
+            # Already creating the instance of a single node
+            or pre_create_data.get("bulk_node")
+        ):
+            return []
+        nodes = hou.selectedNodes()
+        return list(nodes) if len(nodes) > 1 else []
+
+    def create_bulk(self, nodes, instance_data, pre_create_data):
+        """Create an instance for each of the nodes.
+
+        All instance nodes are created in a single undo group with cooking
+        disabled, are laid out once and are added to the create context
+        in one batch. The variant of each instance is the variant suffixed
+        with the name of its node. Each instance is created by `create`
+        with the node as `bulk_node` in the pre create data.
+
+        Arguments:
+            nodes (List[hou.Node]): Selected nodes to create instances for.
+            instance_data (dict): Instance data of the create call.
+            pre_create_data (dict): Pre create data of the create call.
+
+        Returns:
+            List[CreatedInstance]: The created instances.
+
+        Raises:
+            CreatorError: When interrupted, the instances created so far
+                are kept.
+
+        """
+        project_name = self.create_context.get_current_project_name()
+        folder_entity = ayon_api.get_folder_by_path(
+            project_name, instance_data["folderPath"])
+        task_entity = None
+        if instance_data.get("task"):
+            task_entity = ayon_api.get_task_by_name(
+                project_name, folder_entity["id"], instance_data["task"])
+
+        bulk_add = getattr(
+            self.create_context, "bulk_add_instances", contextlib.nullcontext)
+        instance_nodes = []
+        variants = set()
+        label = "Creating {} instances".format(self.label)
+        try:
+            with hou.undos.group("AYON {}".format(label)), \
+                    update_mode_context(hou.updateMode.Manual), \
+                    bulk_add(), \
+                    hou.InterruptableOperation(
+                        label, open_interrupt_dialog=True) as operation:
+                for index, node in enumerate(nodes):
+                    operation.updateProgress(index / float(len(nodes)))
+
+                    variant = self.get_bulk_variant(
+                        instance_data["variant"], node, variants)
+                    variants.add(variant)
+                    product_name = self.get_product_name(
+                        project_name,
+                        folder_entity,
+                        task_entity,
+                        variant,
+                        self.create_context.host_name,
+                    )
+                    node_instance_data = copy.deepcopy(instance_data)
+                    node_instance_data["variant"] = variant
+                    node_pre_create_data = dict(
+                        pre_create_data, bulk_node=node)
+                    self.create(product_name, node_instance_data,
+                                node_pre_create_data)
+                    # Not all creators return the instance, but all of them
+                    # store the instance node in the instance data
+                    instance_nodes.append(
+                        hou.node(node_instance_data["instance_node"]))
+        except hou.OperationInterrupted:
+            six.reraise(
+                CreatorError,
+                CreatorError(
+                    "Creating instances was interrupted, created {} of {} "
+                    "instances.".format(len(instance_nodes), len(nodes))),
+                sys.exc_info()[2])
+        finally:
+            if instance_nodes:
+                instance_nodes[0].parent().layoutChildren(
+                    items=instance_nodes)
+
+        self.log.info(
+            "Created %d of %d instances from selection.",
+            len(instance_nodes), len(nodes))
+        instances_by_id = self.create_context.instances_by_id
+        return [
+            instances_by_id[node.path()] for node in instance_nodes
+            if node.path() in instances_by_id
+        ]
+
+    @staticmethod
+    def get_bulk_variant(variant, node, existing):
+        """Return the variant of a bulk created instance for a node.
+
+        SOP nodes are named after their object and node name, since their
+        names are often the same inside different objects, e.g. `OUT`.
+        """
+        name = node.name()
+        if isinstance(node, hou.SopNode):
+            name = "{}_{}".format(node.parent().name(), name)
+        name = re.sub(r"[^a-zA-Z0-9_]", "_", name)
+        result = "{}_{}".format(variant, name)
+        index = 1
+        while result in existing:
+            index += 1
+            result = "{}_{}{}".format(variant, name, index)
+        return result
+
     def lock_parameters(self, node, parameters):
         """Lock list of specified parameters on the node.
 
@@ -233,9 +380,20 @@ class HoudiniCreator(Creator, HoudiniCreatorBase):
             self._remove_instance_from_context(instance)
 
     def get_pre_create_attr_defs(self):
-        return [
+        attrs = [
             BoolDef("use_selection", label="Use selection", default=True)
         ]
+        if self.bulk_create_supported:
+            attrs.append(
+                BoolDef("bulk_create",
+                        label="Instance per selected node",
+                        default=False,
+                        tooltip=(
+                            "Create an instance for each of the selected "
+                            "nodes, named after the node."
+                        ))
+            )
+        return attrs
 
     @staticmethod
     def customize_node_look(
@@ -320,6 +478,9 @@ class HoudiniLoader(load.LoaderPlugin):
     settings_category = SETTINGS_CATEGORY
     use_ayon_entity_uri = False
 
+    # Representation paths resolved in advance by `update_batch`
+    _resolved_paths = None
+
     @classmethod
     def filepath_from_context(cls, context):
         if cls.use_ayon_entity_uri:
@@ -327,22 +488,78 @@ class HoudiniLoader(load.LoaderPlugin):
 
         return super(HoudiniLoader, cls).filepath_from_context(context)
 
+    def resolve_representation_path(self, repre_entity):
+        """Return the filepath of a representation entity.
+
+        Uses the path resolved in advance when running `update_batch`,
+        otherwise resolves it with `get_representation_path`.
+        """
+        if self._resolved_paths:
+            path = self._resolved_paths.get(repre_entity["id"])
+            if path:
+                return path
+        return get_representation_path(repre_entity)
+
+    def update_batch(self, items):
+        """Update many containers at once.
+
+        Representation paths of all items are resolved in one go with a
+        single Anatomy, and all `update` calls run in a single undo group
+        with cooking disabled.
+
+        Arguments:
+            items (List[Tuple[dict, dict]]): Container and the
+                representation context to update it to.
+
+        Returns:
+            Dict[str, float]: Update duration per container node path.
+
+        """
+        if not items:
+            return {}
+
+        project_name = items[0][1]["project"]["name"]
+        anatomy = anatomy_cache.get_anatomy(
+            project_name, items[0][1]["project"])
+        self._resolved_paths = {}
+        for _, context in items:
+            repre_entity = context["representation"]
+            self._resolved_paths[repre_entity["id"]] = (
+                get_representation_path_with_anatomy(repre_entity, anatomy)
+            )
 
-class HoudiniInstancePlugin(pyblish.api.InstancePlugin):
+        timings = {}
+        try:
+            with hou.undos.group("AYON Update {}".format(self.label)), \
+                    update_mode_context(hou.updateMode.Manual):
+                for container, context in items:
+                    start = time.time()
+                    self.update(container, context)
+                    timings[container["objectName"]] = time.time() - start
+        finally:
+            self._resolved_paths = None
+
+        for path, duration in timings.items():
+            self.log.debug("Updated %s in %.3fs", path, duration)
+        return timings
+
+
+class HoudiniInstancePlugin(ProfiledPluginMixin,
+                             pyblish.api.InstancePlugin):
     """Base class for Houdini instance publish plugins."""
 
     hosts = ["houdini"]
     settings_category = SETTINGS_CATEGORY
 
 
-class HoudiniContextPlugin(pyblish.api.ContextPlugin):
+class HoudiniContextPlugin(ProfiledPluginMixin, pyblish.api.ContextPlugin):
     """Base class for Houdini context publish plugins."""
 
     hosts = ["houdini"]
     settings_category = SETTINGS_CATEGORY
 
 
-class HoudiniExtractorPlugin(publish.Extractor):
+class HoudiniExtractorPlugin(ProfiledPluginMixin, publish.Extractor):
     """Base class for Houdini extract plugins.
 
     Note:
@@ -369,10 +586,29 @@ class HoudiniExtractorPlugin(publish.Extractor):
         rop_node = hou.node(instance.data["instance_node"])
         self.log.debug(f"Rendering {rop_node.path()}")
 
+        if not perfmon.is_enabled(instance):
+            with telemetry.sample_resources(instance):
+                self._render_rop_frames(instance, rop_node)
+            return
+
+        settings = perfmon.get_settings(instance.context)
+        capture = perfmon.RenderCapture(
+            rop_node, top_nodes=settings.get("top_nodes", 20))
+        capture.start()
+        try:
+            with telemetry.sample_resources(instance):
+                self._render_rop_frames(instance, rop_node, capture)
+        except Exception:
+            capture.cancel()
+            raise
+        capture.add_representations(instance, *capture.stop())
+
+    def _render_rop_frames(self, instance, rop_node, capture=None):
         frames_to_fix = clique.parse(instance.data.get("frames_to_fix", ""),
                                      "{ranges}")
         if len(set(frames_to_fix)) < 2:
-            render_rop(rop_node)
+            with _maybe_capture(capture):
+                render_rop(rop_node)
             return
 
         # Render only frames to fix
@@ -385,4 +621,11 @@ class HoudiniExtractorPlugin(publish.Extractor):
             )
             # for step to be 1 since clique doesn't support steps.
             frame_range = (first_frame, last_frame, 1)
-            render_rop(rop_node, frame_range=frame_range)
+            with _maybe_capture(capture, frame_range):
+                render_rop(rop_node, frame_range=frame_range)
+
+
+def _maybe_capture(capture, frame_range=None):
+    if capture is None:
+        return contextlib.nullcontext()
+    return capture.frame_range(frame_range)
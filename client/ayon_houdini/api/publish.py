@@ -1,9 +1,11 @@
 import os
+import logging
 
 import hou
 from ayon_core.lib import path_tools
+from ayon_core.settings import get_current_project_settings
 from ayon_deadline.scripts import publish
-from ayon_houdini.api import graph_utils
+from ayon_houdini.api import checksums, exr_scanline, graph_utils
 
 from ayon_houdini.nodes import (
     ax_publisher,
@@ -11,6 +13,8 @@ from ayon_houdini.nodes import (
 )
 
 
+log = logging.getLogger(__name__)
+
 # Constant strings for the types of products that can be published
 RENDER_TYPE = "render"
 GEO_TYPE = "model"
@@ -66,6 +70,59 @@ def submit_to_publish(
             )
         return message, False
     
+    rep_paths = {}
+    for rep_name, rep_path in representations.items():
+        files, _, _, = path_tools.convert_to_sequence(rep_path)
+        rep_paths[rep_name] = [
+            os.path.join(os.path.dirname(rep_path), path)
+            for path in (files or [rep_path])
+        ]
+
+    # Publish scanline copies of tiled EXR renders so they can be reviewed
+    product_type = publish_node.parm("product_type").evalAsString()
+    if product_type == RENDER_TYPE:
+        message += convert_renders_to_scanline(representations, rep_paths)
+    if message:
+        if not silent:
+            hou.ui.displayMessage(
+                message,
+                title="Scanline conversion failed",
+                severity=hou.severityType.Error
+            )
+        return message, False
+
+    # Zero-byte files can't be published
+    for rep_name, paths in rep_paths.items():
+        empty = [
+            os.path.basename(path) for path in paths
+            if os.path.isfile(path) and not os.path.getsize(path)
+        ]
+        if empty:
+            message += "Zero-byte files in representation '{}': {}\n".format(
+                rep_name, ", ".join(empty))
+    if message:
+        if not silent:
+            hou.ui.displayMessage(
+                message,
+                title="Empty files",
+                severity=hou.severityType.Error
+            )
+        return message, False
+
+    # Store a checksum manifest per representation to verify the files
+    # after transfer, when enabled for the product type in the
+    # `ExtractChecksums` settings
+    checksum_settings = get_publish_settings().get("ExtractChecksums", {})
+    if (
+        checksum_settings.get("enabled")
+        and product_type in checksum_settings.get("families", [])
+    ):
+        publish_data["checksums"] = {
+            rep_name: checksums.build_manifest(
+                paths, threads=checksum_settings.get("threads") or 8)
+            for rep_name, paths in rep_paths.items()
+        }
+
     use_hip_version = publish_node.parm("use_hip_version").eval()
     override_version = publish_node.parm("override_version_enable").eval()
     if override_version:
@@ -75,17 +132,11 @@ def submit_to_publish(
         
     folder_path = publish_node.parm("folder_path").evalAsString()
     task_name = publish_node.parm("task").evalAsString()
-    product_type = publish_node.parm("product_type").evalAsString()
     product_name = publish_data.get(
         "product_name", publish_node.parm("product_name").evalAsString()
     )
     publish_data["comment"] = publish_node.parm("comment").evalAsString()
 
-    # Add convert to scanline to instance if it's a render publish
-    # so we convert .exr to scanline during publish
-    #if product_type == "render":
-    #    publish_data["convertToScanline"] = True
-
     # Collect workfile
     publish_data["source"] = hou.hipFile.path()
 
@@ -136,6 +187,58 @@ def submit_to_publish(
         return message, False
 
 
+def get_publish_settings():
+    """Return the Houdini publish plugin settings of the current project."""
+    project_settings = get_current_project_settings()
+    return project_settings["houdini"]["publish"]
+
+
+def convert_renders_to_scanline(representations, rep_paths):
+    """Publish scanline copies of the tiled EXR frames of representations.
+
+    The copies are written to a `scanline/<representation>` folder next to
+    the frames, the tiled frames are kept. The `representations` and
+    `rep_paths` are updated to the copies of the converted representations.
+    Only runs when the `ExtractRenderScanline` publish plugin is enabled in
+    the project settings.
+
+    Returns:
+        str: Error message of the frames that failed to convert.
+
+    """
+    settings = get_publish_settings().get("ExtractRenderScanline", {})
+    if not settings.get("enabled"):
+        return ""
+
+    oiiotool = exr_scanline.find_oiiotool()
+    if oiiotool is None:
+        return ""
+
+    message = ""
+    for rep_name, paths in rep_paths.items():
+        rep_path = representations[rep_name]
+        if not rep_path.lower().endswith(".exr"):
+            continue
+        staging_dir = os.path.join(
+            os.path.dirname(rep_path), "scanline", rep_name)
+        result = exr_scanline.convert_to_scanline(
+            paths,
+            oiiotool,
+            staging_dir,
+            workers=settings.get("workers") or None
+        )
+        log.info("Representation '%s': %s", rep_name, result.get_report())
+        message += "".join(
+            "Failed to convert '{}' to scanline: {}\n".format(path, error)
+            for path, error in sorted(result.failed.items())
+        )
+        if result.converted and not result.failed:
+            representations[rep_name] = os.path.join(
+                staging_dir, os.path.basename(rep_path))
+            rep_paths[rep_name] = [result.paths[path] for path in paths]
+    return message
+
+
 def submit_inputs_to_publish(submitter_node):
     """Traverses up over all the inputs of AX Render Publisher and publishes the one that can be published"""
     success = True
@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+"""Opt-in profiling of the Houdini publish plugins.
+
+The `process` method of all plugins based on `HoudiniInstancePlugin`,
+`HoudiniContextPlugin` and `HoudiniExtractorPlugin` is wrapped with
+`profile_process`. When profiling is enabled, through the
+`houdini/publish/ExtractPublishProfile` project settings or by setting the
+`AYON_HOUDINI_PUBLISH_PROFILE` environment variable to `1`, each call
+records:
+
+    - wall time
+    - CPU time of the Houdini process
+    - increase of the peak resident memory of the Houdini process
+    - number of cooks of the instance's ROP and output network
+
+The records are stored on the publish context under
+`houdiniPublishProfile` and are reported by the `ExtractPublishProfile`
+plugin. When profiling is disabled the wrapper only checks the setting.
+
+"""
+import sys
+import time
+import logging
+import functools
+import threading
+
+import hou
+
+from ayon_core.lib import env_value_to_bool
+
+from .validation_cache import get_upstream_nodes
+
+try:
+    import resource
+except ImportError:
+    # Not available on Windows
+    resource = None
+
+
+log = logging.getLogger(__name__)
+
+CONTEXT_KEY = "houdiniPublishProfile"
+ENV_KEY = "AYON_HOUDINI_PUBLISH_PROFILE"
+
+_state = threading.local()
+
+
+def is_enabled(context):
+    """Return whether publish profiling is enabled for the publish."""
+    enabled = context.data.get("houdiniPublishProfileEnabled")
+    if enabled is None:
+        enabled = env_value_to_bool(ENV_KEY, default=False)
+        if not enabled:
+            enabled = (
+                context.data.get("project_settings", {})
+                .get("houdini", {})
+                .get("publish", {})
+                .get("ExtractPublishProfile", {})
+                .get("profile_plugins", False)
+            )
+        context.data["houdiniPublishProfileEnabled"] = enabled
+    return enabled
+
+
+def get_peak_rss():
+    """Return the peak resident memory of the process in MB, if known."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        # Reported in bytes on macOS and in kilobytes on Linux
+        return peak / 1024.0 ** 2
+    return peak / 1024.0
+
+
+def _get_cook_nodes(instance):
+    """Return the nodes to count cooks of for an instance.
+
+    Counting cooks of all nodes in the scene would be too slow to do for
+    each plugin, so only the instance node and the network upstream of its
+    output node are sampled. The nodes are looked up once per instance.
+    """
+    if instance is None:
+        return []
+
+    output_node = instance.data.get("output_node")
+    if not isinstance(output_node, hou.Node):
+        output_node = None
+
+    # The output node is only known after collection
+    key = output_node.path() if output_node is not None else None
+    cached = instance.data.get("profileCookNodes")
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    nodes = []
+    rop_node = hou.node(instance.data.get("instance_node") or "")
+    if rop_node is not None:
+        nodes.append(rop_node)
+    if output_node is not None:
+        nodes.extend(get_upstream_nodes(output_node))
+    instance.data["profileCookNodes"] = (key, nodes)
+    return nodes
+
+
+def _get_cook_count(nodes):
+    count = 0
+    for node in nodes:
+        try:
+            count += node.cookCount()
+        except (hou.ObjectWasDeleted, AttributeError):
+            continue
+    return count
+
+
+def profile_process(process):
+    """Decorate a plugin's `process` method to record its profile.
+
+    The argument name of the wrapper matches the decorated method, because
+    pyblish inspects it to decide whether the plugin processes the context
+    or the instances.
+    """
+    if getattr(process, "__profiled__", False):
+        return process
+
+    def _run(self, item, instance):
+        context = item if instance is None else instance.context
+        if (
+            not getattr(self, "profile", True)
+            or getattr(_state, "active", False)
+            or not is_enabled(context)
+        ):
+            return process(self, item)
+
+        cook_nodes = _get_cook_nodes(instance)
+        cooks = _get_cook_count(cook_nodes)
+        rss = get_peak_rss()
+        cpu = time.process_time()
+        start = time.perf_counter()
+
+        # Nested calls, e.g. through `super().process()`, are part of the
+        # outer record
+        _state.active = True
+        try:
+            return process(self, item)
+        finally:
+            _state.active = False
+            wall = time.perf_counter() - start
+            record = {
+                "plugin": self.__class__.__name__,
+                "label": getattr(self, "label", None),
+                "order": self.order,
+                "instance": (
+                    (instance.data.get("instance_node") or str(instance))
+                    if instance is not None else None
+                ),
+                "wall": wall,
+                "cpu": time.process_time() - cpu,
+                "peak_rss_delta": (
+                    get_peak_rss() - rss if rss is not None else None
+                ),
+                "cooks": (
+                    _get_cook_count(cook_nodes) - cooks
+                    if cook_nodes else None
+                )
+            }
+            context.data.setdefault(CONTEXT_KEY, []).append(record)
+
+    if "context" in process.__code__.co_varnames[:2]:
+        @functools.wraps(process)
+        def wrapper(self, context):
+            return _run(self, context, None)
+    else:
+        @functools.wraps(process)
+        def wrapper(self, instance):
+            return _run(self, instance, instance)
+
+    wrapper.__profiled__ = True
+    return wrapper
+
+
+class ProfiledPluginMixin(object):
+    """Wrap `process` of subclasses with `profile_process`.
+
+    Set `profile = False` on a plugin to exclude it from profiling.
+    """
+
+    profile = True
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        process = cls.__dict__.get("process")
+        if process is not None:
+            cls.process = profile_process(process)
+
+
+def get_report(records, limit=None):
+    """Return the profile records as text table, slowest plugins first."""
+    records = sorted(records, key=lambda r: r["wall"], reverse=True)
+    if limit:
+        records = records[:limit]
+
+    lines = ["{:>9} {:>9} {:>9} {:>7}  {}".format(
+        "wall (s)", "cpu (s)", "rss (MB)", "cooks", "plugin (instance)")]
+    for record in records:
+        rss = record["peak_rss_delta"]
+        cooks = record["cooks"]
+        lines.append("{:>9.3f} {:>9.3f} {:>9} {:>7}  {}{}".format(
+            record["wall"],
+            record["cpu"],
+            "-" if rss is None else "{:.1f}".format(rss),
+            "-" if cooks is None else cooks,
+            record["plugin"],
+            " ({})".format(record["instance"]) if record["instance"] else ""
+        ))
+    return "\n".join(lines)
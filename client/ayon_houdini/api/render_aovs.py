@@ -0,0 +1,387 @@
+# -*- coding: utf-8 -*-
+"""Table-driven AOV introspection of render ROPs.
+
+The render product collectors and the AX Render Publisher need to know the
+AOVs a render ROP writes. Each renderer stores its AOVs in a multiparm with
+renderer-specific parm names, which are described by `AOV_MULTIPARMS`. The
+multiparm instances are read in bulk per node.
+
+The result describes each output as a file pattern with a `%0Nd` frame
+token, so frame lists are only built when actually needed:
+
+    >>> outputs = get_render_outputs(rop, frame_range=(1001, 1100))
+    >>> for product in outputs.products:
+    ...     print(product.aov, product.pattern)
+    >>> files_by_aov = outputs.get_expected_files()
+
+"""
+import os
+import re
+import logging
+from typing import Dict, List, Optional, Tuple
+
+import attr
+import hou
+
+from .lib import evalParmNoFrame
+
+
+log = logging.getLogger(__name__)
+
+# Field kinds of the multiparm fields
+VALUE = "value"     # `hou.Parm.eval()`
+STRING = "string"   # `hou.Parm.evalAsString()`
+PATH = "path"       # path with frame tokens, see `lib.evalParmNoFrame`
+
+
+@attr.s(frozen=True)
+class MultiparmSpec(object):
+    """Description of the AOV multiparm of a renderer."""
+    count: str = attr.ib()   # multiparm count parm name
+    # {key: (parm name template with index "{}", field kind)}
+    fields: Dict[str, Tuple[str, str]] = attr.ib()
+    # Keys of fields that must all be truthy for an AOV to be included,
+    # other fields are only evaluated for included AOVs.
+    required: Tuple[str, ...] = attr.ib(default=())
+
+
+AOV_MULTIPARMS = {
+    "arnold": MultiparmSpec(
+        count="ar_aovs",
+        fields={
+            "enabled": ("ar_enable_aov{}", VALUE),
+            "separate": ("ar_aov_separate{}", VALUE),
+            "path": ("ar_aov_separate_file{}", VALUE),
+            "use_layer_name": ("ar_aov_exr_enable_layer_name{}", VALUE),
+            "layer_name": ("ar_aov_exr_layer_name{}", VALUE),
+            "label": ("ar_aov_label{}", PATH),
+        },
+        required=("enabled", "separate", "path")
+    ),
+    "ifd": MultiparmSpec(
+        count="vm_numaux",
+        fields={
+            "variable": ("vm_variable_plane{}", VALUE),
+            "use_file": ("vm_usefile_plane{}", VALUE),
+            "path": ("vm_filename_plane{}", PATH),
+        },
+        required=("variable", "use_file", "path")
+    ),
+    "Redshift_ROP": MultiparmSpec(
+        count="RS_aov",
+        fields={
+            "enabled": ("RS_aovEnable_{}", VALUE),
+            "suffix": ("RS_aovSuffix_{}", VALUE),
+            "prefix": ("RS_aovCustomPrefix_{}", PATH),
+            "id": ("RS_aovID_{}", STRING),
+        },
+        required=("enabled",)
+    ),
+}
+
+# Beauty output parm per renderer
+BEAUTY_PARMS = {
+    "arnold": "ar_picture",
+    "ifd": "vm_picture",
+    "Redshift_ROP": "RS_outputFileNamePrefix",
+    "vray_renderer": "SettingsOutput_img_file_path",
+    "karma": "picture",
+}
+
+@attr.s
+class RenderProduct(object):
+    """Data class for a single render output file (sequence)."""
+    aov: str = attr.ib()        # AOV name, may be empty for the beauty
+    path: str = attr.ib()       # path with `#` frame tokens
+    parm: Optional["hou.Parm"] = attr.ib(default=None)  # source parm
+
+    @property
+    def pattern(self):
+        """Return the path with `%0Nd` frame token for sequences."""
+        return get_frame_pattern(self.path)
+
+    @property
+    def is_sequence(self):
+        return "%" in os.path.basename(self.pattern)
+
+    def get_expected_files(self, frame_start, frame_end):
+        """Return the file path or list of file paths for a frame range."""
+        if not self.is_sequence:
+            return self.pattern
+
+        directory, fname = os.path.split(self.pattern)
+        return [
+            os.path.join(directory, fname % frame).replace("\\", "/")
+            for frame in range(int(frame_start), int(frame_end) + 1)
+        ]
+
+
+@attr.s
+class RenderOutputs(object):
+    """Render products of a render ROP, the first one is the beauty."""
+    products: List[RenderProduct] = attr.ib(factory=list)
+    # True when all AOVs are written into the beauty file
+    multipart: bool = attr.ib(default=True)
+    frame_range: Optional[Tuple[int, int]] = attr.ib(default=None)
+
+    @property
+    def beauty(self):
+        return self.products[0] if self.products else None
+
+    @property
+    def aovs(self):
+        return self.products[1:]
+
+    def get_expected_files(self, frame_range=None):
+        """Return the expected files by AOV name for the frame range."""
+        frame_range = frame_range or self.frame_range
+        if frame_range is None:
+            raise ValueError("No frame range to expand the patterns with.")
+        return {
+            product.aov: product.get_expected_files(*frame_range)
+            for product in self.products
+        }
+
+
+def get_frame_pattern(path):
+    """Return path with `#` frame tokens in the file name as `%0Nd`."""
+    directory, fname = os.path.split(path)
+    if "#" not in fname:
+        return path
+
+    def replace(match):
+        return "%0{}d".format(len(match.group()))
+
+    return os.path.join(directory, re.sub("#+", replace, fname))
+
+
+def get_render_product_name(prefix, suffix):
+    """Return the output filename using the AOV prefix and suffix"""
+
+    # When AOV is explicitly defined in prefix we just swap it out
+    # directly with the AOV suffix to embed it.
+    # Note: '$AOV' seems to be evaluated in the parameter as '%AOV%'
+    if "%AOV%" in prefix:
+        # It seems that when some special separator characters are present
+        # before the %AOV% token that Redshift will secretly remove it if
+        # there is no suffix for the current product, for example:
+        # foo_%AOV% -> foo.exr
+        pattern = "%AOV%" if suffix else "[._-]?%AOV%"
+        return re.sub(pattern, suffix or "", prefix, flags=re.IGNORECASE)
+
+    if suffix:
+        # Add ".{suffix}" before the extension
+        prefix_base, ext = os.path.splitext(prefix)
+        return prefix_base + "." + suffix + ext
+    return prefix
+
+
+def _eval_field(parm, kind):
+    if kind == PATH:
+        return evalParmNoFrame(parm.node(), parm.name())
+    if kind == STRING:
+        return parm.evalAsString()
+    return parm.eval()
+
+
+def read_multiparm(node, spec):
+    """Return the AOV rows of a node as described by a `MultiparmSpec`.
+
+    All multiparm instances are fetched with a single call. The rows are
+    not cached, since paths evaluated from expressions or environment
+    variables can change without any raw value changing.
+
+    Arguments:
+        node (hou.Node): The node with the AOV multiparm.
+        spec (MultiparmSpec): Description of the multiparm.
+
+    Returns:
+        List[Dict[str, Any]]: Field values per included AOV. The `index`
+            key holds the multiparm instance index.
+
+    """
+    count_parm = node.parm(spec.count)
+    if count_parm is None:
+        return []
+
+    instances = {
+        parm.name(): parm for parm in count_parm.multiParmInstances()
+    }
+    rows = []
+    optional = [
+        field for field in spec.fields if field not in spec.required
+    ]
+    for index in range(1, count_parm.eval() + 1):
+        row = {"index": index}
+        for field in list(spec.required) + optional:
+            template, kind = spec.fields[field]
+            parm = instances.get(template.format(index))
+            row[field] = _eval_field(parm, kind) if parm else None
+            if field in spec.required and not row[field]:
+                row = None
+                break
+        if row is not None:
+            rows.append(row)
+    return rows
+
+
+def _get_arnold_outputs(rop, prefix):
+    outputs = RenderOutputs()
+    outputs.products.append(RenderProduct(
+        "", get_render_product_name(prefix, None), rop.parm("ar_picture")))
+
+    for row in read_multiparm(rop, AOV_MULTIPARMS["arnold"]):
+        if row["use_layer_name"]:
+            label = row["layer_name"]
+        else:
+            label = row["label"]
+
+        # NOTE:
+        #  we don't collect the actual AOV path but rather assume
+        #    the user has used the default beauty path (collected above)
+        #    with the AOV name before the extension.
+        #  Also, Note that Ayon Publishing does not require a specific file
+        #    name, as it will be renamed according to the naming conventions
+        #    set in the publish template.
+        outputs.products.append(RenderProduct(
+            label,
+            get_render_product_name(prefix, label),
+            rop.parm("ar_aov_separate_file{}".format(row["index"]))
+        ))
+        outputs.multipart = False
+    return outputs
+
+
+def _get_mantra_outputs(rop, prefix):
+    outputs = RenderOutputs()
+    outputs.products.append(RenderProduct(
+        "beauty", prefix, rop.parm("vm_picture")))
+
+    # TODO: This logic doesn't take into considerations
+    #       cryptomatte defined in 'Images > Cryptomatte'
+    for row in read_multiparm(rop, AOV_MULTIPARMS["ifd"]):
+        outputs.products.append(RenderProduct(
+            row["variable"],
+            row["path"],
+            rop.parm("vm_filename_plane{}".format(row["index"]))
+        ))
+        outputs.multipart = False
+    return outputs
+
+
+def _get_redshift_outputs(rop, prefix):
+    beauty_suffix = rop.evalParm("RS_outputBeautyAOVSuffix")
+    full_exr_mode = (rop.evalParm("RS_outputMultilayerMode") == "2")
+    if full_exr_mode:
+        # Ignore beauty suffix if full mode is enabled
+        # As this is what the rop does.
+        beauty_suffix = ""
+
+    outputs = RenderOutputs()
+    outputs.products.append(RenderProduct(
+        beauty_suffix,
+        get_render_product_name(prefix, beauty_suffix),
+        rop.parm("RS_outputFileNamePrefix")
+    ))
+
+    aovs_rop = rop.parm("RS_aovGetFromNode").evalAsNode() or rop
+    if aovs_rop.evalParm("RS_aovAllAOVsDisabled"):
+        return outputs
+
+    for row in read_multiparm(aovs_rop, AOV_MULTIPARMS["Redshift_ROP"]):
+        if row["id"] != "CRYPTOMATTE" and full_exr_mode:
+            continue
+
+        parm = None
+        aov_prefix = row["prefix"]
+        if aov_prefix:
+            parm = aovs_rop.parm(
+                "RS_aovCustomPrefix_{}".format(row["index"]))
+        else:
+            aov_prefix = prefix
+
+        outputs.products.append(RenderProduct(
+            row["suffix"],
+            get_render_product_name(aov_prefix, row["suffix"]),
+            parm
+        ))
+        outputs.multipart = False
+    return outputs
+
+
+def _get_vray_outputs(rop, prefix, suffix="<reName>"):
+    # Remove aov suffix from the product: `prefix.aov_suffix` -> `prefix`
+    outputs = RenderOutputs()
+    outputs.products.append(RenderProduct(
+        "",
+        prefix.replace(".{}".format(suffix), ""),
+        rop.parm("SettingsOutput_img_file_path")
+    ))
+
+    # need a rewrite
+    re_path = rop.evalParm("render_network_render_channels")
+    channels_node = hou.node(re_path) if re_path else None
+    if channels_node is None:
+        return outputs
+
+    for element in channels_node.children():
+        if element.shaderName() == "vray:SettingsRenderChannels":
+            continue
+        aov = str(element)
+        outputs.products.append(
+            RenderProduct(aov, prefix.replace(suffix, aov)))
+        outputs.multipart = False
+    return outputs
+
+
+def _get_karma_outputs(rop, prefix):
+    # By default karma render is a multipart Exr.
+    return RenderOutputs(
+        products=[RenderProduct("beauty", prefix, rop.parm("picture"))]
+    )
+
+
+_OUTPUT_FUNCTIONS = {
+    "arnold": _get_arnold_outputs,
+    "ifd": _get_mantra_outputs,
+    "Redshift_ROP": _get_redshift_outputs,
+    "vray_renderer": _get_vray_outputs,
+    "karma": _get_karma_outputs,
+}
+
+
+def is_supported(rop):
+    """Return whether the render ROP's AOVs can be introspected."""
+    return rop.type().name() in _OUTPUT_FUNCTIONS
+
+
+def get_render_outputs(rop, frame_range=None, include_aovs=True):
+    """Return the render products of a render ROP.
+
+    Arguments:
+        rop (hou.RopNode): The render ROP.
+        frame_range (Optional[Tuple[int, int]]): Inclusive frame range to
+            expand the file patterns with in `get_expected_files`.
+        include_aovs (bool): When disabled only the beauty is returned.
+
+    Returns:
+        RenderOutputs: The render products.
+
+    Raises:
+        ValueError: When the ROP type is not supported.
+
+    """
+    node_type = rop.type().name()
+    func = _OUTPUT_FUNCTIONS.get(node_type)
+    if func is None:
+        raise ValueError(
+            "Unsupported render ROP type: {}".format(node_type))
+
+    prefix = evalParmNoFrame(rop, BEAUTY_PARMS[node_type])
+    outputs = func(rop, prefix)
+    if not include_aovs:
+        outputs.products = outputs.products[:1]
+        outputs.multipart = True
+
+    outputs.frame_range = frame_range
+    return outputs
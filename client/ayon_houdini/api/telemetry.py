@@ -0,0 +1,343 @@
+# -*- coding: utf-8 -*-
+"""Background resource sampling of the Houdini process during extraction.
+
+A `ResourceSampler` thread reads `/proc` for the Houdini process and its
+child processes, e.g. renderers like `husk` or `mantra`, at a fixed
+interval. It records CPU usage, resident memory and bytes read and written
+by the process tree. A summary is stored under
+`instance.data["resourceTelemetry"]`, e.g. for farm submissions to pick
+groups and memory limits:
+
+    >>> with sample_resources(instance):
+    ...     render_rop(rop_node)
+    >>> instance.data["resourceTelemetry"]["peakRss"]
+
+The samples are written as a compact time series, one JSON list per line
+with the Unix time, CPU %, RSS and bytes read and written
+since the previous sample, to the `samplesFile` of the summary in the
+staging dir.
+
+Enable it in the `houdini/publish/ExtractResourceTelemetry` project
+settings or by setting the `AYON_HOUDINI_TELEMETRY` environment variable
+to `1`. Sampling is only available on Linux, elsewhere it does nothing.
+
+"""
+import os
+import json
+import time
+import logging
+import tempfile
+import threading
+import contextlib
+
+from ayon_core.lib import env_value_to_bool
+
+
+log = logging.getLogger(__name__)
+
+ENV_KEY = "AYON_HOUDINI_TELEMETRY"
+SETTINGS_KEY = "ExtractResourceTelemetry"
+SAMPLES_FILE = "{}_telemetry.jsonl"
+
+PROC = "/proc"
+
+# Default sample interval in seconds
+INTERVAL = 1.0
+
+try:
+    CLOCK_TICKS = os.sysconf("SC_CLK_TCK")
+    PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+except (AttributeError, ValueError, OSError):
+    CLOCK_TICKS = PAGE_SIZE = None
+
+
+def is_supported():
+    return CLOCK_TICKS is not None and os.path.isdir(PROC)
+
+
+def get_settings(context):
+    """Return the resource telemetry settings of the publish."""
+    settings = dict(
+        context.data.get("project_settings", {})
+        .get("houdini", {})
+        .get("publish", {})
+        .get(SETTINGS_KEY, {})
+    )
+    if env_value_to_bool(ENV_KEY, default=False):
+        settings["enabled"] = True
+    return settings
+
+
+def _read(path):
+    try:
+        with open(path, "r") as f:
+            return f.read()
+    except (IOError, OSError):
+        return None
+
+
+def _read_stat(pid):
+    """Return (cpu ticks, rss bytes) of a pid.
+
+    The cpu ticks include the ticks of the exited child processes the pid
+    waited for, so ticks of short lived children are not lost when they
+    exit between two samples.
+    """
+    data = _read("{}/{}/stat".format(PROC, pid))
+    if not data:
+        return None
+    # The process name may contain spaces, fields start after its ")"
+    fields = data[data.rfind(")") + 2:].split()
+    return (
+        sum(int(value) for value in fields[11:15]),
+        int(fields[21]) * PAGE_SIZE
+    )
+
+
+def _read_io(pid):
+    """Return (read bytes, written bytes) of a pid."""
+    data = _read("{}/{}/io".format(PROC, pid))
+    if not data:
+        return 0, 0
+    values = {}
+    for line in data.splitlines():
+        key, _, value = line.partition(":")
+        values[key] = value.strip()
+    return (
+        int(values.get("read_bytes", 0)),
+        int(values.get("write_bytes", 0))
+    )
+
+
+def _get_children(pid):
+    """Return the pids of the direct child processes of a pid."""
+    task_dir = "{}/{}/task".format(PROC, pid)
+    try:
+        tids = os.listdir(task_dir)
+    except (IOError, OSError):
+        return []
+    pids = []
+    for tid in tids:
+        data = _read("{}/{}/children".format(task_dir, tid))
+        if data:
+            pids.extend(int(child) for child in data.split())
+    return pids
+
+
+def _get_descendants(root_pid):
+    """Return the pids of all child processes of a pid, recursively."""
+    pids = []
+    stack = [root_pid]
+    while stack:
+        children = _get_children(stack.pop())
+        pids.extend(children)
+        stack.extend(children)
+    return pids
+
+
+class ResourceSampler(object):
+    """Sample resource usage of a process and its children in a thread.
+
+    Arguments:
+        pid (Optional[int]): Root process, defaults to the current process.
+        interval (float): Sample interval in seconds.
+        samples_path (Optional[str]): File to append the samples to as
+            JSON lines.
+
+    """
+
+    def __init__(self, pid=None, interval=INTERVAL, samples_path=None):
+        self.pid = pid or os.getpid()
+        self.interval = interval
+        self.samples_path = samples_path
+        self.samples = 0
+        self.peak_rss = 0
+        self.peak_cpu = 0.0
+        self.cpu_seconds = 0.0
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.duration = 0.0
+
+        self._ticks = 0
+        self._io = {}
+        self._start = None
+        self._last = None
+        self._stop = threading.Event()
+        self._thread = None
+        self._samples_file = None
+
+    def start(self):
+        if not is_supported():
+            log.debug("Resource sampling is not supported on this platform.")
+            return
+        self._start = self._last = time.time()
+        if self.samples_path:
+            try:
+                self._samples_file = open(self.samples_path, "a")
+            except (IOError, OSError):
+                log.debug("Unable to write samples to %s",
+                          self.samples_path, exc_info=True)
+        self._sample(record=False)
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop sampling and return the summary.
+
+        Returns:
+            Optional[dict]: The summary, None if sampling is not supported.
+
+        """
+        if self._thread is None:
+            return None
+        self._stop.set()
+        self._thread.join()
+        self._sample()
+        self.duration = time.time() - self._start
+        if self._samples_file is not None:
+            self._samples_file.close()
+            self._samples_file = None
+        return self.get_summary()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self._sample()
+            except Exception:
+                log.debug("Resource sampling failed.", exc_info=True)
+
+    def _sample(self, record=True):
+        now = time.time()
+        elapsed = now - self._last
+        self._last = now
+
+        ticks = rss = read = written = 0
+        current = {}
+        for pid in [self.pid] + _get_descendants(self.pid):
+            stat = _read_stat(pid)
+            if stat is None:
+                continue
+            pid_ticks, pid_rss = stat
+            ticks += pid_ticks
+            rss += pid_rss
+
+            # New child processes are counted from their start, only count
+            # increases as a pid may have been reused
+            pid_read, pid_written = _read_io(pid)
+            current[pid] = (pid_read, pid_written)
+            previous = self._io.get(pid, (0, 0)) if record else current[pid]
+            read += max(0, pid_read - previous[0])
+            written += max(0, pid_written - previous[1])
+        self._io = current
+
+        # Ticks of exited children move to the cumulative ticks of their
+        # parent, so the total of the tree only grows
+        cpu_ticks = max(0, ticks - self._ticks)
+        self._ticks = ticks
+
+        if not record or elapsed <= 0:
+            return
+
+        cpu_seconds = float(cpu_ticks) / CLOCK_TICKS
+        cpu = round(100.0 * cpu_seconds / elapsed, 1)
+        self.samples += 1
+        self.cpu_seconds += cpu_seconds
+        self.peak_cpu = max(self.peak_cpu, cpu)
+        self.peak_rss = max(self.peak_rss, rss)
+        self.bytes_read += read
+        self.bytes_written += written
+
+        if self._samples_file is not None:
+            self._samples_file.write(json.dumps(
+                [round(now, 2), cpu, rss, read, written],
+                separators=(",", ":")
+            ) + "\n")
+
+    def get_summary(self):
+        duration = self.duration or 1.0
+        return {
+            "samplesFile": self.samples_path,
+            "duration": round(self.duration, 2),
+            "interval": self.interval,
+            "samples": self.samples,
+            "peakRss": self.peak_rss,
+            "meanCpu": round(100.0 * self.cpu_seconds / duration, 1),
+            "peakCpu": self.peak_cpu,
+            "bytesRead": self.bytes_read,
+            "bytesWritten": self.bytes_written,
+            "readThroughput": int(self.bytes_read / duration),
+            "writeThroughput": int(self.bytes_written / duration)
+        }
+
+
+def merge_summaries(first, second):
+    """Merge the summaries of two sampled extractions of an instance."""
+    duration = first["duration"] + second["duration"]
+    bytes_read = first["bytesRead"] + second["bytesRead"]
+    bytes_written = first["bytesWritten"] + second["bytesWritten"]
+    return {
+        "samplesFile": second.get("samplesFile") or first.get("samplesFile"),
+        "duration": round(duration, 2),
+        "interval": second["interval"],
+        "samples": first["samples"] + second["samples"],
+        "peakRss": max(first["peakRss"], second["peakRss"]),
+        "meanCpu": round(
+            (first["meanCpu"] * first["duration"]
+             + second["meanCpu"] * second["duration"]) / duration, 1
+        ) if duration else 0.0,
+        "peakCpu": max(first["peakCpu"], second["peakCpu"]),
+        "bytesRead": bytes_read,
+        "bytesWritten": bytes_written,
+        "readThroughput": int(bytes_read / (duration or 1.0)),
+        "writeThroughput": int(bytes_written / (duration or 1.0))
+    }
+
+
+@contextlib.contextmanager
+def sample_resources(instance):
+    """Sample resource usage while the context is active.
+
+    Does nothing unless enabled in the settings. The summary is stored in
+    `instance.data["resourceTelemetry"]`, merged with the summary of
+    previous samplings of the instance. The samples are appended to a JSON
+    lines file in the staging dir of the instance.
+
+    Yields:
+        Optional[ResourceSampler]: The sampler, None when disabled.
+
+    """
+    settings = get_settings(instance.context)
+    if not settings.get("enabled"):
+        yield None
+        return
+
+    staging_dir = instance.data.get("stagingDir")
+    if staging_dir:
+        os.makedirs(staging_dir, exist_ok=True)
+    else:
+        staging_dir = tempfile.mkdtemp(prefix="ayon_telemetry_")
+    samples_path = os.path.join(
+        staging_dir, SAMPLES_FILE.format(instance.data.get(
+            "productName", instance.name)))
+    sampler = ResourceSampler(
+        interval=settings.get("interval") or INTERVAL,
+        samples_path=samples_path
+    )
+    sampler.start()
+    try:
+        yield sampler
+    finally:
+        summary = sampler.stop()
+        if summary is not None:
+            existing = instance.data.get("resourceTelemetry")
+            if existing:
+                summary = merge_summaries(existing, summary)
+            instance.data["resourceTelemetry"] = summary
+            log.debug(
+                "Peak RSS %.1f MB, mean CPU %.1f%%, read %.1f MB/s, "
+                "write %.1f MB/s over %.1fs",
+                summary["peakRss"] / 1024.0 ** 2, summary["meanCpu"],
+                summary["readThroughput"] / 1024.0 ** 2,
+                summary["writeThroughput"] / 1024.0 ** 2,
+                summary["duration"]
+            )
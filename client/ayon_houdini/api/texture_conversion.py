@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+"""Convert textures to mipmapped render textures once, cached by content.
+
+Textures are converted with `imaketx` of the Houdini installation or
+`maketx` of OpenImageIO. Every conversion runs in its own converter
+process, with the processes spread over the cores of the machine:
+
+    >>> converter = find_converter()
+    >>> result = convert_textures(paths, converter, extension=".tx")
+    >>> result.converted[paths[0]]
+    '/tmp/ayon_houdini_texture_cache/maketx-xxh3_64-8f3c...-1048576.tx'
+
+Converted textures are stored in a cache folder by the hash of the source
+content and the converter, so an unchanged texture is never converted
+again, also when it was renamed or moved.
+
+"""
+import os
+import time
+import shutil
+import logging
+import tempfile
+import threading
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+import attr
+
+from .checksums import ALGORITHM, hash_file
+
+
+log = logging.getLogger(__name__)
+
+CONVERTERS = ("imaketx", "maketx")
+
+# Textures that are already mipmapped render textures
+CONVERTED_EXTENSIONS = {".tx", ".rat"}
+
+
+@attr.s
+class Converter(object):
+    """Data class for a texture converter executable."""
+    name: str = attr.ib()           # "imaketx" or "maketx"
+    args = attr.ib(factory=list)    # executable and its base arguments
+
+    def get_args(self, source, destination, threads=1):
+        if self.name == "maketx":
+            return self.args + [
+                "--threads", str(threads), "-o", destination, source
+            ]
+        # `imaketx` picks the output format by the file extension
+        return self.args + [source, destination]
+
+
+@attr.s
+class ConversionResult(object):
+    """Data class for the result of converting textures."""
+    converted = attr.ib(factory=dict)   # source -> converted texture
+    failed = attr.ib(factory=dict)      # source -> error message
+    reused: int = attr.ib(default=0)
+    seconds: float = attr.ib(default=0.0)
+
+    def get_report(self):
+        return (
+            "Converted {} textures, reused {} from the cache, {} failed "
+            "in {:.1f}s.".format(
+                len(self.converted) - self.reused, self.reused,
+                len(self.failed), self.seconds
+            )
+        )
+
+
+def _find_executable(name):
+    path = shutil.which(name)
+    if path:
+        return [path]
+
+    if name == "imaketx" and os.getenv("HFS"):
+        for filename in ("imaketx", "imaketx.exe"):
+            path = os.path.join(os.environ["HFS"], "bin", filename)
+            if os.path.isfile(path):
+                return [path]
+
+    if name == "maketx":
+        # OpenImageIO tools shipped with AYON
+        try:
+            from ayon_core.lib import get_oiio_tool_args
+            return get_oiio_tool_args("maketx")
+        except Exception:
+            log.debug("Unable to find AYON maketx.", exc_info=True)
+    return None
+
+
+def find_converter(names=CONVERTERS):
+    """Return the first available texture converter.
+
+    Arguments:
+        names (Iterable[str]): Converter names in order of preference.
+
+    Returns:
+        Optional[Converter]: The converter, None if none is available.
+
+    """
+    for name in names:
+        args = _find_executable(name)
+        if args:
+            return Converter(name=name, args=list(args))
+    return None
+
+
+def get_cache_root(root=None):
+    return os.path.expandvars(os.path.expanduser(
+        root or os.path.join(tempfile.gettempdir(),
+                             "ayon_houdini_texture_cache")
+    ))
+
+
+def _get_cache_name(path, converter):
+    size, digest = hash_file(path)
+    return "{}-{}-{}-{}".format(converter.name, ALGORITHM, digest, size)
+
+
+def needs_conversion(path):
+    return os.path.splitext(path)[1].lower() not in CONVERTED_EXTENSIONS
+
+
+def convert_textures(
+    paths, converter, extension=".tx", cache_root=None, workers=None
+):
+    """Convert textures in parallel, reusing cached conversions.
+
+    Arguments:
+        paths (Iterable[str]): The source textures.
+        converter (Converter): The converter to use.
+        extension (str): Extension of the converted textures, e.g. ".tx"
+            or ".rat".
+        cache_root (Optional[str]): The cache folder, defaults to a folder
+            in the temp directory.
+        workers (Optional[int]): Number of concurrent converter processes,
+            defaults to half of the cores.
+
+    Returns:
+        ConversionResult: The converted textures by source path.
+
+    """
+    start = time.time()
+    cpu_count = os.cpu_count() or 1
+    workers = workers or max(1, cpu_count // 2)
+    threads = max(1, cpu_count // workers)
+    cache_root = get_cache_root(cache_root)
+    os.makedirs(cache_root, exist_ok=True)
+
+    paths = sorted(set(paths))
+    result = ConversionResult()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        names = list(executor.map(
+            lambda path: _get_cache_name(path, converter), paths))
+
+    jobs = {}
+    for source, name in zip(paths, names):
+        cached = os.path.join(cache_root, name + extension)
+        if os.path.isfile(cached):
+            result.converted[source] = cached
+            result.reused += 1
+        else:
+            jobs[source] = cached
+
+    def _convert(source, cached):
+        # Keep the extension so the converter picks the output format
+        tmp_path = "{}.{}.{}.tmp{}".format(
+            cached[:-len(extension)], os.getpid(), threading.get_ident(),
+            extension
+        )
+        kwargs = {}
+        if os.name == "nt":
+            kwargs["creationflags"] = subprocess.CREATE_NO_WINDOW
+        process = subprocess.run(
+            converter.get_args(source, tmp_path, threads),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            universal_newlines=True,
+            **kwargs
+        )
+        if process.returncode != 0 or not os.path.isfile(tmp_path):
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise RuntimeError(
+                process.stdout.strip()
+                or "Exit code {}".format(process.returncode)
+            )
+        os.replace(tmp_path, cached)
+        return cached
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            source: executor.submit(_convert, source, cached)
+            for source, cached in jobs.items()
+        }
+        for source, future in futures.items():
+            try:
+                result.converted[source] = future.result()
+            except Exception as exc:
+                result.failed[source] = str(exc)
+
+    result.seconds = time.time() - start
+    return result
@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+"""Content addressed on-disk cache of version thumbnails.
+
+Thumbnails are stored by the hash of their content, so versions sharing a
+thumbnail share a single file. An index in the cache folder maps version
+ids to the content hash so a thumbnail is downloaded only once across
+sessions and load nodes:
+
+    >>> cache = get_thumbnail_cache("$JOB/.houdini_loader_thumbnails")
+    >>> cache.prefetch(project_name, version_ids)
+    >>> cache.get(project_name, version_ids[0])
+    '/job/.houdini_loader_thumbnails/3f7a...9c.jpg'
+
+Prefetching queries the thumbnail ids of all versions at once and
+downloads each distinct thumbnail once in a thread pool.
+
+"""
+import os
+import json
+import hashlib
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+import ayon_api
+import hou
+
+
+log = logging.getLogger(__name__)
+
+INDEX_NAME = "index.json"
+DOWNLOAD_THREADS = 8
+
+
+def _get_key(project_name, version_id):
+    return "{}/{}".format(project_name, version_id)
+
+
+class ThumbnailCache(object):
+    """Version thumbnails stored by content hash in a folder.
+
+    Arguments:
+        root (str): The expanded cache folder.
+
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self._index = None
+        # Versions without thumbnail, only remembered for this session as
+        # a thumbnail may be added later
+        self._missing = set()
+
+    def _get_index(self):
+        if self._index is None:
+            try:
+                with open(os.path.join(self.root, INDEX_NAME), "r") as f:
+                    self._index = json.load(f)
+            except (IOError, OSError, ValueError):
+                self._index = {}
+        return self._index
+
+    def _write_index(self):
+        os.makedirs(self.root, exist_ok=True)
+        path = os.path.join(self.root, INDEX_NAME)
+        # Merge with entries written by other sessions meanwhile
+        try:
+            with open(path, "r") as f:
+                index = json.load(f)
+        except (IOError, OSError, ValueError):
+            index = {}
+        index.update(self._index)
+        self._index = index
+        tmp_path = "{}.{}.tmp".format(path, os.getpid())
+        with open(tmp_path, "w") as f:
+            json.dump(index, f)
+        os.replace(tmp_path, path)
+
+    def _get_path(self, content_hash):
+        return os.path.join(self.root, "{}.jpg".format(content_hash))
+
+    def _store(self, content):
+        """Write thumbnail content to the cache and return its hash."""
+        content_hash = hashlib.sha1(content).hexdigest()
+        path = self._get_path(content_hash)
+        if not os.path.isfile(path):
+            os.makedirs(self.root, exist_ok=True)
+            tmp_path = "{}.{}.tmp".format(path, os.getpid())
+            with open(tmp_path, "wb") as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+        return content_hash
+
+    def get_cached(self, project_name, version_id):
+        """Return the cached thumbnail path of a version without download.
+        """
+        content_hash = self._get_index().get(
+            _get_key(project_name, version_id))
+        if content_hash:
+            path = self._get_path(content_hash)
+            if os.path.isfile(path):
+                return path
+        return None
+
+    def get(self, project_name, version_id):
+        """Return the thumbnail path of a version, download if needed.
+
+        Returns:
+            Optional[str]: The thumbnail path, None when the version has no
+                thumbnail.
+
+        """
+        path = self.get_cached(project_name, version_id)
+        if path or (project_name, version_id) in self._missing:
+            return path
+        self.prefetch(project_name, [version_id])
+        return self.get_cached(project_name, version_id)
+
+    def prefetch(self, project_name, version_ids):
+        """Download the thumbnails of versions not in the cache yet.
+
+        Arguments:
+            project_name (str): The project of the versions.
+            version_ids (Iterable[str]): The versions to download the
+                thumbnails of.
+
+        """
+        version_ids = {
+            version_id for version_id in version_ids
+            if (project_name, version_id) not in self._missing
+            and not self.get_cached(project_name, version_id)
+        }
+        if not version_ids:
+            return
+
+        # Versions may share a thumbnail, download each one only once
+        by_thumbnail_id = {}
+        for version in ayon_api.get_versions(
+            project_name,
+            version_ids=version_ids,
+            fields={"id", "thumbnailId"}
+        ):
+            thumbnail_id = version.get("thumbnailId")
+            if thumbnail_id:
+                by_thumbnail_id.setdefault(thumbnail_id, []).append(
+                    version["id"])
+            else:
+                self._missing.add((project_name, version["id"]))
+
+        def _download(thumbnail_id):
+            try:
+                data = ayon_api.get_thumbnail_by_id(
+                    project_name, thumbnail_id)
+                if data and data.content:
+                    return self._store(data.content)
+            except Exception:
+                log.warning("Failed to download thumbnail %s",
+                            thumbnail_id, exc_info=True)
+            return None
+
+        thumbnail_ids = list(by_thumbnail_id)
+        with ThreadPoolExecutor(max_workers=DOWNLOAD_THREADS) as executor:
+            hashes = list(executor.map(_download, thumbnail_ids))
+
+        index = self._get_index()
+        for thumbnail_id, content_hash in zip(thumbnail_ids, hashes):
+            for version_id in by_thumbnail_id[thumbnail_id]:
+                if content_hash:
+                    index[_get_key(project_name, version_id)] = content_hash
+                else:
+                    self._missing.add((project_name, version_id))
+        if any(hashes):
+            self._write_index()
+        log.debug("Downloaded %d thumbnails for %d versions.",
+                  len([h for h in hashes if h]), len(version_ids))
+
+
+_caches = {}
+
+
+def get_thumbnail_cache(thumbnail_dir):
+    """Return the thumbnail cache of a folder.
+
+    Arguments:
+        thumbnail_dir (str): The cache folder, Houdini variables are
+            expanded.
+
+    Returns:
+        ThumbnailCache: The cache of the folder.
+
+    """
+    root = os.path.normpath(hou.text.expandString(thumbnail_dir))
+    cache = _caches.get(root)
+    if cache is None:
+        cache = ThumbnailCache(root)
+        _caches[root] = cache
+    return cache
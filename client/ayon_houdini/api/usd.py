@@ -1,8 +1,8 @@
 """Houdini-specific USD Library functions."""
 
+import os
 import contextlib
 import logging
-import json
 import itertools
 from typing import List
 
@@ -12,6 +12,10 @@ from pxr import Usd, Sdf, Tf, Vt, UsdRender
 
 log = logging.getLogger(__name__)
 
+# Source to publish path mappings per ROP node path registered by
+# `remap_paths` for the AyonRemapPaths output processor
+_REMAP_PATHS_MAPPINGS = {}
+
 
 def add_usd_output_processor(ropnode, processor):
     """Add USD Output Processor to USD Rop node.
@@ -284,28 +288,44 @@ def setup_lop_python_layer(layer, node, savepath=None,
     return p
 
 
+def get_remap_paths_mapping(rop_node):
+    """Return the mapping registered by `remap_paths` for the ROP node.
+
+    Used by the AyonRemapPaths output processor to get the mapping with
+    normalized source paths directly, without a JSON round trip through the
+    `ayon_remap_paths_remap_json` parameter.
+
+    Returns:
+        Optional[dict[str, str]]: The mapping, if any is registered.
+
+    """
+    return _REMAP_PATHS_MAPPINGS.get(rop_node.path())
+
+
 @contextlib.contextmanager
 def remap_paths(rop_node, mapping):
     """Enable the AyonRemapPaths output processor with provided `mapping`"""
-    from ayon_houdini.api.lib import parm_values
-
     if not mapping:
         # Do nothing
         yield
         return
 
-    # Houdini string parms need to escape backslashes due to the support
-    # of expressions - as such we do so on the json data
-    value = json.dumps(mapping).replace("\\", "\\\\")
-    with outputprocessors(
-        rop_node,
-        processors=["ayon_remap_paths"],
-        disable_all_others=True,
-    ):
-        with parm_values([
-            (rop_node.parm("ayon_remap_paths_remap_json"), value)
-        ]):
+    # Ensure all keys are normalized paths so the lookup can be done
+    # correctly by the output processor
+    mapping = {
+        os.path.normpath(key): value for key, value in mapping.items()
+    }
+    rop_path = rop_node.path()
+    _REMAP_PATHS_MAPPINGS[rop_path] = mapping
+    try:
+        with outputprocessors(
+            rop_node,
+            processors=["ayon_remap_paths"],
+            disable_all_others=True,
+        ):
             yield
+    finally:
+        _REMAP_PATHS_MAPPINGS.pop(rop_path, None)
 
 
 def get_usd_render_rop_rendersettings(rop_node, stage=None, logger=None):
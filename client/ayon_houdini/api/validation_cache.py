@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+"""Reuse validation results across publish re-runs.
+
+When an artist fixes one validation error and publishes again all the
+validators run again from scratch, including expensive ones that cook the
+output network. Validators can opt in to reuse their previous passing
+result with the `cached_validation` decorator on their `process` method:
+
+    >>> from ayon_houdini.api import plugin
+    >>> from ayon_houdini.api.validation_cache import cached_validation
+    >>> class ValidateSomething(plugin.HoudiniInstancePlugin):
+    ...     @cached_validation
+    ...     def process(self, instance):
+    ...         ...
+
+The result is reused only when the instance fingerprint is unchanged. The
+fingerprint combines the ROP parm values, the state of the upstream
+network of the output node, including its HDA definitions and the
+modification times of the files it reads at the first and last frame, the
+frame range and the plugin's publish attributes. Cooks, e.g. in the
+viewport, do not change the fingerprint.
+
+Only passing results are cached. A failing validator always runs again so
+its error report and the invalid nodes for its actions are up to date.
+
+"""
+import os
+import time
+import hashlib
+import logging
+import functools
+
+import hou
+
+
+log = logging.getLogger(__name__)
+
+# Process-wide cache that survives between publish contexts.
+# {(plugin name, instance node path): (fingerprint, duration)}
+_CACHE = {}
+
+CONTEXT_KEY = "houdiniValidationCache"
+
+
+def get_raw_parm_values(node):
+    """Return raw (unevaluated) parm values of a node.
+
+    Raw values are used so expressions are compared by their expression
+    instead of their value at the current frame.
+    """
+    values = []
+    for parm in node.parms():
+        try:
+            values.append((parm.name(), parm.rawValue()))
+        except hou.Error:
+            continue
+    return values
+
+
+def get_definition_state(node):
+    """Return the library, version and modification time of an HDA."""
+    definition = node.type().definition()
+    if definition is None:
+        return None
+    library_path = definition.libraryFilePath()
+    return (
+        library_path,
+        definition.version(),
+        definition.modificationTime(),
+    )
+
+
+def get_file_parms(node):
+    """Return the parms of a node that read files."""
+    parms = []
+    for parm in node.parms():
+        template = parm.parmTemplate()
+        if (
+            template.type() == hou.parmTemplateType.String
+            and template.stringType() == hou.stringParmType.FileReference
+        ):
+            parms.append(parm)
+    return parms
+
+
+def get_mtime(path):
+    """Return the modification time of a file, None if it is missing."""
+    try:
+        return os.path.getmtime(path)
+    except (OSError, ValueError):
+        return None
+
+
+def get_upstream_nodes(node):
+    """Return all nodes the given node depends on, including itself.
+
+    This follows node inputs, nodes referenced through parameters and the
+    children of unlocked subnetworks.
+    """
+    visited = {}
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        path = current.path()
+        if path in visited:
+            continue
+        visited[path] = current
+
+        stack.extend(n for n in current.inputs() if n is not None)
+        try:
+            stack.extend(current.references(include_children=False))
+        except hou.Error:
+            pass
+
+        if current.type().definition() is None or not current.isLockedHDA():
+            stack.extend(current.children())
+
+    return [visited[path] for path in sorted(visited)]
+
+
+def get_instance_fingerprint(instance, plugin_name=None):
+    """Return a fingerprint of everything a validation may depend on.
+
+    Arguments:
+        instance (pyblish.api.Instance): The instance to fingerprint.
+        plugin_name (Optional[str]): When provided the publish attributes
+            of that plugin on the instance are included.
+
+    Returns:
+        Optional[str]: Hex digest fingerprint or None if the instance has
+            no instance node to fingerprint.
+
+    """
+    rop_node = hou.node(instance.data.get("instance_node") or "")
+    if rop_node is None:
+        return None
+
+    data = [
+        hou.hipFile.path(),
+        rop_node.path(),
+        rop_node.type().nameWithCategory(),
+        get_raw_parm_values(rop_node),
+        [
+            instance.data.get(key) for key in (
+                "frameStartHandle", "frameEndHandle", "byFrameStep",
+                "frameStart", "frameEnd"
+            )
+        ]
+    ]
+
+    if plugin_name:
+        publish_attributes = instance.data.get("publish_attributes", {})
+        data.append(sorted(publish_attributes.get(plugin_name, {}).items()))
+
+    output_node = instance.data.get("output_node")
+    if output_node is not None:
+        frames = {
+            instance.data.get("frameStartHandle", hou.frame()),
+            instance.data.get("frameEndHandle", hou.frame())
+        }
+        for node in get_upstream_nodes(output_node):
+            files = []
+            for parm in get_file_parms(node):
+                for frame in sorted(frames):
+                    try:
+                        path = parm.evalAtFrame(frame)
+                    except hou.Error:
+                        continue
+                    if path:
+                        files.append((path, get_mtime(path)))
+            data.append((
+                node.path(),
+                node.type().nameWithCategory(),
+                get_definition_state(node),
+                node.isBypassed() if hasattr(node, "isBypassed") else None,
+                [n.path() if n else None for n in node.inputs()],
+                get_raw_parm_values(node),
+                files
+            ))
+
+    return hashlib.sha1(repr(data).encode("utf-8")).hexdigest()
+
+
+def clear():
+    """Clear all cached validation results."""
+    _CACHE.clear()
+
+
+def cached_validation(process):
+    """Decorate a validator's `process` method to reuse passing results.
+
+    The cache lookup, reuse and timing are recorded on the publish context
+    under `houdiniValidationCache` so they can be reported at the end of
+    validation.
+    """
+
+    @functools.wraps(process)
+    def wrapper(self, instance):
+        plugin_name = self.__class__.__name__
+        instance_node = instance.data.get("instance_node")
+        if not instance_node:
+            return process(self, instance)
+
+        key = (plugin_name, instance_node)
+        records = instance.context.data.setdefault(CONTEXT_KEY, [])
+        fingerprint = get_instance_fingerprint(instance, plugin_name)
+        cached = _CACHE.get(key)
+        if fingerprint is not None and cached and cached[0] == fingerprint:
+            duration = cached[1]
+            self.log.info(
+                "Reusing cached validation result, nothing relevant "
+                "changed since last publish (saved %.2fs).", duration
+            )
+            records.append({
+                "plugin": plugin_name,
+                "instance": instance_node,
+                "cached": True,
+                "duration": duration
+            })
+            return
+
+        _CACHE.pop(key, None)
+        start = time.time()
+        result = process(self, instance)
+        duration = time.time() - start
+
+        if fingerprint is not None:
+            _CACHE[key] = (fingerprint, duration)
+        records.append({
+            "plugin": plugin_name,
+            "instance": instance_node,
+            "cached": False,
+            "duration": duration
+        })
+        return result
+
+    return wrapper
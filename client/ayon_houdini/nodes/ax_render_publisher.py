@@ -1,6 +1,6 @@
 import hou
 
-from ayon_houdini.api import publish
+from ayon_houdini.api import publish, render_aovs
 
 
 NODE_DESCRIPTION = "AX Render Publisher"
@@ -58,22 +58,14 @@ def input_changed_callback(render_publish_node):
 
     input_node = input_nodes[0]
     input_node_type = input_node.type().description()
-    if input_node_type == "Arnold":
-        output_parms["beauty"] = input_node.parm("ar_picture")
-        num_aovs = input_node.parm("ar_aovs").eval()
-        for aov_idx in range(1, num_aovs):
-            is_enabled = input_node.parm(f"ar_enable_aov{aov_idx}").eval()
-            if not is_enabled:
-                continue
-            
-            is_separate_file = input_node.parm(f"ar_aov_separate{aov_idx}").eval()
-            if is_separate_file:
-                output_parms["util"] = input_node.parm(f"ar_aov_separate_file{aov_idx}")
-
-    elif input_node_type == "Mantra":
-        output_parms["beauty"] = input_node.parm("vm_picture")
-    elif input_node_type == "Arnold Denoiser":
+    if input_node_type == "Arnold Denoiser":
         output_parms["beauty"] = input_node.parm("output")
+    elif render_aovs.is_supported(input_node):
+        outputs = render_aovs.get_render_outputs(input_node)
+        output_parms["beauty"] = outputs.beauty.parm
+        for product in outputs.aovs:
+            if product.parm is not None:
+                output_parms["util"] = product.parm
     else:
         hou.ui.displayMessage(
             f"Node type {input_node_type} not supported on AX Render Publisher"
@@ -0,0 +1,145 @@
+import math
+import logging
+
+import hou
+
+from ayon_houdini.api import cache_fingerprint, lib, parm_utils
+from ayon_houdini.nodes.publish_node import PublishNode
+
+
+log = logging.getLogger(__name__)
+
+# Frame range parms of the cache node
+FRAME_RANGE_PARMS = {"trange", "f1", "f2", "f3"}
+
+
+def _get_template_names(parm_template):
+    names = [parm_template.name()]
+    if parm_template.type() == hou.parmTemplateType.Folder:
+        for child in parm_template.parmTemplates():
+            names.extend(_get_template_names(child))
+    return names
+
+
+class FileCacheNode(PublishNode):
+    """Base class for File Cache nodes that reuse unchanged cached frames.
+
+    The fingerprint of the upstream network is stored per frame next to the
+    cached files, see `cache_fingerprint`. Caching changed frames only cooks
+    the frames whose fingerprint changed or that are missing on disk.
+    """
+
+    extra_parm_data = [
+        {
+            "type": hou.ButtonParmTemplate,
+            "name": "cache_changed_frames",
+            "label": "Cache Changed Frames",
+            "join_with_next": True,
+            "script_callback": "kwargs['node'].cache_changed_frames()",
+            "script_callback_language": hou.scriptLanguage.Python,
+            "help": "Cache only the frames whose upstream network changed "
+                "since they were cached, reuse all other frames.",
+        },
+        {
+            "type": hou.ToggleParmTemplate,
+            "name": "cache_changed_frames_on_publish",
+            "label": "Cache Changed Frames on Publish",
+            "default_value": False,
+            "help": "Cache the changed frames before submitting to publish.",
+        },
+    ]
+
+    def get_publish_parm_template(self):
+        parm_template = super().get_publish_parm_template()
+        # Insert some extra parm template after publish button
+        return parm_utils.insert_parm_data(
+            parm_template, self.extra_parm_data, 1
+        )
+
+    def get_cache_rop(self):
+        """Return the ROP inside the node that writes the cache."""
+        rops = [
+            node for node in self.allSubChildren()
+            if isinstance(node, hou.RopNode)
+        ]
+        for rop in rops:
+            if rop.type().name() == "rop_geometry":
+                return rop
+        return rops[0] if rops else None
+
+    def get_cache_frames(self):
+        """Return the frames to cache and the frame step."""
+        if not self.evalParm("trange"):
+            return [hou.frame()], 1
+        start, end, step = self.evalParmTuple("f")
+        step = step or 1
+        # Compute the frames by index, adding up fractional steps drifts
+        count = int(math.floor((end - start) / step + 1e-6)) + 1
+        return [start + index * step for index in range(count)], step
+
+    def get_fingerprint(self, output_parm):
+        """Return the fingerprint of the upstream network of the node."""
+        # Changing the publish parms does not change the cache, neither
+        # does changing the frame range since the fingerprint is per frame
+        ptg = self.parmTemplateGroup()
+        publish_folder = ptg.find("publish_folder")
+        ignored = set(
+            _get_template_names(publish_folder) if publish_folder else []
+        )
+        ignored.update(FRAME_RANGE_PARMS)
+        for parm in self.parms():
+            multiparm = parm.parentMultiParm()
+            if multiparm is not None and multiparm.name() in ignored:
+                ignored.add(parm.name())
+        return cache_fingerprint.NetworkFingerprint(
+            self, output_parm, ignored_parms=ignored)
+
+    def cache_changed_frames(self, silent=False):
+        """Cache the frames whose fingerprint changed, reuse the others.
+
+        Returns:
+            Tuple[str, bool]: Report message and whether caching succeeded.
+
+        """
+        output_parm = lib.get_output_parameter(self)
+        rop_node = self.get_cache_rop()
+        if output_parm is None or rop_node is None:
+            message = "Unable to find the output of {}\n".format(self.path())
+            if not silent:
+                hou.ui.displayMessage(
+                    message,
+                    title="Cache error",
+                    severity=hou.severityType.Error
+                )
+            return message, False
+
+        frames, step = self.get_cache_frames()
+        fingerprint = self.get_fingerprint(output_parm)
+        reuse = cache_fingerprint.get_reusable_frames(
+            fingerprint, output_parm, frames)
+        if reuse.stale:
+            cache_fingerprint.render_frames(
+                rop_node, fingerprint, output_parm, reuse.stale, step)
+
+        message = "{}\n".format(reuse.get_report())
+        log.info("%s: %s", self.path(), message.strip())
+        if not silent:
+            hou.ui.displayMessage(
+                message,
+                title="Cache finished",
+                severity=hou.severityType.Message
+            )
+        return message, True
+
+    def pre_publish_callback(self, silent=False):
+        """Callback to run any code before publish"""
+        message, success = super().pre_publish_callback(silent=silent)
+        if not success:
+            return message, success
+
+        # Nodes created before the parm was added do not have it
+        parm = self.parm("cache_changed_frames_on_publish")
+        if parm is not None and parm.eval():
+            message_, success = self.cache_changed_frames(silent=silent)
+            message += message_
+        return message, success
@@ -1,8 +1,8 @@
 from ayon_houdini.api import publish
-from ayon_houdini.nodes.publish_node import PublishNode
+from ayon_houdini.nodes.filecache_node import FileCacheNode
 
 
-class Labs_filecache_2_0(PublishNode):
+class Labs_filecache_2_0(FileCacheNode):
     product_types = (publish.GEO_TYPE, publish.CACHE_TYPE)
 
     default_parms = {
@@ -0,0 +1,135 @@
+import logging
+
+import hou
+
+from ayon_houdini.api import local_scheduler, parm_utils
+from ayon_houdini.nodes.base_node import BaseNode
+
+
+log = logging.getLogger(__name__)
+
+
+class Localscheduler(BaseNode):
+    """Local scheduler with slots derived from the cores and memory.
+
+    The total slots and the threads per work item are planned from the
+    detected cores, the available memory and the memory estimate of a work
+    item of the `general/local_scheduler` project settings. The plan is
+    applied again when the scene is loaded, e.g. on another machine.
+    """
+
+    parm_data = {
+        "type": hou.FolderParmTemplate,
+        "name": "ayon_folder",
+        "label": "AYON",
+        "folder_type": hou.folderType.Tabs,
+        "_children": [
+            {
+                "type": hou.ToggleParmTemplate,
+                "name": "ayon_auto_slots",
+                "label": "Plan Slots from Cores and Memory",
+                "default_value": True,
+                "help": "Set the total slots and threads per work item "
+                    "from the cores and available memory of this machine "
+                    "when the scene is loaded.",
+            },
+            {
+                "type": hou.ButtonParmTemplate,
+                "name": "ayon_plan_slots",
+                "label": "Plan Slots",
+                "join_with_next": True,
+                "script_callback": "kwargs['node'].apply_slot_plan()",
+                "script_callback_language": hou.scriptLanguage.Python,
+            },
+            {
+                "type": hou.ButtonParmTemplate,
+                "name": "ayon_throughput_report",
+                "label": "Throughput Report",
+                "script_callback": "kwargs['node'].show_report()",
+                "script_callback_language": hou.scriptLanguage.Python,
+            },
+        ],
+    }
+
+    def on_created(self):
+        super().on_created()
+
+        parm_utils.add_parm_template_to_node(self.parm_data, self)
+        self.apply_slot_plan(silent=True)
+        self.track_throughput()
+
+    def on_loaded(self):
+        # Scenes created before the parms were added do not have them
+        parm = self.parm("ayon_auto_slots")
+        if parm is not None and parm.eval():
+            self.apply_slot_plan(silent=True)
+        self.track_throughput()
+
+    def apply_slot_plan(self, silent=False):
+        """Set the total slots and threads per work item of the plan.
+
+        Returns:
+            Optional[local_scheduler.SlotPlan]: The applied plan, None when
+                planning is disabled in the settings.
+
+        """
+        settings = local_scheduler.get_settings()
+        if not settings["enabled"]:
+            return None
+
+        plan = local_scheduler.plan_slots(settings)
+        self._set_custom_menu_item("maxprocsmenu")
+        parms = {
+            "maxprocs": plan.slots,
+            "local_usehoudinimaxthreads": True,
+            "local_houdinimaxthreads": plan.threads,
+        }
+        self.setParms({
+            name: value for name, value in parms.items()
+            if self.parm(name) is not None
+        })
+
+        log.info("%s: %s", self.path(), plan.get_report())
+        if not silent:
+            hou.ui.displayMessage(
+                plan.get_report(),
+                title="Local Scheduler",
+                severity=hou.severityType.Message
+            )
+        return plan
+
+    def _set_custom_menu_item(self, parm_name):
+        """Set a slot count menu to its custom count item."""
+        parm = self.parm(parm_name)
+        if parm is None:
+            return
+        template = parm.parmTemplate()
+        for item, label in zip(template.menuItems(), template.menuLabels()):
+            if "custom" in label.lower():
+                parm.set(item)
+                return
+
+    def track_throughput(self):
+        """Record the work item cook times of the TOP network."""
+        try:
+            return local_scheduler.get_throughput(self)
+        except Exception:
+            log.debug("Unable to track throughput of %s", self.path(),
+                      exc_info=True)
+            return None
+
+    def show_report(self):
+        """Show the slot plan and the recorded work item throughput."""
+        settings = local_scheduler.get_settings()
+        lines = [local_scheduler.plan_slots(settings).get_report()]
+        tracker = self.track_throughput()
+        if tracker is None:
+            lines.append("No work items recorded, the network has no "
+                         "graph context yet.")
+        else:
+            lines.append(tracker.get_report())
+        hou.ui.displayMessage(
+            "\n".join(lines),
+            title="Local Scheduler",
+            severity=hou.severityType.Message
+        )
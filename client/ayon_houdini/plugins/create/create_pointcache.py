@@ -13,8 +13,14 @@ class CreatePointCache(plugin.HoudiniCreator):
     label = "PointCache (Abc)"
     product_type = "pointcache"
     icon = "gears"
+    bulk_create_supported = True
 
     def create(self, product_name, instance_data, pre_create_data):
+        bulk_nodes = self.get_bulk_nodes(pre_create_data)
+        if bulk_nodes:
+            return self.create_bulk(
+                bulk_nodes, instance_data, pre_create_data)
+
         instance_data.update({"node_type": "alembic"})
         creator_attributes = instance_data.setdefault(
             "creator_attributes", dict())
@@ -11,9 +11,15 @@ class CreateRedshiftProxy(plugin.HoudiniCreator):
     label = "Redshift Proxy"
     product_type = "redshiftproxy"
     icon = "magic"
+    bulk_create_supported = True
 
     def create(self, product_name, instance_data, pre_create_data):
 
+        bulk_nodes = self.get_bulk_nodes(pre_create_data)
+        if bulk_nodes:
+            return self.create_bulk(
+                bulk_nodes, instance_data, pre_create_data)
+
         # Redshift provides a `Redshift_Proxy_Output` node type which shows
         # a limited set of parameters by default and is set to extract a
         # Redshift Proxy. However when "imprinting" extra parameters needed
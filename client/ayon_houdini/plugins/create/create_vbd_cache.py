@@ -13,10 +13,16 @@ class CreateVDBCache(plugin.HoudiniCreator):
     label = "VDB Cache"
     product_type = "vdbcache"
     icon = "cloud"
+    bulk_create_supported = True
 
     def create(self, product_name, instance_data, pre_create_data):
         import hou
 
+        bulk_nodes = self.get_bulk_nodes(pre_create_data)
+        if bulk_nodes:
+            return self.create_bulk(
+                bulk_nodes, instance_data, pre_create_data)
+
         instance_data.update({"node_type": "geometry"})
         creator_attributes = instance_data.setdefault(
             "creator_attributes", dict())
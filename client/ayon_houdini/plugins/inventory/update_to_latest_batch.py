@@ -0,0 +1,158 @@
+import time
+
+import ayon_api
+from ayon_core.pipeline import (
+    InventoryAction,
+    get_current_project_name,
+    discover_loader_plugins,
+)
+from ayon_core.pipeline.load import (
+    get_representation_contexts_by_ids,
+    is_compatible_loader,
+)
+
+
+class UpdateToLatestBatch(InventoryAction):
+    """Update all selected containers to their latest version at once.
+
+    Unlike updating containers one by one this queries all the latest
+    representations with a few server queries and lets each loader update
+    its containers in a single undo group, see `HoudiniLoader.update_batch`.
+
+    Containers on a hero version are kept on it. As with updating a single
+    container, a container is only updated when its loader is compatible
+    with the new representation.
+    """
+
+    label = "Update to Latest (Batch)"
+    icon = "angle-double-up"
+    color = "#00b359"
+    order = 10
+
+    def process(self, containers):
+        start = time.time()
+        project_name = get_current_project_name()
+
+        containers_by_repre_id = {}
+        for container in containers:
+            containers_by_repre_id.setdefault(
+                container["representation"], []).append(container)
+
+        # Resolve the latest version representations in bulk
+        repre_entities = list(ayon_api.get_representations(
+            project_name,
+            representation_ids=set(containers_by_repre_id),
+            fields={"id", "name", "versionId"}
+        ))
+        version_ids = {repre["versionId"] for repre in repre_entities}
+        product_id_by_version_id = {}
+        hero_version_ids = set()
+        for version in ayon_api.get_versions(
+            project_name,
+            version_ids=version_ids,
+            hero=True,
+            fields={"id", "productId", "version"}
+        ):
+            product_id_by_version_id[version["id"]] = version["productId"]
+            # Hero versions have negative version numbers
+            if version["version"] < 0:
+                hero_version_ids.add(version["id"])
+        last_versions = ayon_api.get_last_versions(
+            project_name,
+            set(product_id_by_version_id.values()),
+            fields={"id", "productId"}
+        )
+        last_version_ids = {
+            version["id"] for version in last_versions.values()
+        }
+        new_repre_id_by_key = {
+            (repre["versionId"], repre["name"]): repre["id"]
+            for repre in ayon_api.get_representations(
+                project_name,
+                version_ids=last_version_ids,
+                representation_names={
+                    repre["name"] for repre in repre_entities
+                },
+                fields={"id", "name", "versionId"}
+            )
+        }
+
+        new_repre_id_by_repre_id = {}
+        for repre in repre_entities:
+            if repre["versionId"] in hero_version_ids:
+                self.log.debug(
+                    "Keeping representation '%s' on its hero version.",
+                    repre["id"])
+                continue
+            product_id = product_id_by_version_id.get(repre["versionId"])
+            last_version = last_versions.get(product_id)
+            if not last_version or last_version["id"] == repre["versionId"]:
+                # Already up-to-date
+                continue
+            new_repre_id = new_repre_id_by_key.get(
+                (last_version["id"], repre["name"]))
+            if new_repre_id is None:
+                self.log.warning(
+                    "Representation '%s' not found in latest version of "
+                    "product '%s'", repre["name"], product_id)
+                continue
+            new_repre_id_by_repre_id[repre["id"]] = new_repre_id
+
+        if not new_repre_id_by_repre_id:
+            self.log.info("All containers are up-to-date.")
+            return
+
+        contexts_by_repre_id = get_representation_contexts_by_ids(
+            project_name, set(new_repre_id_by_repre_id.values())
+        )
+        query_time = time.time() - start
+
+        # Group the containers to update per loader
+        loaders_by_name = {
+            loader.__name__: loader for loader in discover_loader_plugins()
+        }
+        items_by_loader = {}
+        for repre_id, new_repre_id in new_repre_id_by_repre_id.items():
+            context = contexts_by_repre_id[new_repre_id]
+            for container in containers_by_repre_id[repre_id]:
+                loader_cls = loaders_by_name.get(container["loader"])
+                if loader_cls is not None and not is_compatible_loader(
+                    loader_cls, context
+                ):
+                    self.log.warning(
+                        "Loader '%s' is not compatible with the latest "
+                        "representation, skipping: %s", container["loader"],
+                        container["objectName"])
+                    continue
+                items_by_loader.setdefault(
+                    container["loader"], []).append((container, context))
+
+        timings = {}
+        for loader_name, items in items_by_loader.items():
+            loader_cls = loaders_by_name.get(loader_name)
+            if loader_cls is None:
+                self.log.warning("Loader '%s' not found, skipping: %s",
+                                 loader_name,
+                                 [c["objectName"] for c, _ in items])
+                continue
+
+            loader = loader_cls()
+            if hasattr(loader, "update_batch"):
+                timings.update(loader.update_batch(items))
+                continue
+
+            for container, context in items:
+                container_start = time.time()
+                loader.update(container, context)
+                timings[container["objectName"]] = (
+                    time.time() - container_start)
+
+        for path, duration in sorted(timings.items()):
+            self.log.info("Updated %s in %.3fs", path, duration)
+        self.log.info(
+            "Updated %d containers in %.2fs (queries %.2fs)",
+            len(timings), time.time() - start, query_time
+        )
+
+        # Refresh the scene inventory
+        return True
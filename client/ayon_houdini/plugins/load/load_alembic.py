@@ -1,6 +1,6 @@
 import os
-from ayon_core.pipeline import get_representation_path
 from ayon_houdini.api import (
+    local_cache,
     pipeline,
     plugin
 )
@@ -17,6 +17,8 @@ class AbcLoader(plugin.HoudiniLoader):
     icon = "code-fork"
     color = "orange"
 
+    use_local_cache = False
+
     def load(self, context, name=None, namespace=None, data=None):
         import hou
 
@@ -43,7 +45,8 @@ class AbcLoader(plugin.HoudiniLoader):
 
         # Create an alembic node (supports animation)
         alembic = container.createNode("alembic", node_name=node_name)
-        alembic.setParms({"fileName": file_path})
+        local_cache.set_parm_path(alembic.parm("fileName"), file_path,
+                                  use_local_cache=self.use_local_cache)
 
         # Position nodes nicely
         container.moveToGoodPosition()
@@ -72,10 +75,11 @@ class AbcLoader(plugin.HoudiniLoader):
             return
 
         # Update the file path
-        file_path = get_representation_path(repre_entity)
+        file_path = self.resolve_representation_path(repre_entity)
         file_path = file_path.replace("\\", "/")
 
-        alembic_node.setParms({"fileName": file_path})
+        local_cache.set_parm_path(alembic_node.parm("fileName"), file_path,
+                                  use_local_cache=self.use_local_cache)
 
         # Update attribute
         node.setParms({"representation": repre_entity["id"]})
@@ -1,6 +1,5 @@
 
 import os
-from ayon_core.pipeline import get_representation_path
 from ayon_houdini.api import (
     pipeline,
     plugin
@@ -62,7 +61,7 @@ class AbcArchiveLoader(plugin.HoudiniLoader):
         node = container["node"]
 
         # Update the file path
-        file_path = get_representation_path(repre_entity)
+        file_path = self.resolve_representation_path(repre_entity)
         file_path = file_path.replace("\\", "/")
 
         # Update attributes
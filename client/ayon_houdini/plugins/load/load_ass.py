@@ -1,7 +1,6 @@
 import os
 import re
 
-from ayon_core.pipeline import get_representation_path
 from ayon_houdini.api import (
     pipeline,
     plugin
@@ -61,8 +60,7 @@ class AssLoader(plugin.HoudiniLoader):
         node = container["node"]
         node.destroy()
 
-    @staticmethod
-    def format_path(representation):
+    def format_path(self, representation):
         """Format file path correctly for single ass.* or ass.* sequence.
 
         Args:
@@ -72,7 +70,7 @@ class AssLoader(plugin.HoudiniLoader):
              str: Formatted path to be used by the input node.
 
         """
-        path = get_representation_path(representation)
+        path = self.resolve_representation_path(representation)
         if not os.path.exists(path):
             raise RuntimeError("Path does not exist: {}".format(path))
 
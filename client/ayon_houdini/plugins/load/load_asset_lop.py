@@ -1,5 +1,11 @@
+import time
+
 from ayon_core.pipeline import load
-from ayon_houdini.api.lib import find_active_network
+from ayon_houdini.api import hda_utils
+from ayon_houdini.api.lib import (
+    find_active_network,
+    flush_background_images
+)
 
 import hou
 
@@ -44,6 +50,36 @@ class LOPLoadAssetLoader(load.LoaderPlugin):
         parm.set(context["representation"]["id"])
         parm.pressButton()  # trigger callbacks
 
+    def update_batch(self, items):
+        """Update many containers, downloading their thumbnails at once.
+
+        Arguments:
+            items (List[Tuple[dict, dict]]): Container and the
+                representation context to update it to.
+
+        Returns:
+            Dict[str, float]: Update duration per container node path.
+
+        """
+        hda_utils.prefetch_thumbnails([
+            (
+                container["node"],
+                context["project"]["name"],
+                context["version"]["id"]
+            )
+            for container, context in items
+        ])
+
+        timings = {}
+        with hou.undos.group("AYON Update {}".format(self.label)):
+            for container, context in items:
+                start = time.time()
+                self.update(container, context)
+                timings[container["objectName"]] = time.time() - start
+            # Write the thumbnails of all nodes within the undo group
+            flush_background_images()
+        return timings
+
     def remove(self, container):
         node = container["node"]
         node.destroy()
@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+import ayon_api
+from ayon_core.pipeline import load, discover_loader_plugins
+from ayon_core.pipeline.load import (
+    get_representation_contexts_by_ids,
+    is_compatible_loader,
+    load_with_repre_context,
+)
+
+from ayon_houdini.api import plugin
+from ayon_houdini.api.pipeline import batch_load
+
+
+class BatchLoader(load.ProductLoaderPlugin):
+    """Load all selected products at once.
+
+    Each product is loaded with the Houdini loader of the lowest order that
+    is compatible with one of its representations. All loads run in
+    `batch_load`, so the containers are created in a single undo group
+    without cooking and are imprinted and laid out in one pass.
+    """
+
+    label = "Load Batched"
+    product_types = {"*"}
+    representations = {"*"}
+    order = -20
+    icon = "cubes"
+    color = "orange"
+
+    is_multiple_contexts_compatible = True
+
+    def load(self, context, name=None, namespace=None, options=None):
+        contexts = context if isinstance(context, list) else [context]
+        if not contexts:
+            return
+
+        project_name = contexts[0]["project"]["name"]
+        repre_ids = {
+            repre["id"]
+            for repre in ayon_api.get_representations(
+                project_name,
+                version_ids={
+                    product_context["version"]["id"]
+                    for product_context in contexts
+                },
+                fields={"id"}
+            )
+        }
+        repre_contexts_by_version_id = {}
+        for repre_context in get_representation_contexts_by_ids(
+            project_name, repre_ids
+        ).values():
+            repre_contexts_by_version_id.setdefault(
+                repre_context["version"]["id"], []).append(repre_context)
+
+        loaders = sorted(
+            (
+                loader for loader in discover_loader_plugins()
+                if issubclass(loader, plugin.HoudiniLoader)
+                and getattr(loader, "enabled", True)
+            ),
+            key=lambda loader: loader.order
+        )
+
+        with batch_load("AYON Load {} Products".format(len(contexts))):
+            for product_context in contexts:
+                product_name = product_context["product"]["name"]
+                repre_contexts = sorted(
+                    repre_contexts_by_version_id.get(
+                        product_context["version"]["id"], []),
+                    key=lambda item: item["representation"]["name"]
+                )
+                loader, repre_context = self._get_loader(
+                    loaders, repre_contexts)
+                if loader is None:
+                    self.log.warning(
+                        "No loader found for product '%s', skipping.",
+                        product_name)
+                    continue
+
+                self.log.debug("Loading '%s' representation '%s' with %s",
+                               product_name,
+                               repre_context["representation"]["name"],
+                               loader.__name__)
+                load_with_repre_context(loader, repre_context)
+
+    @staticmethod
+    def _get_loader(loaders, repre_contexts):
+        """Return the first compatible loader and representation context."""
+        for loader in loaders:
+            for repre_context in repre_contexts:
+                if is_compatible_loader(loader, repre_context):
+                    return loader, repre_context
+        return None, None
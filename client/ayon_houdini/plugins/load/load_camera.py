@@ -1,5 +1,4 @@
 import hou
-from ayon_core.pipeline import get_representation_path
 
 from ayon_houdini.api import (
     pipeline,
@@ -136,7 +135,7 @@ class CameraLoader(plugin.HoudiniLoader):
         node = container["node"]
 
         # Update the file path
-        file_path = get_representation_path(repre_entity)
+        file_path = self.resolve_representation_path(repre_entity)
         file_path = file_path.replace("\\", "/")
 
         # Update attributes
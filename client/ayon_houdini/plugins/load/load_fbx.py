@@ -1,6 +1,5 @@
 # -*- coding: utf-8 -*-
 """Fbx Loader for houdini. """
-from ayon_core.pipeline import get_representation_path
 from ayon_houdini.api import (
     pipeline,
     plugin
@@ -59,7 +58,7 @@ class FbxLoader(plugin.HoudiniLoader):
             return
 
         # Update the file path from representation
-        file_path = get_representation_path(repre_entity)
+        file_path = self.resolve_representation_path(repre_entity)
         file_path = file_path.replace("\\", "/")
 
         file_node.setParms({"file": file_path})
@@ -2,11 +2,11 @@ import os
 import re
 import hou
 
-from ayon_core.pipeline import Anatomy
 from ayon_core.lib import StringTemplate
 from ayon_houdini.api import (
     pipeline,
-    plugin
+    plugin,
+    anatomy_cache
 )
 
 
@@ -148,8 +148,8 @@ class FilePathLoader(plugin.HoudiniLoader):
                 template = remove_format_spec(template, "frame")
 
             project_name: str = repre_context["project"]["name"]
-            anatomy = Anatomy(project_name, project_entity=context["project"])
-            repre_context["root"] = anatomy.roots
+            repre_context["root"] = anatomy_cache.get_roots(
+                project_name, context["project"])
             path = StringTemplate(template).format(repre_context)
         else:
             path = super().filepath_from_context(context)
@@ -2,19 +2,26 @@
 import os
 import hou
 from ayon_core.pipeline import (
-    get_representation_path,
     AVALON_CONTAINER_ID
 )
 from ayon_core.pipeline.load import LoadError
 from ayon_houdini.api import (
     lib,
+    local_cache,
     pipeline,
     plugin
 )
 
 
 class HdaLoader(plugin.HoudiniLoader):
-    """Load Houdini Digital Asset file."""
+    """Load Houdini Digital Asset file.
+
+    With `use_local_cache` enabled the HDA library is installed from a copy
+    in the local cache instead of the published path, see `local_cache`.
+    The published path is imprinted on the container as `source_path` and
+    the library is resolved from it again when the scene is opened, see
+    `local_cache.update_hda_libraries`.
+    """
 
     product_types = {"hda"}
     label = "Load Hda"
@@ -23,6 +30,8 @@ class HdaLoader(plugin.HoudiniLoader):
     icon = "code-fork"
     color = "orange"
 
+    use_local_cache = False
+
     def load(self, context, name=None, namespace=None, data=None):
 
         # Format file name, Houdini only wants forward slashes
@@ -33,6 +42,8 @@ class HdaLoader(plugin.HoudiniLoader):
         namespace = namespace or context["folder"]["name"]
         node_name = "{}_{}".format(namespace, name) if namespace else name
 
+        source_path = file_path
+        file_path = self._get_library_path(file_path)
         hou.hda.installFile(file_path)
 
         hda_defs = hou.hda.definitionsInFile(file_path)
@@ -54,6 +65,7 @@ class HdaLoader(plugin.HoudiniLoader):
             "namespace": namespace,
             "loader": self.__class__.__name__,
             "representation": context["representation"]["id"],
+            "source_path": source_path,
         }
 
         lib.imprint(hda_node, data)
@@ -64,15 +76,22 @@ class HdaLoader(plugin.HoudiniLoader):
 
         repre_entity = context["representation"]
         hda_node = container["node"]
-        file_path = get_representation_path(repre_entity)
+        file_path = self.resolve_representation_path(repre_entity)
         file_path = file_path.replace("\\", "/")
+        source_path = file_path
+        file_path = self._get_library_path(file_path)
         hou.hda.installFile(file_path)
         defs = hda_node.type().allInstalledDefinitions()
         def_paths = [d.libraryFilePath() for d in defs]
         new = def_paths.index(file_path)
         defs[new].setIsPreferred(True)
+
+        # Containers loaded before the local cache have no source path parm
+        if not hda_node.parm("source_path"):
+            lib.imprint(hda_node, {"source_path": source_path})
         hda_node.setParms({
-            "representation": repre_entity["id"]
+            "representation": repre_entity["id"],
+            "source_path": source_path
         })
 
     def remove(self, container):
@@ -87,6 +106,16 @@ class HdaLoader(plugin.HoudiniLoader):
         if not parent.children():
             parent.destroy()
 
+    def _get_library_path(self, file_path):
+        """Return the path to install the HDA library from.
+
+        Returns the path of the copy in the local cache when enabled, else
+        the published path itself.
+        """
+        if not self.use_local_cache:
+            return file_path
+        return local_cache.get_library_path(file_path)
+
     def _create_dedicated_parent_node(self, hda_def):
 
         # Get the root node
@@ -3,7 +3,6 @@ import re
 import hou
 
 from ayon_core.pipeline import (
-    get_representation_path,
     AVALON_CONTAINER_ID,
 )
 from ayon_houdini.api import (
@@ -103,7 +102,7 @@ class ImageLoader(plugin.HoudiniLoader):
         node = container["node"]
 
         # Update the file path
-        file_path = get_representation_path(repre_entity)
+        file_path = self.resolve_representation_path(repre_entity)
         file_path = self.format_path(file_path, repre_entity)
 
         parms = {
@@ -2,10 +2,10 @@ import os
 import re
 import hou
 
-from ayon_core.pipeline import get_representation_path
 from ayon_core.pipeline.load import LoadError
 
 from ayon_houdini.api import (
+    local_cache,
     pipeline,
     plugin
 )
@@ -21,6 +21,8 @@ class RedshiftProxyLoader(plugin.HoudiniLoader):
     icon = "code-fork"
     color = "orange"
 
+    use_local_cache = False
+
     def load(self, context, name=None, namespace=None, data=None):
 
         # Get the root node
@@ -42,12 +44,13 @@ class RedshiftProxyLoader(plugin.HoudiniLoader):
                             "plug-in set up correctly for Houdini.")
 
         # Enable by default
-        container.setParms({
-            "RS_objprop_proxy_enable": True,
-            "RS_objprop_proxy_file": self.format_path(
-                self.filepath_from_context(context),
-                context["representation"])
-        })
+        container.setParms({"RS_objprop_proxy_enable": True})
+        local_cache.set_parm_path(
+            container.parm("RS_objprop_proxy_file"),
+            self.format_path(self.filepath_from_context(context),
+                             context["representation"]),
+            use_local_cache=self.use_local_cache
+        )
 
         # Remove the file node, it only loads static meshes
         # Houdini 17 has removed the file node from the geo node
@@ -76,13 +79,14 @@ class RedshiftProxyLoader(plugin.HoudiniLoader):
     def update(self, container, context):
         repre_entity = context["representation"]
         # Update the file path
-        file_path = get_representation_path(repre_entity)
+        file_path = self.resolve_representation_path(repre_entity)
 
         node = container["node"]
-        node.setParms({
-            "RS_objprop_proxy_file": self.format_path(
-                file_path, repre_entity)
-        })
+        local_cache.set_parm_path(
+            node.parm("RS_objprop_proxy_file"),
+            self.format_path(file_path, repre_entity),
+            use_local_cache=self.use_local_cache
+        )
 
         # Update attribute
         node.setParms({"representation": repre_entity["id"]})
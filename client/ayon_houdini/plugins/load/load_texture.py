@@ -3,7 +3,6 @@ import os
 import hou
 
 from ayon_core.pipeline import (
-    get_representation_path,
     AVALON_CONTAINER_ID,
 )
 from ayon_core.lib import path_tools
@@ -92,12 +91,12 @@ class TextureLoader(plugin.HoudiniLoader):
 
         return node
 
-    def update(self, container, representation):
-
+    def update(self, container, context):
+        representation = context["representation"]
         node = container["node"]
 
         # Update the file path
-        file_path = get_representation_path(representation)
+        file_path = self.resolve_representation_path(representation)
         file_path = file_path.replace("\\", "/")
         # TODO: add support for UDIMs replacing the udim token with "<UDIM>"
 
@@ -124,5 +123,5 @@ class TextureLoader(plugin.HoudiniLoader):
         if not parent.children():
             parent.destroy()
 
-    def switch(self, container, representation):
-        self.update(container, representation)
+    def switch(self, container, context):
+        self.update(container, context)
@@ -1,8 +1,8 @@
 import os
 import re
 
-from ayon_core.pipeline import get_representation_path
 from ayon_houdini.api import (
+    local_cache,
     pipeline,
     plugin
 )
@@ -18,6 +18,8 @@ class VdbLoader(plugin.HoudiniLoader):
     icon = "code-fork"
     color = "orange"
 
+    use_local_cache = False
+
     def load(self, context, name=None, namespace=None, data=None):
 
         import hou
@@ -41,8 +43,11 @@ class VdbLoader(plugin.HoudiniLoader):
         # Explicitly create a file node
         file_node = container.createNode("file", node_name=node_name)
         path = self.filepath_from_context(context)
-        file_node.setParms(
-            {"file": self.format_path(path, context["representation"])})
+        local_cache.set_parm_path(
+            file_node.parm("file"),
+            self.format_path(path, context["representation"]),
+            use_local_cache=self.use_local_cache
+        )
 
         # Set display on last node
         file_node.setDisplayFlag(True)
@@ -91,10 +96,11 @@ class VdbLoader(plugin.HoudiniLoader):
             return
 
         # Update the file path
-        file_path = get_representation_path(repre_entity)
+        file_path = self.resolve_representation_path(repre_entity)
         file_path = self.format_path(file_path, repre_entity)
 
-        file_node.setParms({"file": file_path})
+        local_cache.set_parm_path(file_node.parm("file"), file_path,
+                                  use_local_cache=self.use_local_cache)
 
         # Update attribute
         node.setParms({"representation": repre_entity["id"]})
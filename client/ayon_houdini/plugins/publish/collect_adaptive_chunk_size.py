@@ -0,0 +1,82 @@
+import hou
+import pyblish.api
+from ayon_core.pipeline import OptionalPyblishPluginMixin
+from ayon_houdini.api import plugin
+from ayon_houdini.api.cache_estimate import (
+    get_sample_frames,
+    is_simulation,
+    sample_output_node,
+    plan_chunk_size,
+)
+
+
+class CollectAdaptiveChunkSize(plugin.HoudiniInstancePlugin,
+                               OptionalPyblishPluginMixin):
+    """Choose the chunk size of farm caches from sampled frames.
+
+    Cooks a few frames of the output SOP locally to measure the cook time
+    and output size per frame. The chunk size is chosen so tasks take at
+    most the target task duration and use the available farm slots.
+    The estimate is stored in `instance.data["chunkSizeEstimate"]`.
+
+    Simulations are skipped, cooking a late frame cooks all frames before
+    it so the sampled time is not the time of a single frame.
+    """
+
+    # Run after Collect Chunk Size, Collect Frames and Collect Data for Cache
+    order = pyblish.api.CollectorOrder + 0.12
+    families = ["ass", "pointcache", "vdbcache", "redshiftproxy"]
+    targets = ["local"]
+    label = "Collect Adaptive Chunk Size"
+    optional = True
+
+    sample_frames = 3
+    target_task_minutes = 10.0
+    min_task_minutes = 1.0
+    farm_slots = 20
+
+    def process(self, instance):
+        if not self.is_active(instance.data):
+            return
+
+        if not instance.data.get("farm"):
+            self.log.debug("Not cached on farm, skipping.")
+            return
+
+        output_node = instance.data.get("output_node")
+        if not isinstance(output_node, hou.SopNode):
+            self.log.debug("No output SOP to sample, keeping chunk size %s.",
+                           instance.data.get("chunkSize"))
+            return
+
+        if is_simulation(output_node):
+            self.log.debug(
+                "Output of %s depends on a simulation, keeping chunk size "
+                "%s.", output_node.path(), instance.data.get("chunkSize"))
+            return
+
+        frame_start = instance.data["frameStartHandle"]
+        frame_end = instance.data["frameEndHandle"]
+        step = instance.data.get("byFrameStep", 1)
+        frames = get_sample_frames(frame_start, frame_end, step,
+                                   count=self.sample_frames)
+        samples = sample_output_node(output_node, frames)
+
+        frame_count = len(range(int(frame_start), int(frame_end) + 1,
+                                int(step) or 1))
+        estimate = plan_chunk_size(
+            samples,
+            frame_count,
+            farm_slots=self.farm_slots,
+            target_task_seconds=self.target_task_minutes * 60.0,
+            min_task_seconds=self.min_task_minutes * 60.0
+        )
+        instance.data["chunkSize"] = estimate["chunk_size"]
+        instance.data["chunkSizeEstimate"] = estimate
+        self.log.info(
+            "Chunk size %d: %d tasks of ~%.0fs, %.2fs and %.1f MB per frame "
+            "(sampled frames %s)",
+            estimate["chunk_size"], estimate["tasks"],
+            estimate["task_seconds"], estimate["frame_seconds"],
+            estimate["frame_size"] / 1024.0 ** 2, frames
+        )
@@ -0,0 +1,184 @@
+import os
+import shutil
+
+import ayon_api
+import hou
+import pyblish.api
+
+from ayon_houdini.api import plugin
+from ayon_houdini.api.cache_estimate import sample_output_node
+
+
+def get_expected_paths(instance):
+    """Return all file paths the instance is expected to write."""
+    paths = []
+    for item in instance.data.get("expectedFiles", []):
+        values = item.values() if isinstance(item, dict) else [item]
+        for files in values:
+            if isinstance(files, str):
+                paths.append(files)
+            else:
+                paths.extend(files)
+    if paths:
+        return paths
+
+    frames = instance.data.get("frames")
+    staging_dir = instance.data.get("stagingDir")
+    if not frames or not staging_dir:
+        return []
+    if isinstance(frames, str):
+        frames = [frames]
+    return [os.path.join(staging_dir, frame) for frame in frames]
+
+
+def get_existing_parent(path):
+    """Return the closest existing parent folder of a path."""
+    folder = os.path.dirname(os.path.abspath(path))
+    while folder and not os.path.isdir(folder):
+        parent = os.path.dirname(folder)
+        if parent == folder:
+            return None
+        folder = parent
+    return folder or None
+
+
+class CollectDiskUsageEstimate(plugin.HoudiniInstancePlugin):
+    """Estimate the disk space the output files of an instance will use.
+
+    The size per file is taken from, in order of preference:
+        - the average size of the output files that already exist
+        - the average file size of the last published version
+        - for uncompressed `.bgeo` output only, the sampled frames of
+          `CollectAdaptiveChunkSize` or, when `sample_output` is enabled, a
+          sampled first frame of the output SOP
+
+    Sampled sizes are those of uncompressed `.bgeo` data, so they are not
+    used for other output formats. Only runs when `ValidateDiskSpace` is
+    enabled and active for the instance, since nothing else uses the
+    estimate. The estimate and the free space on the output volume are
+    stored in `instance.data["diskUsageEstimate"]`.
+    """
+
+    # Run after all expected files and frames are collected
+    order = pyblish.api.CollectorOrder + 0.49
+    families = ["pointcache", "vdbcache", "ass", "redshiftproxy", "bgeo",
+                "arnold_rop", "mantra_rop", "karma_rop", "redshift_rop",
+                "vray_rop", "usdrender"]
+    targets = ["local"]
+    label = "Collect Disk Usage Estimate"
+
+    sample_output = False
+
+    def process(self, instance):
+        if not self.is_validated(instance):
+            self.log.debug("Disk space is not validated, skipping.")
+            return
+
+        paths = get_expected_paths(instance)
+        if not paths:
+            self.log.debug("No expected output files, skipping.")
+            return
+
+        file_size, source = self.get_file_size(instance, paths)
+        if file_size is None:
+            self.log.debug("Unable to estimate output file size.")
+            return
+
+        estimate = {
+            "files": len(paths),
+            "file_size": int(file_size),
+            "total_size": int(file_size * len(paths)),
+            "source": source,
+            "volume": None,
+            "free_space": None
+        }
+
+        folder = get_existing_parent(paths[0])
+        if folder:
+            estimate["volume"] = folder
+            estimate["free_space"] = shutil.disk_usage(folder).free
+
+        instance.data["diskUsageEstimate"] = estimate
+        self.log.debug(
+            "Estimated %.2f GB for %d files (from %s), %s free on %s",
+            estimate["total_size"] / 1024.0 ** 3, len(paths), source,
+            "unknown" if estimate["free_space"] is None else "{:.2f} GB".format(
+                estimate["free_space"] / 1024.0 ** 3),
+            folder
+        )
+
+    @staticmethod
+    def is_validated(instance):
+        """Return whether `ValidateDiskSpace` runs for the instance."""
+        settings = (
+            instance.context.data["project_settings"]["houdini"]["publish"]
+            .get("ValidateDiskSpace", {})
+        )
+        if not settings.get("enabled"):
+            return False
+        if not settings.get("optional"):
+            return True
+        return (
+            instance.data
+            .get("publish_attributes", {})
+            .get("ValidateDiskSpace", {})
+            .get("active", settings.get("active", True))
+        )
+
+    def get_file_size(self, instance, paths):
+        """Return the estimated size per output file and its source."""
+        sizes = [
+            os.path.getsize(path) for path in paths if os.path.isfile(path)
+        ]
+        if sizes:
+            return sum(sizes) / float(len(sizes)), "existing output files"
+
+        size = self.get_previous_version_file_size(instance)
+        if size:
+            return size, "last published version"
+
+        # Samples measure uncompressed `.bgeo` data
+        if not paths[0].endswith(".bgeo"):
+            return None, None
+
+        chunk_estimate = instance.data.get("chunkSizeEstimate")
+        if chunk_estimate and chunk_estimate.get("frame_size"):
+            return chunk_estimate["frame_size"], "sampled frames"
+
+        output_node = instance.data.get("output_node")
+        if self.sample_output and isinstance(output_node, hou.SopNode):
+            frame = instance.data.get("frameStartHandle", hou.frame())
+            sample = sample_output_node(output_node, [frame])[0]
+            if sample.size:
+                return sample.size, "sampled first frame"
+        return None, None
+
+    def get_previous_version_file_size(self, instance):
+        """Return the average file size of the last published version."""
+        folder_entity = instance.data.get("folderEntity")
+        if not folder_entity:
+            return None
+
+        project_name = instance.context.data["projectName"]
+        version = ayon_api.get_last_version_by_product_name(
+            project_name,
+            instance.data["productName"],
+            folder_entity["id"],
+            fields={"id"}
+        )
+        if not version:
+            return None
+
+        sizes = [
+            repre_file["size"]
+            for repre in ayon_api.get_representations(
+                project_name,
+                version_ids={version["id"]},
+                fields={"files"}
+            )
+            for repre_file in repre.get("files", [])
+            if repre_file.get("size")
+        ]
+        if not sizes:
+            return None
+        return sum(sizes) / float(len(sizes))
@@ -43,3 +43,6 @@ class CollectHoudiniRenderColorspace(plugin.HoudiniInstancePlugin):
 
         # Used in `create_skeleton_instance()`
         instance.data["colorspace"] = colorspace.get_scene_linear_colorspace()
+
+        self.log.debug("OCIO config cache: %s",
+                       colorspace.get_ocio_config_cache().get_stats())
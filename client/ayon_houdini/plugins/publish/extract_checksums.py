@@ -0,0 +1,105 @@
+import ayon_api
+import pyblish.api
+from ayon_core.pipeline import KnownPublishError
+
+from ayon_houdini.api import plugin
+from ayon_houdini.api.checksums import (
+    build_manifest,
+    get_representation_paths,
+    get_suspect_files,
+    get_unchanged_files,
+)
+
+
+class ExtractChecksums(plugin.HoudiniInstancePlugin):
+    """Hash the files of all representations into a checksum manifest.
+
+    The manifest is stored in the representation data as `checksums` so
+    the integrity of published files can be verified later. Zero-byte
+    files fail the publish and frames much smaller than the other frames
+    are reported as possibly truncated.
+
+    When `skip_unchanged` is enabled and all files are identical to the
+    last published version the instance is not integrated. Hashing reads
+    every file, so it only runs for the product types in `families`.
+    """
+
+    # Run after all extractors
+    order = pyblish.api.ExtractorOrder + 0.45
+    label = "Extract Checksums"
+    families = ["pointcache", "vdbcache", "redshiftproxy", "ass", "usd"]
+    targets = ["local", "remote"]
+
+    threads = 8
+    skip_unchanged = False
+
+    def process(self, instance):
+        if instance.data.get("farm"):
+            self.log.debug("Should be processed on farm, skipping.")
+            return
+
+        representations = [
+            repre for repre in instance.data.get("representations", [])
+            if repre.get("files") and "delete" not in repre.get("tags", [])
+        ]
+        if not representations:
+            return
+
+        previous_manifests = self.get_previous_manifests(instance)
+        unchanged = True
+        for repre in representations:
+            manifest = build_manifest(
+                get_representation_paths(repre), threads=self.threads)
+            repre.setdefault("data", {})["checksums"] = manifest
+
+            empty, truncated = get_suspect_files(manifest)
+            if empty:
+                raise KnownPublishError(
+                    "Representation '{}' has zero-byte files: {}".format(
+                        repre["name"], ", ".join(empty)))
+            if truncated:
+                self.log.warning(
+                    "Representation '%s' has frames much smaller than the "
+                    "others, they may be truncated: %s",
+                    repre["name"], ", ".join(truncated))
+
+            identical = get_unchanged_files(
+                manifest, previous_manifests.get(repre["name"]))
+            self.log.debug(
+                "Hashed %d files of representation '%s' with %s, %d "
+                "identical to the last version.", len(manifest["files"]),
+                repre["name"], manifest["algorithm"], len(identical))
+            if len(identical) != len(manifest["files"]):
+                unchanged = False
+
+        if unchanged and self.skip_unchanged:
+            self.log.info(
+                "All files are identical to the last published version, "
+                "skipping integration.")
+            instance.data["integrate"] = False
+
+    def get_previous_manifests(self, instance):
+        """Return the checksum manifests of the last version by name."""
+        folder_entity = instance.data.get("folderEntity")
+        if not folder_entity:
+            return {}
+
+        project_name = instance.context.data["projectName"]
+        version = ayon_api.get_last_version_by_product_name(
+            project_name,
+            instance.data["productName"],
+            folder_entity["id"],
+            fields={"id"}
+        )
+        if not version:
+            return {}
+
+        return {
+            repre["name"]: repre["data"]["checksums"]
+            for repre in ayon_api.get_representations(
+                project_name,
+                version_ids={version["id"]},
+                fields={"name", "data"}
+            )
+            if (repre.get("data") or {}).get("checksums")
+        }
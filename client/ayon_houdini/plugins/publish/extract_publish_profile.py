@@ -0,0 +1,70 @@
+import os
+import json
+import getpass
+import platform
+import tempfile
+from datetime import datetime
+
+import hou
+import pyblish.api
+
+from ayon_houdini.api import plugin
+from ayon_houdini.api.publish_profiler import CONTEXT_KEY, get_report
+
+
+class ExtractPublishProfile(plugin.HoudiniExtractorPlugin):
+    """Report the publish plugin profile and publish it with the workfile.
+
+    The profile is recorded when profiling is enabled, see
+    `ayon_houdini.api.publish_profiler`. The slowest plugins are logged and
+    all records are written to a JSON file that is added as `profile`
+    representation to the workfile instance, so publishes can be compared
+    over time and across artists.
+    """
+
+    label = "Extract Publish Profile"
+    order = pyblish.api.ExtractorOrder + 0.49
+    families = ["workfile"]
+
+    # Do not profile the report itself
+    profile = False
+    report_limit = 20
+
+    def process(self, instance):
+        context = instance.context
+        records = context.data.get(CONTEXT_KEY)
+        if not records:
+            return
+
+        total = sum(record["wall"] for record in records)
+        self.log.info(
+            "Houdini publish plugins took %.2fs in total, slowest:\n%s",
+            total, get_report(records, limit=self.report_limit)
+        )
+
+        profile = {
+            "timestamp": datetime.now().isoformat(),
+            "user": getpass.getuser(),
+            "machine": platform.node(),
+            "houdini_version": hou.applicationVersionString(),
+            "workfile": context.data.get("currentFile"),
+            "project": context.data.get("projectName"),
+            "folder_path": instance.data.get("folderPath"),
+            "task": instance.data.get("task"),
+            "total_wall": total,
+            "total_cpu": sum(record["cpu"] for record in records),
+            "plugins": records
+        }
+
+        staging_dir = tempfile.mkdtemp(prefix="ayon_publish_profile_")
+        context.data.setdefault("cleanupFullPaths", []).append(staging_dir)
+        file_name = "publish_profile.json"
+        with open(os.path.join(staging_dir, file_name), "w") as f:
+            json.dump(profile, f, indent=4)
+
+        instance.data.setdefault("representations", []).append({
+            "name": "profile",
+            "ext": "json",
+            "files": file_name,
+            "stagingDir": staging_dir
+        })
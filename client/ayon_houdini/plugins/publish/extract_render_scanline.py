@@ -0,0 +1,72 @@
+import os
+
+import pyblish.api
+from ayon_core.pipeline import KnownPublishError, OptionalPyblishPluginMixin
+
+from ayon_houdini.api import plugin
+from ayon_houdini.api.checksums import get_representation_paths
+from ayon_houdini.api.exr_scanline import convert_to_scanline, find_oiiotool
+
+
+class ExtractRenderScanline(plugin.HoudiniExtractorPlugin,
+                            OptionalPyblishPluginMixin):
+    """Publish scanline copies of tiled EXR frames of local renders.
+
+    Review tools like Nuke and RV crash on tiled EXRs. Scanline copies of
+    tiled frames, including tiled multipart frames, are written to a
+    `scanline` folder in the staging dir with parallel `oiiotool` processes
+    and the representations are published from there. The tiled frames of
+    the render are kept, e.g. to append to or denoise them later.
+    """
+
+    # Run after the local render and before the review extraction
+    order = pyblish.api.ExtractorOrder + 0.01
+    label = "Extract Scanline EXR"
+    families = ["render.local.hou"]
+
+    workers = 0
+
+    def process(self, instance):
+        if not self.is_active(instance.data):
+            return
+
+        representations = [
+            repre for repre in instance.data.get("representations", [])
+            if repre.get("ext", "").lower() == "exr" and repre.get("files")
+        ]
+        if not representations:
+            return
+
+        oiiotool = find_oiiotool()
+        if oiiotool is None:
+            self.log.warning(
+                "oiiotool is not available, tiled EXR frames are published "
+                "as they are.")
+            return
+
+        staging_dir = os.path.join(self.staging_dir(instance), "scanline")
+        failed = {}
+        for repre in representations:
+            paths = get_representation_paths(repre)
+            repre_staging_dir = os.path.join(staging_dir, repre["name"])
+            result = convert_to_scanline(
+                paths,
+                oiiotool,
+                repre_staging_dir,
+                workers=self.workers or None
+            )
+            self.log.info(
+                "Representation '%s': %s", repre["name"], result.get_report())
+            failed.update(result.failed)
+            if result.converted and not result.failed:
+                repre["stagingDir"] = repre_staging_dir
+
+        if failed:
+            raise KnownPublishError(
+                "Failed to convert EXR frames to scanline:\n{}".format(
+                    "\n".join(
+                        "{}: {}".format(path, error)
+                        for path, error in sorted(failed.items())
+                    )
+                )
+            )
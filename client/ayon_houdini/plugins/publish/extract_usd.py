@@ -8,6 +8,7 @@ from ayon_core.pipeline.publish.lib import get_instance_expected_output_path
 from ayon_houdini.api import plugin
 from ayon_houdini.api.lib import render_rop
 from ayon_houdini.api.usd import remap_paths
+from ayon_houdini.api.telemetry import sample_resources
 
 import hou
 
@@ -32,7 +33,8 @@ class ExtractUSD(plugin.HoudiniExtractorPlugin):
 
         self.log.info("Writing USD '%s' to '%s'" % (file_name, staging_dir))
 
-        mapping = self.get_source_to_publish_paths(instance.context)
+        # Copy since instance-specific remapping is added below
+        mapping = dict(self.get_source_to_publish_paths(instance.context))
         if mapping:
             self.log.debug(f"Remapping paths: {mapping}")
 
@@ -44,7 +46,7 @@ class ExtractUSD(plugin.HoudiniExtractorPlugin):
                            f"{instance_mapping}")
         mapping.update(instance_mapping)
 
-        with remap_paths(ropnode, mapping):
+        with remap_paths(ropnode, mapping), sample_resources(instance):
             render_rop(ropnode)
 
         assert os.path.exists(output), "Output does not exist: %s" % output
@@ -66,51 +68,123 @@ class ExtractUSD(plugin.HoudiniExtractorPlugin):
         file to publish file so this can be used on the USD save to remap
         asset layer paths on publish via AyonRemapPaths output processor
 
+        The mapping is shared by all USD extractions in the publish through
+        a `PublishPathRemapTable` on the context, so that the publish paths
+        of an instance are only computed again when it changed.
+
         Arguments:
             context (pyblish.api.Context): Publish context.
 
         Returns:
-            dict[str, str]: Mapping from source path to remapped path.
+            dict[str, str]: Mapping from normalized source path to remapped
+                path. The dictionary is shared and must not be modified.
 
         """
-
+        key = ("usdPublishPathRemapTable", self.use_ayon_entity_uri)
+        table = context.data.get(key)
+        if table is None:
+            table = PublishPathRemapTable(self.use_ayon_entity_uri)
+            context.data[key] = table
+        return table.get_mapping(context)
+
+
+class PublishPathRemapTable(object):
+    """Source to publish path mapping of all instances in the context.
+
+    Computing the publish path requires filling the anatomy templates per
+    representation. The entries of each instance are cached together with
+    a signature of the instance data they depend on, so only instances that
+    changed since the last call, e.g. got new representations, are computed
+    again.
+    """
+
+    def __init__(self, use_ayon_entity_uri=False):
+        self.use_ayon_entity_uri = use_ayon_entity_uri
+        self._entries = {}
+        self._mapping = {}
+        self._signature = None
+
+    @staticmethod
+    def _get_instance_signature(instance):
+        if not instance.data.get("active", True):
+            return None
+
+        if not instance.data.get("publish", True):
+            return None
+
+        repres = []
+        for repre in instance.data.get("representations", []):
+            files = repre.get("files", [])
+            if isinstance(files, list):
+                files = tuple(files)
+            repres.append((
+                repre.get("name"),
+                repre.get("ext"),
+                repre.get("stagingDir"),
+                files
+            ))
+        return (
+            instance.data.get("folderPath"),
+            instance.data.get("productName"),
+            instance.data.get("version"),
+            instance.data.get("stagingDir"),
+            tuple(repres)
+        )
+
+    def _get_instance_mapping(self, instance):
         mapping = {}
+        for repre in instance.data.get("representations", []):
+            name = repre.get("name")
+            ext = repre.get("ext")
+
+            # TODO: The remapping might need to get more involved if the
+            #   asset paths that are set use e.g. $F
+            # TODO: If the representation has multiple files we might need
+            #   to define the path remapping per file of the sequence
+            if self.use_ayon_entity_uri:
+                # Construct AYON entity URI
+                # Note: entity does not exist yet
+                path = construct_ayon_entity_uri(
+                    project_name=instance.context.data["projectName"],
+                    folder_path=instance.data["folderPath"],
+                    product=instance.data["productName"],
+                    version=instance.data["version"],
+                    representation_name=name
+                )
+            else:
+                # Resolved publish filepath
+                path = get_instance_expected_output_path(
+                    instance, representation_name=name, ext=ext
+                )
+
+            for source_path in get_source_paths(instance, repre):
+                source_path = os.path.normpath(source_path)
+                mapping[source_path] = path
+        return mapping
+
+    def get_mapping(self, context):
+        """Return the mapping, updated for instances that changed."""
+        signatures = []
         for instance in context:
-            if not instance.data.get("active", True):
-                continue
+            signature = self._get_instance_signature(instance)
+            signatures.append((instance.id, signature))
 
-            if not instance.data.get("publish", True):
+            entry = self._entries.get(instance.id)
+            if entry is not None and entry[0] == signature:
                 continue
 
-            for repre in instance.data.get("representations", []):
-                name = repre.get("name")
-                ext = repre.get("ext")
-
-                # TODO: The remapping might need to get more involved if the
-                #   asset paths that are set use e.g. $F
-                # TODO: If the representation has multiple files we might need
-                #   to define the path remapping per file of the sequence
-                if self.use_ayon_entity_uri:
-                    # Construct AYON entity URI
-                    # Note: entity does not exist yet
-                    path = construct_ayon_entity_uri(
-                        project_name=context.data["projectName"],
-                        folder_path=instance.data["folderPath"],
-                        product=instance.data["productName"],
-                        version=instance.data["version"],
-                        representation_name=name
-                    )
-                else:
-                    # Resolved publish filepath
-                    path = get_instance_expected_output_path(
-                        instance, representation_name=name, ext=ext
-                    )
-
-                for source_path in get_source_paths(instance, repre):
-                    source_path = os.path.normpath(source_path)
-                    mapping[source_path] = path
-
-        return mapping
+            if signature is None:
+                mapping = {}
+            else:
+                mapping = self._get_instance_mapping(instance)
+            self._entries[instance.id] = (signature, mapping)
+
+        if signatures != self._signature:
+            self._signature = signatures
+            self._mapping = {}
+            for instance_id, _ in signatures:
+                self._mapping.update(self._entries[instance_id][1])
+        return self._mapping
 
 
 def get_source_paths(
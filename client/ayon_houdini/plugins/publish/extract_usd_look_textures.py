@@ -0,0 +1,84 @@
+import os
+
+import pyblish.api
+from ayon_core.pipeline import OptionalPyblishPluginMixin
+
+from ayon_houdini.api import plugin
+from ayon_houdini.api.texture_conversion import (
+    convert_textures,
+    find_converter,
+    needs_conversion,
+)
+
+
+class ExtractUsdLookTextures(plugin.HoudiniExtractorPlugin,
+                             OptionalPyblishPluginMixin):
+    """Convert the look textures to mipmapped render textures.
+
+    Each texture collected by `CollectUsdLookAssets` is converted once with
+    `imaketx` or `maketx` and transferred next to the source texture in the
+    resources folder, so renderers pick up the converted texture instead of
+    converting it at render time on every farm machine.
+
+    Conversions are cached by the content of the source texture, unchanged
+    textures are never converted again.
+    """
+
+    order = pyblish.api.ExtractorOrder
+    label = "Extract Look Render Textures"
+    families = ["look"]
+
+    converters = ["imaketx", "maketx"]
+    extension = ".tx"
+    workers = 0
+    cache_root = ""
+
+    def process(self, instance):
+        if not self.is_active(instance.data):
+            return
+
+        sources = {
+            path
+            for resource in instance.data.get("resources", [])
+            for path in resource["files"]
+            if needs_conversion(path) and os.path.isfile(path)
+        }
+        if not sources:
+            return
+
+        converter = find_converter(self.converters)
+        if converter is None:
+            self.log.warning(
+                "None of the texture converters %s is available, skipping "
+                "texture conversion.", ", ".join(self.converters))
+            return
+
+        self.log.debug("Converting %d textures with %s",
+                       len(sources), converter.name)
+        result = convert_textures(
+            sources,
+            converter,
+            extension=self.extension,
+            cache_root=self.cache_root or None,
+            workers=self.workers or None
+        )
+        for source, error in sorted(result.failed.items()):
+            self.log.warning("Failed to convert %s: %s", source, error)
+
+        resources_dir = instance.data["resourcesDir"]
+        transfers = instance.data.setdefault("transfers", [])
+        destinations = {dest for _, dest in transfers}
+        for source, converted in sorted(result.converted.items()):
+            name = os.path.splitext(os.path.basename(source))[0]
+            dest = os.path.join(resources_dir, name + self.extension)
+            if dest in destinations:
+                self.log.warning(
+                    "Skipping converted texture of %s, %s is already "
+                    "transferred.", source, dest)
+                continue
+            destinations.add(dest)
+            transfers.append((converted, dest))
+            self.log.debug("Registering transfer: %s -> %s",
+                           converted, dest)
+
+        self.log.info(result.get_report())
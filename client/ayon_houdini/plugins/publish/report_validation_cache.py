@@ -0,0 +1,37 @@
+import pyblish.api
+
+from ayon_houdini.api import plugin
+from ayon_houdini.api.validation_cache import CONTEXT_KEY
+
+
+class ReportValidationCache(plugin.HoudiniContextPlugin):
+    """Report which validation results were reused from the cache.
+
+    Validators decorated with `cached_validation` record whether their result
+    was reused and how long the validation took. This logs a summary with
+    the total time saved at the end of validation.
+    """
+
+    label = "Report Validation Cache"
+    order = pyblish.api.ValidatorOrder + 0.49
+
+    def process(self, context):
+        records = context.data.get(CONTEXT_KEY)
+        if not records:
+            return
+
+        cached = [record for record in records if record["cached"]]
+        saved = sum(record["duration"] for record in cached)
+
+        lines = []
+        for record in sorted(records,
+                             key=lambda r: (r["instance"], r["plugin"])):
+            lines.append("{state:<8} {duration:>8.2f}s  {plugin} "
+                         "({instance})".format(
+                             state="cached" if record["cached"] else "ran",
+                             **record))
+
+        self.log.info(
+            "Reused %d of %d cacheable validation results, saved %.2fs:\n%s",
+            len(cached), len(records), saved, "\n".join(lines)
+        )
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""Validate the output files fit on the output volume."""
+import pyblish.api
+from ayon_core.pipeline import (
+    PublishValidationError,
+    OptionalPyblishPluginMixin
+)
+
+from ayon_houdini.api import plugin
+
+
+class ValidateDiskSpace(plugin.HoudiniInstancePlugin,
+                        OptionalPyblishPluginMixin):
+    """Validate the estimated output size against the free disk space.
+
+    Warns when the output is estimated to use more than `warn_percentage`
+    of the free space on the output volume and fails above
+    `block_percentage`. The estimate is collected by
+    `CollectDiskUsageEstimate`.
+    """
+
+    order = pyblish.api.ValidatorOrder
+    families = ["pointcache", "vdbcache", "ass", "redshiftproxy", "bgeo",
+                "arnold_rop", "mantra_rop", "karma_rop", "redshift_rop",
+                "vray_rop", "usdrender"]
+    targets = ["local"]
+    label = "Validate Disk Space"
+    optional = True
+
+    warn_percentage = 80
+    block_percentage = 100
+
+    def process(self, instance):
+        if not self.is_active(instance.data):
+            return
+
+        estimate = instance.data.get("diskUsageEstimate")
+        if not estimate or estimate.get("free_space") is None:
+            self.log.debug("No disk usage estimate, skipping.")
+            return
+
+        total = estimate["total_size"]
+        free = estimate["free_space"]
+        percentage = 100.0 * total / free if free else float("inf")
+        message = (
+            "Output is estimated at {:.2f} GB ({} files, from {}), which is "
+            "{:.0f}% of the {:.2f} GB free on {}.".format(
+                total / 1024.0 ** 3, estimate["files"], estimate["source"],
+                percentage, free / 1024.0 ** 3, estimate["volume"]
+            )
+        )
+
+        if percentage > self.block_percentage:
+            raise PublishValidationError(
+                message,
+                title="Not enough disk space",
+                description=(
+                    "## Not enough disk space\n"
+                    "The output of this instance is estimated to not fit "
+                    "on the output volume.\n\n{}\n\n"
+                    "Free up disk space, reduce the frame range or write "
+                    "the output to a different volume.".format(message)
+                )
+            )
+        if percentage > self.warn_percentage:
+            self.log.warning(message)
+        else:
+            self.log.debug(message)
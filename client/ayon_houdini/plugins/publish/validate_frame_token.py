@@ -3,6 +3,7 @@ import hou
 import pyblish.api
 
 from ayon_houdini.api import lib, plugin
+from ayon_houdini.api.file_references import get_file_reference_index
 
 
 class ValidateFrameToken(plugin.HoudiniInstancePlugin):
@@ -45,7 +46,12 @@ class ValidateFrameToken(plugin.HoudiniInstancePlugin):
             return []
 
         output_parm = lib.get_output_parameter(node)
-        unexpanded_str = output_parm.unexpandedString()
+        index = get_file_reference_index(instance.context)
+        reference = index.get(output_parm)
+        if reference is not None and reference.unexpanded is not None:
+            unexpanded_str = reference.unexpanded
+        else:
+            unexpanded_str = output_parm.unexpandedString()
 
         if "$F" not in unexpanded_str:
             cls.log.error("No frame token found in '%s'" % node.path())
@@ -5,6 +5,7 @@ import pyblish.api
 from ayon_core.pipeline import PublishValidationError
 
 from ayon_houdini.api import plugin
+from ayon_houdini.api.validation_cache import cached_validation
 
 
 def cook_in_range(node, start, end):
@@ -35,6 +36,7 @@ class ValidateNoErrors(plugin.HoudiniInstancePlugin):
     order = pyblish.api.ValidatorOrder
     label = "Validate no errors"
 
+    @cached_validation
     def process(self, instance):
 
         if not instance.data.get("instance_node"):
@@ -2,6 +2,7 @@
 import hou
 
 from ayon_houdini.api import plugin
+from ayon_houdini.api.validation_cache import cached_validation
 from ayon_core.pipeline import PublishValidationError
 from ayon_core.pipeline.publish import (
     ValidateContentsOrder,
@@ -28,6 +29,7 @@ class ValidatePrimitiveHierarchyPaths(plugin.HoudiniInstancePlugin):
     label = "Validate Prims Hierarchy Path"
     actions = [AddDefaultPathAction]
 
+    @cached_validation
     def process(self, instance):
         invalid = self.get_invalid(instance)
         if invalid:
@@ -11,6 +11,7 @@ from ayon_core.pipeline.publish import (
 from ayon_houdini.api.action import SelectROPAction
 from ayon_houdini.api.usd import get_schema_type_names
 from ayon_houdini.api import plugin
+from ayon_houdini.api.validation_cache import cached_validation
 
 
 class ValidateLookShaderDefs(plugin.HoudiniInstancePlugin,
@@ -30,6 +31,7 @@ class ValidateLookShaderDefs(plugin.HoudiniInstancePlugin,
         "UsdShadeMaterial"
     ]
 
+    @cached_validation
     def process(self, instance):
         if not self.is_active(instance.data):
             return
@@ -1,11 +1,12 @@
 # -*- coding: utf-8 -*-
-import contextlib
 import hou
 
 import pyblish.api
 from ayon_core.pipeline import PublishXmlValidationError
 
 from ayon_houdini.api import plugin
+from ayon_houdini.api.lib import update_mode_context
+from ayon_houdini.api.validation_cache import cached_validation
 from ayon_houdini.api.action import SelectInvalidAction
 
 
@@ -42,16 +43,6 @@ def group_consecutive_numbers(nums):
         yield _result(start, end)
 
 
-@contextlib.contextmanager
-def update_mode_context(mode):
-    original = hou.updateModeSetting()
-    try:
-        hou.setUpdateMode(mode)
-        yield
-    finally:
-        hou.setUpdateMode(original)
-
-
 def get_geometry_at_frame(sop_node, frame, force=True):
     """Return geometry at frame but force a cooked value."""
     if not hasattr(sop_node, "geometry"):
@@ -85,6 +76,7 @@ class ValidateVDBOutputNode(plugin.HoudiniInstancePlugin):
     label = "Validate Output Node (VDB)"
     actions = [SelectInvalidAction]
 
+    @cached_validation
     def process(self, instance):
         invalid_nodes, message = self.get_invalid_with_message(instance)
         if invalid_nodes:
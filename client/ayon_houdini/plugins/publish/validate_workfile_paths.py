@@ -9,6 +9,7 @@ from ayon_core.pipeline import (
 from ayon_core.pipeline.publish import RepairAction
 
 from ayon_houdini.api import plugin
+from ayon_houdini.api.file_references import get_file_reference_index
 
 
 class ValidateWorkfilePaths(
@@ -27,7 +28,7 @@ class ValidateWorkfilePaths(
     def process(self, instance):
         if not self.is_active(instance.data):
             return
-        invalid = self.get_invalid()
+        invalid = self.get_invalid(instance)
         self.log.debug(
             "Checking node types: {}".format(", ".join(self.node_types)))
         self.log.debug(
@@ -38,8 +39,8 @@ class ValidateWorkfilePaths(
 
         if invalid:
             all_container_vars = set()
-            for param in invalid:
-                value = param.unexpandedString()
+            for reference in invalid:
+                value = reference.unexpanded
                 contained_vars = [
                     var for var in self.prohibited_vars
                     if var in value
@@ -48,7 +49,7 @@ class ValidateWorkfilePaths(
 
                 self.log.error(
                     "Parm {} contains prohibited vars {}: {}".format(
-                        param.path(),
+                        reference.parm.path(),
                         ", ".join(contained_vars),
                         value)
                 )
@@ -61,35 +62,28 @@ class ValidateWorkfilePaths(
             raise PublishValidationError(message, title=self.label)
 
     @classmethod
-    def get_invalid(cls):
-        invalid = []
-        for param, _ in hou.fileReferences():
-            # it might return None for some reason
-            if not param:
-                continue
-            # skip nodes we are not interested in
-            if param.node().type().name() not in cls.node_types:
-                continue
-
-            if param.keyframes():
-                # Calling `.unexpandedString()` below fails if param has
-                # keyframes - so for now we will skip those params. These are
-                # e.g. present in `filecache` nodes.
-                continue
-
-            if any(
-                    v for v in cls.prohibited_vars
-                    if v in param.unexpandedString()):
-                invalid.append(param)
-
-        return invalid
+    def get_invalid(cls, instance):
+        index = get_file_reference_index(instance.context)
+        return index.query(
+            node_types=cls.node_types,
+            variables=cls.prohibited_vars
+        )
 
     @classmethod
     def repair(cls, instance):
-        invalid = cls.get_invalid()
-        for param in invalid:
+        index = get_file_reference_index(instance.context)
+        for reference in cls.get_invalid(instance):
+            # Refresh the entry in case the scene changed since validation
+            reference = index.update(reference.parm)
+            if not reference.unexpanded or not any(
+                    var in reference.unexpanded
+                    for var in cls.prohibited_vars):
+                continue
+
+            param = reference.parm
+            expanded = hou.text.expandString(reference.unexpanded)
             cls.log.info("Processing: {}".format(param.path()))
             cls.log.info("Replacing {} for {}".format(
-                param.unexpandedString(),
-                hou.text.expandString(param.unexpandedString())))
-            param.set(hou.text.expandString(param.unexpandedString()))
+                reference.unexpanded, expanded))
+            param.set(expanded)
+            index.update(param)
@@ -7,6 +7,7 @@ from ayon_houdini.api.workfile_template_builder import (
     HoudiniPlaceholderPlugin
 )
 from ayon_houdini.api.lib import read
+from ayon_houdini.api.pipeline import batch_load
 
 
 class HoudiniPlaceholderLoadPlugin(
@@ -22,10 +23,12 @@ class HoudiniPlaceholderLoadPlugin(
     label = "Houdini Load"
 
     def populate_placeholder(self, placeholder):
-        self.populate_load_placeholder(placeholder)
+        with batch_load("Populate Load Placeholder"):
+            self.populate_load_placeholder(placeholder)
 
     def repopulate_placeholder(self, placeholder):
-        self.populate_load_placeholder(placeholder)
+        with batch_load("Repopulate Load Placeholder"):
+            self.populate_load_placeholder(placeholder)
 
     def get_placeholder_options(self, options=None):
         return self.get_load_plugin_options(options)
@@ -4,6 +4,8 @@ import json
 import hou
 from husd.outputprocessor import OutputProcessor
 
+from ayon_houdini.api.usd import get_remap_paths_mapping
+
 
 _COMPATIBILITY_PLACEHOLDER = object()
 
@@ -54,6 +56,13 @@ class AYONRemapPaths(OutputProcessor):
             args.append(stage_variables)
         super(AYONRemapPaths, self).beginSave(*args)
 
+        # Use the already normalized mapping registered by the publish
+        # extraction if available to avoid the JSON round trip
+        mapping = get_remap_paths_mapping(config_node)
+        if mapping is not None:
+            self._mapping = mapping
+            return
+
         value = config_node.evalParm("ayon_remap_paths_remap_json")
         mapping = json.loads(value)
         assert isinstance(self._mapping, dict)
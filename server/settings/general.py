@@ -23,6 +23,98 @@ class UpdateHoudiniVarcontextModel(BaseSettingsModel):
     )
 
 
+class OutputParameterModel(BaseSettingsModel):
+    """Output parameters of a custom ROP node type.
+
+    Node type is the full node type name with category, e.g.
+    `Driver/studio::my_rop::1.0`. The version can be omitted to match all
+    versions of the node type.
+    """
+    _layout = "compact"
+    node_type: str = SettingsField("", title="Node Type")
+    output_parm: str = SettingsField("", title="Output Parm")
+    export_parm: str = SettingsField("", title="Export Parm")
+
+
+class LocalCacheModel(BaseSettingsModel):
+    """Local copies of published files used by loaders.
+
+    Loaders that have the local cache enabled copy the published files into
+    this folder, e.g. on a local SSD, and load them from there.
+    """
+    root: str = SettingsField(
+        "",
+        title="Cache Root",
+        description=(
+            "Folder of the local cache, defaults to a folder in the temp "
+            "directory. Environment variables are expanded."
+        )
+    )
+    max_size_gb: float = SettingsField(
+        20.0,
+        gt=0,
+        title="Maximum Size (GB)",
+        description=(
+            "The least recently used files are removed when the cache "
+            "exceeds this size."
+        )
+    )
+    fill_threads: int = SettingsField(
+        4,
+        ge=1,
+        title="Fill Threads",
+        description="Threads copying files into the cache in the background."
+    )
+
+
+class LocalSchedulerModel(BaseSettingsModel):
+    """Slots of the local PDG scheduler.
+
+    The total slots are the smaller of the usable cores and the number of
+    work items that fit in the available memory.
+    """
+    enabled: bool = SettingsField(
+        True,
+        title="Plan Slots from Cores and Memory"
+    )
+    memory_per_item_gb: float = SettingsField(
+        4.0,
+        ge=0,
+        title="Memory per Work Item (GB)",
+        description=(
+            "Estimated peak memory of a single work item, 0 to only plan "
+            "by cores."
+        )
+    )
+    reserved_memory_gb: float = SettingsField(
+        4.0,
+        ge=0,
+        title="Reserved Memory (GB)",
+        description="Memory kept free for Houdini and the system."
+    )
+    reserved_cores: int = SettingsField(
+        1,
+        ge=0,
+        title="Reserved Cores",
+        description="Cores kept free for Houdini and the system."
+    )
+    max_slots: int = SettingsField(
+        0,
+        ge=0,
+        title="Maximum Slots",
+        description="Upper limit of the total slots, 0 for no limit."
+    )
+    threads_per_item: int = SettingsField(
+        0,
+        ge=0,
+        title="Threads per Work Item",
+        description=(
+            "Houdini threads of each work item, 0 to divide the usable "
+            "cores among the slots."
+        )
+    )
+
+
 class GeneralSettingsModel(BaseSettingsModel):
     add_self_publish_button: bool = SettingsField(
         False,
@@ -32,6 +124,22 @@ class GeneralSettingsModel(BaseSettingsModel):
         default_factory=UpdateHoudiniVarcontextModel,
         title="Update Houdini Vars on context change"
     )
+    output_parameters: list[OutputParameterModel] = SettingsField(
+        default_factory=list,
+        title="Custom ROP Output Parameters",
+        description=(
+            "Output and export parameters of custom ROP node types "
+            "to use for publishing."
+        )
+    )
+    local_cache: LocalCacheModel = SettingsField(
+        default_factory=LocalCacheModel,
+        title="Local Cache"
+    )
+    local_scheduler: LocalSchedulerModel = SettingsField(
+        default_factory=LocalSchedulerModel,
+        title="Local PDG Scheduler"
+    )
 
 
 DEFAULT_GENERAL_SETTINGS = {
@@ -45,5 +153,19 @@ DEFAULT_GENERAL_SETTINGS = {
                 "is_directory": True
             }
         ]
+    },
+    "output_parameters": [],
+    "local_cache": {
+        "root": "",
+        "max_size_gb": 20.0,
+        "fill_threads": 4
+    },
+    "local_scheduler": {
+        "enabled": True,
+        "memory_per_item_gb": 4.0,
+        "reserved_memory_gb": 4.0,
+        "reserved_cores": 1,
+        "max_slots": 0,
+        "threads_per_item": 0
     }
 }
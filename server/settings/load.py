@@ -14,7 +14,33 @@ class LoadUseAYONEntityURIModel(BaseSettingsModel):
     )
 
 
+class LoadUseLocalCacheModel(BaseSettingsModel):
+    use_local_cache: bool = SettingsField(
+        False,
+        title="Use Local Cache",
+        description=(
+            "Copy the published files to the local cache and load them from "
+            "there. The cache is configured in General > Local Cache."
+        )
+    )
+
+
 class LoadPluginsModel(BaseSettingsModel):
+    HdaLoader: LoadUseLocalCacheModel = SettingsField(
+        default_factory=LoadUseLocalCacheModel,
+        title="HDA Loader")
+    AbcLoader: LoadUseLocalCacheModel = SettingsField(
+        default_factory=LoadUseLocalCacheModel,
+        title="Alembic Loader")
+    BgeoLoader: LoadUseLocalCacheModel = SettingsField(
+        default_factory=LoadUseLocalCacheModel,
+        title="Bgeo Loader")
+    VdbLoader: LoadUseLocalCacheModel = SettingsField(
+        default_factory=LoadUseLocalCacheModel,
+        title="VDB Loader")
+    RedshiftProxyLoader: LoadUseLocalCacheModel = SettingsField(
+        default_factory=LoadUseLocalCacheModel,
+        title="Redshift Proxy Loader")
     LOPLoadAssetLoader: LoadUseAYONEntityURIModel = SettingsField(
         default_factory=LoadUseAYONEntityURIModel,
         title="LOP Load Asset")
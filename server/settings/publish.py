@@ -23,6 +23,24 @@ class CollectChunkSizeModel(BaseSettingsModel):
         title="Frames Per Task")
 
 
+class CollectAdaptiveChunkSizeModel(BaseSettingsModel):
+    """Choose the chunk size of farm caches from locally cooked frames.
+
+    Overrides 'Frame Per Task' of the instance when active.
+    """
+    enabled: bool = SettingsField(title="Enabled")
+    optional: bool = SettingsField(title="Optional")
+    active: bool = SettingsField(title="Active")
+    sample_frames: int = SettingsField(
+        3, ge=1, title="Sample Frames")
+    target_task_minutes: float = SettingsField(
+        10.0, gt=0, title="Target Task Duration (minutes)")
+    min_task_minutes: float = SettingsField(
+        1.0, ge=0, title="Minimum Task Duration (minutes)")
+    farm_slots: int = SettingsField(
+        20, ge=1, title="Available Farm Slots")
+
+
 class AOVFilterSubmodel(BaseSettingsModel):
     """You should use the same host name you are using for Houdini."""
     host_name: str = SettingsField("", title="Houdini Host name")
@@ -109,6 +127,34 @@ class ValidateWorkfilePathsModel(BaseSettingsModel):
     )
 
 
+class CollectDiskUsageEstimateModel(BaseSettingsModel):
+    enabled: bool = SettingsField(title="Enabled")
+    sample_output: bool = SettingsField(
+        title="Sample Output SOP",
+        description=(
+            "Cook the first frame of the output SOP to measure the output "
+            "size when there are no existing output files and no "
+            "published version. Only used for uncompressed .bgeo output."
+        )
+    )
+
+
+class ValidateDiskSpaceModel(BaseSettingsModel):
+    enabled: bool = SettingsField(title="Enabled")
+    optional: bool = SettingsField(title="Optional")
+    active: bool = SettingsField(title="Active")
+    warn_percentage: int = SettingsField(
+        80,
+        ge=0,
+        title="Warn Above (% of free space)"
+    )
+    block_percentage: int = SettingsField(
+        100,
+        ge=0,
+        title="Fail Above (% of free space)"
+    )
+
+
 class BasicEnabledStatesModel(BaseSettingsModel):
     enabled: bool = SettingsField(title="Enabled")
     optional: bool = SettingsField(title="Optional")
@@ -126,6 +172,173 @@ class ExtractUsdModel(BaseSettingsModel):
     )
 
 
+class ExtractPublishProfileModel(BaseSettingsModel):
+    """Profile the Houdini publish plugins.
+
+    Records wall time, CPU time, peak memory increase and node cooks of
+    each Houdini publish plugin. The slowest plugins are reported to the
+    publish log and the full profile is published as JSON representation
+    of the workfile product.
+    """
+    profile_plugins: bool = SettingsField(
+        False,
+        title="Profile Publish Plugins",
+        description=(
+            "Can also be enabled per session with the "
+            "AYON_HOUDINI_PUBLISH_PROFILE environment variable."
+        )
+    )
+    report_limit: int = SettingsField(
+        20,
+        ge=0,
+        title="Report Slowest Plugins",
+        description="Number of plugins to log, 0 logs all plugins."
+    )
+
+
+class ExtractPerformanceCaptureModel(BaseSettingsModel):
+    """Capture ROP renders during extraction with the performance monitor.
+
+    The Houdini performance monitor profile and a summary with the slowest
+    nodes and the extract time and memory per frame range are published as
+    'hperf' and 'perfstats' representations of the product.
+    """
+    enabled: bool = SettingsField(
+        False,
+        title="Enabled",
+        description=(
+            "Can also be enabled per session with the "
+            "AYON_HOUDINI_PERFMON environment variable."
+        )
+    )
+    top_nodes: int = SettingsField(
+        20,
+        ge=1,
+        title="Slowest Nodes in Summary"
+    )
+    families: list[str] = SettingsField(
+        default_factory=list,
+        enum_resolver=product_types_enum,
+        conditionalEnum=True,
+        title="Product Types",
+        description="Capture only these product types, all when empty."
+    )
+
+
+class ExtractResourceTelemetryModel(BaseSettingsModel):
+    """Sample CPU, memory and disk IO of Houdini during ROP extraction.
+
+    A summary with the peak memory, CPU usage and IO throughput of the
+    Houdini process and its child processes is stored on the instance.
+    Only available on Linux.
+    """
+    enabled: bool = SettingsField(
+        False,
+        title="Enabled",
+        description=(
+            "Can also be enabled per session with the "
+            "AYON_HOUDINI_TELEMETRY environment variable."
+        )
+    )
+    interval: float = SettingsField(
+        1.0,
+        gt=0,
+        title="Sample Interval (seconds)"
+    )
+
+
+class ExtractChecksumsModel(BaseSettingsModel):
+    """Hash all representation files into a checksum manifest.
+
+    The manifest is stored in the representation data to verify the
+    integrity of published files and to detect unchanged republishes.
+    """
+    enabled: bool = SettingsField(False, title="Enabled")
+    families: list[str] = SettingsField(
+        default_factory=list,
+        enum_resolver=product_types_enum,
+        conditionalEnum=True,
+        title="Product Types"
+    )
+    threads: int = SettingsField(
+        8,
+        ge=1,
+        title="Hashing Threads"
+    )
+    skip_unchanged: bool = SettingsField(
+        False,
+        title="Skip Unchanged Publishes",
+        description=(
+            "Do not integrate an instance when all its files are identical "
+            "to the last published version."
+        )
+    )
+
+
+def texture_extension_enum():
+    return [
+        {"value": ".tx", "label": "TX (.tx)"},
+        {"value": ".rat", "label": "RAT (.rat)"},
+    ]
+
+
+class ExtractUsdLookTexturesModel(BaseSettingsModel):
+    """Convert look textures to mipmapped render textures on publish.
+
+    The converted textures are published next to the source textures so
+    renderers do not convert them at render time. Conversions are cached
+    by the content of the source texture.
+    """
+    enabled: bool = SettingsField(title="Enabled")
+    optional: bool = SettingsField(title="Optional")
+    active: bool = SettingsField(title="Active")
+    converters: list[str] = SettingsField(
+        default_factory=list,
+        title="Converters",
+        description=(
+            "Converters to use in order of preference, 'imaketx' and "
+            "'maketx' are supported."
+        )
+    )
+    extension: str = SettingsField(
+        ".tx",
+        enum_resolver=texture_extension_enum,
+        title="Extension"
+    )
+    workers: int = SettingsField(
+        0,
+        ge=0,
+        title="Converter Processes",
+        description="Concurrent conversions, 0 uses half of the cores."
+    )
+    cache_root: str = SettingsField(
+        "",
+        title="Cache Root",
+        description=(
+            "Folder of the converted textures, defaults to a folder in the "
+            "temp directory. Environment variables are expanded."
+        )
+    )
+
+
+class ExtractRenderScanlineModel(BaseSettingsModel):
+    """Publish scanline copies of tiled EXR renders.
+
+    Review tools like Nuke and RV crash on tiled EXRs. The copies are
+    written to a `scanline` folder, the tiled frames are kept. Frames that
+    are already scanline are skipped.
+    """
+    enabled: bool = SettingsField(title="Enabled")
+    optional: bool = SettingsField(title="Optional")
+    active: bool = SettingsField(title="Active")
+    workers: int = SettingsField(
+        0,
+        ge=0,
+        title="Converter Processes",
+        description="Concurrent conversions, 0 uses half of the cores."
+    )
+
+
 class PublishPluginsModel(BaseSettingsModel):
     CollectAssetHandles: CollectAssetHandlesModel = SettingsField(
         default_factory=CollectAssetHandlesModel,
@@ -136,6 +349,14 @@ class PublishPluginsModel(BaseSettingsModel):
         default_factory=CollectChunkSizeModel,
         title="Collect Chunk Size"
     )
+    CollectAdaptiveChunkSize: CollectAdaptiveChunkSizeModel = SettingsField(
+        default_factory=CollectAdaptiveChunkSizeModel,
+        title="Collect Adaptive Chunk Size"
+    )
+    CollectDiskUsageEstimate: CollectDiskUsageEstimateModel = SettingsField(
+        default_factory=CollectDiskUsageEstimateModel,
+        title="Collect Disk Usage Estimate"
+    )
     CollectFilesForCleaningUp: CollectFilesForCleaningUpModel = SettingsField(
         default_factory=CollectFilesForCleaningUpModel,
         title="Collect Files For Cleaning Up."
@@ -164,6 +385,9 @@ class PublishPluginsModel(BaseSettingsModel):
     ValidateUnrealStaticMeshName: BasicEnabledStatesModel = SettingsField(
         default_factory=BasicEnabledStatesModel,
         title="Validate Unreal Static Mesh Name")
+    ValidateDiskSpace: ValidateDiskSpaceModel = SettingsField(
+        default_factory=ValidateDiskSpaceModel,
+        title="Validate Disk Space")
     ValidateWorkfilePaths: ValidateWorkfilePathsModel = SettingsField(
         default_factory=ValidateWorkfilePathsModel,
         title="Validate workfile paths settings")
@@ -179,6 +403,30 @@ class PublishPluginsModel(BaseSettingsModel):
         default_factory=ExtractUsdModel,
         title="Extract USD"
     )
+    ExtractPerformanceCapture: ExtractPerformanceCaptureModel = SettingsField(
+        default_factory=ExtractPerformanceCaptureModel,
+        title="Extract Performance Capture"
+    )
+    ExtractResourceTelemetry: ExtractResourceTelemetryModel = SettingsField(
+        default_factory=ExtractResourceTelemetryModel,
+        title="Extract Resource Telemetry"
+    )
+    ExtractUsdLookTextures: ExtractUsdLookTexturesModel = SettingsField(
+        default_factory=ExtractUsdLookTexturesModel,
+        title="Extract Look Render Textures"
+    )
+    ExtractRenderScanline: ExtractRenderScanlineModel = SettingsField(
+        default_factory=ExtractRenderScanlineModel,
+        title="Extract Scanline EXR"
+    )
+    ExtractChecksums: ExtractChecksumsModel = SettingsField(
+        default_factory=ExtractChecksumsModel,
+        title="Extract Checksums"
+    )
+    ExtractPublishProfile: ExtractPublishProfileModel = SettingsField(
+        default_factory=ExtractPublishProfileModel,
+        title="Extract Publish Profile"
+    )
 
 
 DEFAULT_HOUDINI_PUBLISH_SETTINGS = {
@@ -190,6 +438,19 @@ DEFAULT_HOUDINI_PUBLISH_SETTINGS = {
         "optional": True,
         "chunk_size": 999999
     },
+    "CollectAdaptiveChunkSize": {
+        "enabled": True,
+        "optional": True,
+        "active": False,
+        "sample_frames": 3,
+        "target_task_minutes": 10.0,
+        "min_task_minutes": 1.0,
+        "farm_slots": 20
+    },
+    "CollectDiskUsageEstimate": {
+        "enabled": True,
+        "sample_output": False
+    },
     "CollectFilesForCleaningUp": {
         "enabled": False,
         "optional": True,
@@ -237,6 +498,13 @@ DEFAULT_HOUDINI_PUBLISH_SETTINGS = {
         "optional": True,
         "active": True
     },
+    "ValidateDiskSpace": {
+        "enabled": True,
+        "optional": True,
+        "active": True,
+        "warn_percentage": 80,
+        "block_percentage": 100
+    },
     "ValidateWorkfilePaths": {
         "enabled": True,
         "optional": True,
@@ -261,5 +529,48 @@ DEFAULT_HOUDINI_PUBLISH_SETTINGS = {
     },
     "ExtractUSD": {
         "use_ayon_entity_uri": False
+    },
+    "ExtractPerformanceCapture": {
+        "enabled": False,
+        "top_nodes": 20,
+        "families": []
+    },
+    "ExtractResourceTelemetry": {
+        "enabled": False,
+        "interval": 1.0
+    },
+    "ExtractUsdLookTextures": {
+        "enabled": False,
+        "optional": True,
+        "active": True,
+        "converters": [
+            "imaketx",
+            "maketx"
+        ],
+        "extension": ".tx",
+        "workers": 0,
+        "cache_root": ""
+    },
+    "ExtractRenderScanline": {
+        "enabled": False,
+        "optional": True,
+        "active": True,
+        "workers": 0
+    },
+    "ExtractChecksums": {
+        "enabled": False,
+        "families": [
+            "pointcache",
+            "vdbcache",
+            "redshiftproxy",
+            "ass",
+            "usd"
+        ],
+        "threads": 8,
+        "skip_unchanged": False
+    },
+    "ExtractPublishProfile": {
+        "profile_plugins": False,
+        "report_limit": 20
     }
 }